@@ -1,6 +1,10 @@
 CREATE INDEX events_sequence_number_index
     ON events (sequence_number);
-CREATE INDEX events_category_stream_position_index
+CREATE UNIQUE INDEX events_category_stream_position_index
     ON events (category, stream, position);
 CREATE INDEX events_category_sequence_number_index
     ON events (category, sequence_number);
+CREATE INDEX events_transaction_id_sequence_number_index
+    ON events (transaction_id, sequence_number);
+CREATE INDEX events_category_transaction_id_sequence_number_index
+    ON events (category, transaction_id, sequence_number);
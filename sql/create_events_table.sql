@@ -8,6 +8,7 @@ CREATE TABLE events (
     sequence_number BIGSERIAL NOT NULL,
     observed_at TIMESTAMP WITH TIME ZONE NOT NULL,
     occurred_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    transaction_id XID8 NOT NULL DEFAULT pg_current_xact_id(),
     PRIMARY KEY (id),
     UNIQUE (id)
 );
@@ -0,0 +1,2 @@
+CREATE INDEX projection_snapshots_saved_at_index
+    ON projection_snapshots (saved_at);
@@ -0,0 +1,11 @@
+CREATE TABLE projection_snapshots (
+    name TEXT NOT NULL,
+    source JSONB NOT NULL,
+    state JSONB NOT NULL,
+    metadata JSONB NOT NULL,
+    position BIGINT NOT NULL,
+    sequence_number BIGINT NOT NULL,
+    version BIGINT NOT NULL,
+    saved_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (name, source)
+);
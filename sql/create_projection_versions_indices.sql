@@ -0,0 +1,2 @@
+CREATE INDEX projection_versions_rebuilt_at_index
+    ON projection_versions (rebuilt_at DESC);
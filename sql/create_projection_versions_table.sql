@@ -0,0 +1,6 @@
+CREATE TABLE projection_versions (
+    name TEXT NOT NULL,
+    version BIGINT NOT NULL,
+    rebuilt_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (name)
+);
@@ -1,7 +1,8 @@
-from . import postgres
+from . import postgres, sqlite
 from .converter import TypeRegistryConverter
 
 __all__ = [
     "TypeRegistryConverter",
     "postgres",
+    "sqlite",
 ]
@@ -0,0 +1,11 @@
+from .connection import Connection, transaction
+from .settings import ConnectionSettings, TableSettings
+from .types import ConnectionSource
+
+__all__ = [
+    "Connection",
+    "ConnectionSettings",
+    "ConnectionSource",
+    "TableSettings",
+    "transaction",
+]
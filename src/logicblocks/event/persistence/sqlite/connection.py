@@ -0,0 +1,60 @@
+import asyncio
+import sqlite3
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from .settings import ConnectionSettings
+
+
+@contextmanager
+def transaction(
+    connection: sqlite3.Connection,
+) -> Iterator[sqlite3.Connection]:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class Connection:
+    def __init__(self, settings: ConnectionSettings):
+        self.settings = settings
+        self._connection: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite"
+        )
+
+    async def run[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, function)
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._disconnect
+        )
+        self._executor.shutdown(wait=False)
+
+    def _call[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        if self._connection is None:
+            self._connection = self._connect()
+        return function(self._connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.settings.database,
+            timeout=self.settings.busy_timeout.total_seconds(),
+            isolation_level=None,
+            cached_statements=self.settings.statement_cache_size,
+        )
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _disconnect(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
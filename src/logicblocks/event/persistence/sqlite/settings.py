@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class TableSettings:
+    table_name: str
+
+
+@dataclass(frozen=True)
+class ConnectionSettings:
+    database: str
+    busy_timeout: timedelta
+    statement_cache_size: int
+
+    def __init__(
+        self,
+        *,
+        database: str,
+        busy_timeout: timedelta = timedelta(seconds=5),
+        statement_cache_size: int = 256,
+    ):
+        object.__setattr__(self, "database", database)
+        object.__setattr__(self, "busy_timeout", busy_timeout)
+        object.__setattr__(self, "statement_cache_size", statement_cache_size)
@@ -0,0 +1,4 @@
+from .connection import Connection
+from .settings import ConnectionSettings
+
+type ConnectionSource = ConnectionSettings | Connection
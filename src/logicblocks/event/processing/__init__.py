@@ -17,14 +17,19 @@ from .broker import (
     make_postgres_event_broker,
 )
 from .consumers import (
+    BatchEventProcessor,
+    BatchingProjectionEventProcessor,
     EventConsumer,
     EventConsumerState,
     EventConsumerStateStore,
     EventCount,
     EventProcessor,
     EventSourceConsumer,
+    EventSourceConsumptionMetrics,
     EventSubscriptionConsumer,
     ProjectionEventProcessor,
+    ProjectionRebuilder,
+    ProjectionRebuildResult,
     make_subscriber,
 )
 from .locks import InMemoryLockManager, Lock, LockManager, PostgresLockManager
@@ -44,6 +49,7 @@ from .services import (
     ExitErrorHandler,
     ExitErrorHandlerDecision,
     IsolationMode,
+    NotificationAwareService,
     PollingService,
     RaiseErrorHandler,
     RaiseErrorHandlerDecision,
@@ -57,6 +63,8 @@ from .services import (
 )
 
 __all__ = [
+    "BatchEventProcessor",
+    "BatchingProjectionEventProcessor",
     "ContinueErrorHandler",
     "ContinueErrorHandlerDecision",
     "DistributedEventBroker",
@@ -73,6 +81,7 @@ __all__ = [
     "EventCount",
     "EventProcessor",
     "EventSourceConsumer",
+    "EventSourceConsumptionMetrics",
     "EventBrokerStorageType",
     "InMemoryEventBrokerStorageTypeType",
     "PostgresEventBrokerStorageTypeType",
@@ -84,6 +93,7 @@ __all__ = [
     "ExitErrorHandlerDecision",
     "InMemoryLockManager",
     "IsolationMode",
+    "NotificationAwareService",
     "Lock",
     "LockManager",
     "PollingService",
@@ -91,6 +101,8 @@ __all__ = [
     "Process",
     "ProcessStatus",
     "ProjectionEventProcessor",
+    "ProjectionRebuildResult",
+    "ProjectionRebuilder",
     "RaiseErrorHandler",
     "RaiseErrorHandlerDecision",
     "RetryErrorHandler",
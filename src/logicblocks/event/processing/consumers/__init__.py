@@ -1,17 +1,30 @@
-from .projection import ProjectionEventProcessor
+from .projection import (
+    BatchingProjectionEventProcessor,
+    ProjectionEventProcessor,
+)
+from .rebuild import ProjectionRebuilder, ProjectionRebuildResult
 from .source import EventSourceConsumer
 from .state import EventConsumerState, EventConsumerStateStore, EventCount
-from .subscription import EventSubscriptionConsumer, make_subscriber
-from .types import EventConsumer, EventProcessor
+from .subscription import (
+    EventSourceConsumptionMetrics,
+    EventSubscriptionConsumer,
+    make_subscriber,
+)
+from .types import BatchEventProcessor, EventConsumer, EventProcessor
 
 __all__ = [
+    "BatchEventProcessor",
+    "BatchingProjectionEventProcessor",
     "EventConsumer",
     "EventConsumerState",
     "EventConsumerStateStore",
     "EventCount",
     "EventProcessor",
     "EventSourceConsumer",
+    "EventSourceConsumptionMetrics",
     "EventSubscriptionConsumer",
     "ProjectionEventProcessor",
+    "ProjectionRebuildResult",
+    "ProjectionRebuilder",
     "make_subscriber",
 ]
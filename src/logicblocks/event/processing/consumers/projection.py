@@ -1,14 +1,19 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import groupby
+
 from logicblocks.event.projection import ProjectionStore, Projector
 from logicblocks.event.sources import InMemoryEventSource
 from logicblocks.event.types import (
     JsonPersistable,
     JsonValue,
     JsonValueType,
+    Projection,
     StoredEvent,
     StreamIdentifier,
 )
 
-from .types import EventProcessor
+from .types import BatchEventProcessor, EventProcessor
 
 
 class ProjectionEventProcessor[
@@ -48,3 +53,83 @@ class ProjectionEventProcessor[
             source=source,
         )
         await self._projection_store.save(projection=updated_projection)
+
+
+class BatchingProjectionEventProcessor[
+    State: JsonPersistable = JsonValue,
+    Metadata: JsonPersistable = JsonValue,
+](BatchEventProcessor):
+    def __init__(
+        self,
+        projector: Projector[StreamIdentifier, State, Metadata],
+        projection_store: ProjectionStore,
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+        cache_size: int = 1000,
+    ):
+        self._projector = projector
+        self._projection_store = projection_store
+        self._state_type = state_type
+        self._metadata_type = metadata_type
+        self._cache_size = cache_size
+        self._cache: OrderedDict[
+            StreamIdentifier, Projection[State, Metadata] | None
+        ] = OrderedDict()
+
+    async def process_events(
+        self, events: Sequence[StoredEvent[str, JsonValue]]
+    ) -> None:
+        updated: dict[StreamIdentifier, Projection[State, Metadata]] = {}
+
+        try:
+            for identifier, stream_events in groupby(
+                events,
+                key=lambda event: StreamIdentifier(
+                    category=event.category, stream=event.stream
+                ),
+            ):
+                current_projection = await self._current(identifier)
+                source = InMemoryEventSource[StreamIdentifier](
+                    events=list(stream_events), identifier=identifier
+                )
+                updated_projection = await self._projector.project(
+                    state=current_projection.state
+                    if current_projection
+                    else None,
+                    metadata=current_projection.metadata
+                    if current_projection
+                    else None,
+                    source=source,
+                )
+                self._cache[identifier] = updated_projection
+                updated[identifier] = updated_projection
+
+            await self._projection_store.save_many(
+                projections=list(updated.values())
+            )
+        except BaseException:
+            for identifier in updated:
+                self._cache.pop(identifier, None)
+            raise
+
+        self._trim()
+
+    async def _current(
+        self, identifier: StreamIdentifier
+    ) -> Projection[State, Metadata] | None:
+        if identifier in self._cache:
+            self._cache.move_to_end(identifier)
+            return self._cache[identifier]
+
+        projection = await self._projection_store.locate(
+            source=identifier,
+            name=self._projector.projection_name,
+            state_type=self._state_type,
+            metadata_type=self._metadata_type,
+        )
+        self._cache[identifier] = projection
+        return projection
+
+    def _trim(self) -> None:
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
@@ -0,0 +1,303 @@
+import asyncio
+import os
+import pickle
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import batched
+
+from structlog.typing import FilteringBoundLogger
+
+from logicblocks.event.projection import (
+    ProjectionRebuild,
+    ProjectionStorageAdapter,
+    ProjectionStore,
+    Projector,
+)
+from logicblocks.event.store import EventSource, constraints
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    JsonPersistable,
+    JsonValue,
+    Projection,
+    StoredEvent,
+    StreamIdentifier,
+    str_serialisation_fallback,
+)
+
+from .logger import default_logger
+from .state import EventConsumerStateStore
+
+type StreamFold[State, Metadata] = tuple[
+    StreamIdentifier,
+    State | None,
+    Metadata | None,
+    Sequence[StoredEvent[str, JsonValue]],
+]
+type StreamFoldResult[State, Metadata] = tuple[
+    StreamIdentifier, State, Metadata
+]
+
+
+def log_event_name(event: str) -> str:
+    return f"event.consumer.rebuild.{event}"
+
+
+def fold_streams[State, Metadata](
+    projector: Projector[StreamIdentifier, State, Metadata],
+    streams: Sequence[StreamFold[State, Metadata]],
+) -> Sequence[StreamFoldResult[State, Metadata]]:
+    results: list[StreamFoldResult[State, Metadata]] = []
+    for identifier, state, metadata, events in streams:
+        state, metadata = projector.fold(
+            events=events, state=state, metadata=metadata
+        )
+        results.append((identifier, state, metadata))
+    return results
+
+
+def shard_for(identifier: StreamIdentifier, shards: int) -> int:
+    return zlib.crc32(identifier.stream.encode()) % shards
+
+
+@dataclass(frozen=True)
+class ProjectionRebuildResult:
+    events: int
+    projections: int
+    last_sequence_number: int | None
+    rebuilt: bool = True
+
+
+class ProjectionRebuilder[
+    State: JsonPersistable = JsonValue,
+    Metadata: JsonPersistable = JsonValue,
+]:
+    def __init__(
+        self,
+        *,
+        source: EventSource[CategoryIdentifier],
+        projector: Projector[StreamIdentifier, State, Metadata],
+        projection_store: ProjectionStore | ProjectionStorageAdapter,
+        state_store: EventConsumerStateStore,
+        executor: Executor | None = None,
+        shards: int | None = None,
+        batch_size: int = 10000,
+        save_batch_size: int = 1000,
+        logger: FilteringBoundLogger = default_logger,
+    ):
+        self._source = source
+        self._projector = projector
+        self._projection_store = projection_store
+        self._state_store = state_store
+        self._executor = executor
+        self._shards = shards if shards is not None else os.cpu_count() or 1
+        self._batch_size = batch_size
+        self._save_batch_size = save_batch_size
+        self._logger = logger
+
+    async def rebuild(self) -> ProjectionRebuildResult:
+        await self._logger.ainfo(
+            log_event_name("starting"),
+            source=self._source.identifier.serialise(
+                fallback=str_serialisation_fallback
+            ),
+            projection_name=self._projector.projection_name,
+            shards=self._shards,
+        )
+
+        # note: adapters that track versions skip the rebuild when the
+        #       stored version matches the projector's, and may rebuild into
+        #       a shadow that is swapped in on exit. The checkpoint is
+        #       recorded after the swap so it never runs ahead of the live
+        #       projections.
+        name = self._projector.projection_name
+        stored_version = await self._projection_store.version(name=name)
+        if stored_version == self._projector.version:
+            await self._logger.ainfo(
+                log_event_name("skipped"),
+                source=self._source.identifier.serialise(
+                    fallback=str_serialisation_fallback
+                ),
+                projection_name=name,
+                version=stored_version,
+            )
+            return ProjectionRebuildResult(
+                events=0,
+                projections=0,
+                last_sequence_number=None,
+                rebuilt=False,
+            )
+
+        states: dict[StreamIdentifier, tuple[State, Metadata]] = {}
+        with self._executor_context() as executor:
+            async with self._projection_store.rebuild(
+                name=name, version=self._projector.version
+            ) as rebuild:
+                changed, last_event, event_count = await self._project(
+                    executor, states, after=None
+                )
+                await self._save(rebuild, states, changed)
+
+                # note: events published while the rebuild ran are folded in
+                #       inside the swap, which holds off live saves to the
+                #       name, so the swap never discards their effect.
+                async with rebuild.swap():
+                    changed, last_event, caught_up = await self._project(
+                        executor, states, after=last_event
+                    )
+                    await self._save(rebuild, states, changed)
+                    event_count += caught_up
+
+        if last_event is not None:
+            await self._state_store.record_processed(
+                last_event, count=event_count
+            )
+            await self._state_store.save()
+
+        result = ProjectionRebuildResult(
+            events=event_count,
+            projections=len(states),
+            last_sequence_number=(
+                last_event.sequence_number if last_event is not None else None
+            ),
+        )
+
+        await self._logger.ainfo(
+            log_event_name("completed"),
+            source=self._source.identifier.serialise(
+                fallback=str_serialisation_fallback
+            ),
+            projection_name=self._projector.projection_name,
+            events=result.events,
+            projections=result.projections,
+            last_sequence_number=result.last_sequence_number,
+        )
+
+        return result
+
+    async def _project(
+        self,
+        executor: Executor | None,
+        states: dict[StreamIdentifier, tuple[State, Metadata]],
+        *,
+        after: StoredEvent[str, JsonValue] | None,
+    ) -> tuple[set[StreamIdentifier], StoredEvent[str, JsonValue] | None, int]:
+        changed: set[StreamIdentifier] = set()
+        last_event = after
+        event_count = 0
+
+        events = self._source.iterate(
+            constraints=(
+                {constraints.sequence_number_after(after.sequence_number)}
+                if after is not None
+                else frozenset()
+            )
+        )
+        batch: list[StoredEvent[str, JsonValue]] = []
+        async for event in events:
+            batch.append(event)
+            last_event = event
+            event_count += 1
+            if len(batch) >= self._batch_size:
+                changed |= await self._fold(executor, batch, states)
+                batch = []
+        if batch:
+            changed |= await self._fold(executor, batch, states)
+
+        return changed, last_event, event_count
+
+    async def _save(
+        self,
+        target: ProjectionRebuild,
+        states: Mapping[StreamIdentifier, tuple[State, Metadata]],
+        identifiers: Iterable[StreamIdentifier],
+    ) -> None:
+        projections = (
+            Projection[State, Metadata](
+                id=self._projector.id_factory(state, identifier),
+                name=self._projector.projection_name,
+                source=identifier,
+                state=state,
+                metadata=metadata,
+            )
+            for identifier in identifiers
+            for state, metadata in [states[identifier]]
+        )
+        for chunk in batched(projections, self._save_batch_size):
+            await target.save_many(projections=chunk)
+
+    @contextmanager
+    def _executor_context(self) -> Iterator[Executor | None]:
+        if self._executor is not None:
+            yield self._executor
+            return
+
+        # note: the default process pool sends the projector to its workers
+        #       by pickling it, so projectors that cannot be pickled, such as
+        #       those holding clients or closures, are folded in-process.
+        try:
+            pickle.dumps(self._projector)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            self._logger.warning(
+                log_event_name("folding-in-process"),
+                projection_name=self._projector.projection_name,
+                reason=str(error),
+            )
+            yield None
+            return
+
+        with ProcessPoolExecutor(max_workers=self._shards) as executor:
+            yield executor
+
+    async def _fold(
+        self,
+        executor: Executor | None,
+        events: Sequence[StoredEvent[str, JsonValue]],
+        states: dict[StreamIdentifier, tuple[State, Metadata]],
+    ) -> set[StreamIdentifier]:
+        streams: dict[StreamIdentifier, list[StoredEvent[str, JsonValue]]] = {}
+        for event in events:
+            streams.setdefault(
+                StreamIdentifier(category=event.category, stream=event.stream),
+                [],
+            ).append(event)
+
+        shards: list[list[StreamFold[State, Metadata]]] = [
+            [] for _ in range(self._shards)
+        ]
+        for identifier, stream_events in streams.items():
+            current = states.get(identifier, None)
+            shards[shard_for(identifier, self._shards)].append(
+                (
+                    identifier,
+                    current[0] if current is not None else None,
+                    current[1] if current is not None else None,
+                    stream_events,
+                )
+            )
+
+        if executor is None:
+            results = [
+                fold_streams(self._projector, shard)
+                for shard in shards
+                if shard
+            ]
+        else:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, fold_streams, self._projector, shard
+                    )
+                    for shard in shards
+                    if shard
+                )
+            )
+
+        for shard_results in results:
+            for identifier, state, metadata in shard_results:
+                states[identifier] = (state, metadata)
+
+        return set(streams)
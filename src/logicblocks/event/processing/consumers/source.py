@@ -1,22 +1,59 @@
 import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterable, Sequence
+from datetime import timedelta
 
 from structlog.typing import FilteringBoundLogger
 
-from logicblocks.event.store import EventSource, constraints
+from logicblocks.event.store import (
+    EventHeadTracker,
+    EventNotification,
+    EventSource,
+    constraints,
+)
 from logicblocks.event.types import (
     EventSourceIdentifier,
+    JsonValue,
+    StoredEvent,
+    StreamIdentifier,
     str_serialisation_fallback,
 )
 
 from .logger import default_logger
 from .state import EventConsumerStateStore
-from .types import EventConsumer, EventProcessor
+from .types import BatchEventProcessor, EventConsumer, EventProcessor
 
 
 def log_event_name(event: str) -> str:
     return f"event.consumer.source.{event}"
 
 
+class ProcessedEventsWatermark:
+    def __init__(self):
+        self._pending: deque[StoredEvent[str, JsonValue]] = deque()
+        self._completed: set[int] = set()
+
+    def dispatched(self, event: StoredEvent[str, JsonValue]) -> None:
+        self._pending.append(event)
+
+    def completed(
+        self, event: StoredEvent[str, JsonValue]
+    ) -> Sequence[StoredEvent[str, JsonValue]]:
+        self._completed.add(event.sequence_number)
+
+        advanced: list[StoredEvent[str, JsonValue]] = []
+        while (
+            self._pending
+            and self._pending[0].sequence_number in self._completed
+        ):
+            head = self._pending.popleft()
+            self._completed.remove(head.sequence_number)
+            advanced.append(head)
+
+        return advanced
+
+
 class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
     EventConsumer
 ):
@@ -24,15 +61,49 @@ class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
         self,
         *,
         source: S,
-        processor: EventProcessor,
+        processor: EventProcessor | BatchEventProcessor,
         state_store: EventConsumerStateStore,
+        head_tracker: EventHeadTracker | None = None,
+        batch_size: int = 100,
+        batch_interval: timedelta = timedelta(seconds=1),
+        lanes: int = 1,
+        lane_capacity: int = 100,
         logger: FilteringBoundLogger = default_logger,
     ):
+        if lanes < 1:
+            raise ValueError("Lanes must be at least 1.")
+
         self._source = source
         self._processor = processor
         self._state_store = state_store
+        self._head_tracker = head_tracker
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval
+        self._lanes = lanes
+        self._lane_capacity = lane_capacity
         self._logger = logger
 
+    async def consume_notified(
+        self, notifications: Sequence[EventNotification]
+    ) -> None:
+        if any(
+            notification.affects(self._source.identifier)
+            for notification in notifications
+        ):
+            await self.consume_all()
+
+    async def lag(self) -> int | None:
+        latest = await self._source.latest()
+        if latest is None:
+            return 0
+
+        state = await self._state_store.load()
+        last_sequence_number = (
+            0 if state is None else state.last_sequence_number
+        )
+
+        return max(0, latest.sequence_number - last_sequence_number)
+
     async def consume_all(self) -> None:
         state = await self._state_store.load()
         last_sequence_number = (
@@ -47,6 +118,21 @@ class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
             last_sequence_number=last_sequence_number,
         )
 
+        if (
+            self._head_tracker is not None
+            and not await self._head_tracker.has_events_after(
+                self._source.identifier, last_sequence_number
+            )
+        ):
+            await self._logger.adebug(
+                log_event_name("skipping-consume"),
+                source=self._source.identifier.serialise(
+                    fallback=str_serialisation_fallback
+                ),
+                last_sequence_number=last_sequence_number,
+            )
+            return
+
         source = self._source
         if last_sequence_number is not None:
             source = self._source.iterate(
@@ -55,8 +141,36 @@ class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
                 }
             )
 
+        match self._processor:
+            case BatchEventProcessor():
+                consumed_count = await self._consume_batches(
+                    source, self._processor
+                )
+            case EventProcessor() if self._lanes > 1:
+                consumed_count = await self._consume_partitioned(
+                    source, self._processor
+                )
+            case EventProcessor():
+                consumed_count = await self._consume_events(
+                    source, self._processor
+                )
+
+        await self._state_store.save()
+        await self._logger.adebug(
+            log_event_name("completed-consume"),
+            source=self._source.identifier.serialise(
+                fallback=str_serialisation_fallback
+            ),
+            consumed_count=consumed_count,
+        )
+
+    async def _consume_events(
+        self,
+        events: AsyncIterable[StoredEvent[str, JsonValue]],
+        processor: EventProcessor,
+    ) -> int:
         consumed_count = 0
-        async for event in source:
+        async for event in events:
             await self._logger.adebug(
                 log_event_name("consuming-event"),
                 source=self._source.identifier.serialise(
@@ -65,7 +179,7 @@ class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
                 envelope=event.summarise(),
             )
             try:
-                await self._processor.process_event(event)
+                await processor.process_event(event)
                 await self._state_store.record_processed(event)
                 consumed_count += 1
             except (asyncio.CancelledError, GeneratorExit):
@@ -80,11 +194,141 @@ class EventSourceConsumer[S: EventSource[EventSourceIdentifier]](
                 )
                 raise
 
-        await self._state_store.save()
+        return consumed_count
+
+    async def _consume_partitioned(
+        self,
+        events: AsyncIterable[StoredEvent[str, JsonValue]],
+        processor: EventProcessor,
+    ) -> int:
+        consumed_count = 0
+        watermark = ProcessedEventsWatermark()
+        checkpoint_lock = asyncio.Lock()
+        queues = [
+            asyncio.Queue[StoredEvent[str, JsonValue] | None](
+                maxsize=self._lane_capacity
+            )
+            for _ in range(self._lanes)
+        ]
+
+        async def dispatch() -> None:
+            async for event in events:
+                lane = (
+                    hash(
+                        StreamIdentifier(
+                            category=event.category, stream=event.stream
+                        )
+                    )
+                    % self._lanes
+                )
+                watermark.dispatched(event)
+                await queues[lane].put(event)
+
+            for queue in queues:
+                await queue.put(None)
+
+        async def work(lane: int) -> None:
+            nonlocal consumed_count
+            queue = queues[lane]
+
+            while (event := await queue.get()) is not None:
+                await self._logger.adebug(
+                    log_event_name("consuming-event"),
+                    source=self._source.identifier.serialise(
+                        fallback=str_serialisation_fallback
+                    ),
+                    envelope=event.summarise(),
+                    lane=lane,
+                )
+                try:
+                    await processor.process_event(event)
+                except (asyncio.CancelledError, GeneratorExit):
+                    raise
+                except BaseException:
+                    await self._logger.aexception(
+                        log_event_name("processor-failed"),
+                        source=self._source.identifier.serialise(
+                            fallback=str_serialisation_fallback
+                        ),
+                        envelope=event.summarise(),
+                        lane=lane,
+                    )
+                    raise
+
+                consumed_count += 1
+                async with checkpoint_lock:
+                    advanced = watermark.completed(event)
+                    if advanced:
+                        await self._state_store.record_processed(
+                            advanced[-1], count=len(advanced)
+                        )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(dispatch())
+                for lane in range(self._lanes):
+                    task_group.create_task(work(lane))
+        except BaseExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+        return consumed_count
+
+    async def _consume_batches(
+        self,
+        events: AsyncIterable[StoredEvent[str, JsonValue]],
+        processor: BatchEventProcessor,
+    ) -> int:
+        consumed_count = 0
+        batch: list[StoredEvent[str, JsonValue]] = []
+        batch_started_at = time.monotonic()
+        batch_interval = self._batch_interval.total_seconds()
+
+        async for event in events:
+            if not batch:
+                batch_started_at = time.monotonic()
+            batch.append(event)
+
+            if (
+                len(batch) >= self._batch_size
+                or time.monotonic() - batch_started_at >= batch_interval
+            ):
+                await self._consume_batch(batch, processor)
+                consumed_count += len(batch)
+                batch = []
+
+        if batch:
+            await self._consume_batch(batch, processor)
+            consumed_count += len(batch)
+
+        return consumed_count
+
+    async def _consume_batch(
+        self,
+        batch: Sequence[StoredEvent[str, JsonValue]],
+        processor: BatchEventProcessor,
+    ) -> None:
         await self._logger.adebug(
-            log_event_name("completed-consume"),
+            log_event_name("consuming-events"),
             source=self._source.identifier.serialise(
                 fallback=str_serialisation_fallback
             ),
-            consumed_count=consumed_count,
+            event_count=len(batch),
+            first_sequence_number=batch[0].sequence_number,
+            last_sequence_number=batch[-1].sequence_number,
         )
+        try:
+            await processor.process_events(batch)
+            await self._state_store.record_processed(
+                batch[-1], count=len(batch)
+            )
+        except (asyncio.CancelledError, GeneratorExit):
+            raise
+        except BaseException:
+            await self._logger.aexception(
+                log_event_name("processor-failed"),
+                source=self._source.identifier.serialise(
+                    fallback=str_serialisation_fallback
+                ),
+                envelopes=[event.summarise() for event in batch],
+            )
+            raise
@@ -52,8 +52,8 @@ class EventConsumerState(JsonValueConvertible):
 
 
 class EventCount(int):
-    def increment(self) -> Self:
-        return self.__class__(self + 1)
+    def increment(self, by: int = 1) -> Self:
+        return self.__class__(self + by)
 
 
 class EventConsumerStateStore:
@@ -78,6 +78,7 @@ class EventConsumerStateStore:
         *,
         state: JsonValue = None,
         partition: str = "default",
+        count: int = 1,
     ) -> EventConsumerState:
         self._states[partition] = EventConsumerState(
             last_sequence_number=event.sequence_number,
@@ -85,7 +86,7 @@ class EventConsumerStateStore:
         )
         self._persistence_lags[partition] = self._persistence_lags[
             partition
-        ].increment()
+        ].increment(count)
 
         if self._persistence_lags[partition] >= self._persistence_interval:
             await self.save(partition=partition)
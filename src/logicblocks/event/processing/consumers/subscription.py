@@ -1,19 +1,35 @@
-from collections.abc import Callable, MutableMapping, Sequence
+import asyncio
+import time
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 from structlog.types import FilteringBoundLogger
 
-from logicblocks.event.store import EventCategory, EventSource
+from logicblocks.event.store import (
+    EventCategory,
+    EventHeadTracker,
+    EventNotification,
+    EventSource,
+)
 from logicblocks.event.types import (
     EventSourceIdentifier,
     str_serialisation_fallback,
 )
+from logicblocks.event.utils.clock import Clock, SystemClock
 
 from ..broker import EventSubscriber, EventSubscriberHealth
 from .logger import default_logger
 from .source import EventSourceConsumer
 from .state import EventConsumerStateStore, EventCount
-from .types import EventConsumer, EventProcessor
+from .types import BatchEventProcessor, EventConsumer, EventProcessor
 
 
 def make_subscriber(
@@ -23,7 +39,9 @@ def make_subscriber(
     subscription_request: EventSourceIdentifier,
     subscriber_state_category: EventCategory,
     subscriber_state_persistence_interval: EventCount = EventCount(100),
-    event_processor: EventProcessor,
+    event_processor: EventProcessor | BatchEventProcessor,
+    head_tracker: EventHeadTracker | None = None,
+    lanes: int = 1,
     logger: FilteringBoundLogger = default_logger,
 ) -> "EventSubscriptionConsumer":
     subscriber_id = (
@@ -41,6 +59,8 @@ def make_subscriber(
             source=source,
             processor=event_processor,
             state_store=state_store,
+            head_tracker=head_tracker,
+            lanes=lanes,
             logger=logger,
         )
 
@@ -53,6 +73,15 @@ def make_subscriber(
     )
 
 
+@dataclass(frozen=True)
+class EventSourceConsumptionMetrics:
+    consume_count: int
+    failure_count: int
+    scheduling_delay: timedelta
+    duration: timedelta
+    last_completed_at: datetime
+
+
 class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
     def __init__(
         self,
@@ -62,16 +91,27 @@ class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
         delegate_factory: Callable[
             [EventSource[EventSourceIdentifier]], EventConsumer
         ],
+        max_concurrency: int = 1,
+        clock: Clock = SystemClock(),
         logger: FilteringBoundLogger = default_logger,
     ):
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1.")
+
         self._group = group
         self._id = id
         self._subscription_requests = subscription_requests
         self._delegate_factory = delegate_factory
         self._logger = logger.bind(subscriber={"group": group, "id": id})
+        self._max_concurrency = max_concurrency
+        self._clock = clock
         self._delegates: MutableMapping[
             EventSourceIdentifier, EventConsumer
         ] = {}
+        self._metrics: MutableMapping[
+            EventSourceIdentifier, EventSourceConsumptionMetrics
+        ] = {}
+        self._rotation = 0
 
     @property
     def group(self) -> str:
@@ -81,6 +121,31 @@ class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
     def id(self) -> str:
         return self._id
 
+    @property
+    def metrics(
+        self,
+    ) -> Mapping[EventSourceIdentifier, EventSourceConsumptionMetrics]:
+        return dict(self._metrics)
+
+    async def lags(self) -> Mapping[EventSourceIdentifier, int | None]:
+        # note: lag costs each delegate a query or more, so it is computed
+        #       on request rather than after every consume, and a source
+        #       whose lag cannot be determined reports None.
+        lags: dict[EventSourceIdentifier, int | None] = {}
+        for identifier, delegate in dict(self._delegates).items():
+            try:
+                lags[identifier] = await delegate.lag()
+            except Exception:
+                await self._logger.awarn(
+                    "event.consumer.subscription.lag-failed",
+                    source=identifier.serialise(
+                        fallback=str_serialisation_fallback
+                    ),
+                    exc_info=True,
+                )
+                lags[identifier] = None
+        return lags
+
     def health(self) -> EventSubscriberHealth:
         return EventSubscriberHealth.HEALTHY
 
@@ -116,6 +181,7 @@ class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
                 ),
             )
             self._delegates.pop(source.identifier)
+            self._metrics.pop(source.identifier, None)
         else:
             await self._logger.awarn(
                 "event.consumer.subscription.missing-source",
@@ -133,14 +199,26 @@ class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
             ],
         )
 
-        for identifier, delegate in dict(self._delegates).items():
-            await self._logger.adebug(
-                "event.consumer.subscription.consuming-source",
-                source=identifier.serialise(
-                    fallback=str_serialisation_fallback
-                ),
-            )
-            await delegate.consume_all()
+        def consume(
+            identifier: EventSourceIdentifier, delegate: EventConsumer
+        ) -> Callable[[], Awaitable[None]]:
+            async def run() -> None:
+                await self._logger.adebug(
+                    "event.consumer.subscription.consuming-source",
+                    source=identifier.serialise(
+                        fallback=str_serialisation_fallback
+                    ),
+                )
+                await delegate.consume_all()
+
+            return run
+
+        await self._consume_delegates(
+            [
+                (identifier, consume(identifier, delegate))
+                for identifier, delegate in dict(self._delegates).items()
+            ]
+        )
 
         await self._logger.adebug(
             "event.consumer.subscription.completed-consume",
@@ -149,3 +227,108 @@ class EventSubscriptionConsumer(EventConsumer, EventSubscriber):
                 for identifier in self._delegates.keys()
             ],
         )
+
+    async def consume_notified(
+        self, notifications: Sequence[EventNotification]
+    ) -> None:
+        def consume(
+            identifier: EventSourceIdentifier,
+            delegate: EventConsumer,
+            affecting: Sequence[EventNotification],
+        ) -> Callable[[], Awaitable[None]]:
+            async def run() -> None:
+                await self._logger.adebug(
+                    "event.consumer.subscription.consuming-notified-source",
+                    source=identifier.serialise(
+                        fallback=str_serialisation_fallback
+                    ),
+                    notification_count=len(affecting),
+                )
+                await delegate.consume_notified(affecting)
+
+            return run
+
+        work: list[
+            tuple[EventSourceIdentifier, Callable[[], Awaitable[None]]]
+        ] = []
+        for identifier, delegate in dict(self._delegates).items():
+            affecting = [
+                notification
+                for notification in notifications
+                if notification.affects(identifier)
+            ]
+            if affecting:
+                work.append(
+                    (identifier, consume(identifier, delegate, affecting))
+                )
+
+        await self._consume_delegates(work)
+
+    async def _consume_delegates(
+        self,
+        work: Sequence[
+            tuple[EventSourceIdentifier, Callable[[], Awaitable[None]]]
+        ],
+    ) -> None:
+        requested_at = time.monotonic()
+
+        if self._max_concurrency == 1 or len(work) <= 1:
+            for identifier, consume in work:
+                await self._consume_delegate(identifier, consume, requested_at)
+            return
+
+        offset = self._rotation % len(work)
+        self._rotation += 1
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(
+            identifier: EventSourceIdentifier,
+            consume: Callable[[], Awaitable[None]],
+        ) -> None:
+            async with semaphore:
+                await self._consume_delegate(identifier, consume, requested_at)
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for identifier, consume in [*work[offset:], *work[:offset]]:
+                    task_group.create_task(run(identifier, consume))
+        except BaseExceptionGroup as errors:
+            raise errors.exceptions[0]
+
+    async def _consume_delegate(
+        self,
+        identifier: EventSourceIdentifier,
+        consume: Callable[[], Awaitable[None]],
+        requested_at: float,
+    ) -> None:
+        started_at = time.monotonic()
+        failed = True
+        try:
+            await consume()
+            failed = False
+        finally:
+            completed_at = time.monotonic()
+            previous = self._metrics.get(identifier, None)
+            consume_count = 0 if previous is None else previous.consume_count
+            failure_count = 0 if previous is None else previous.failure_count
+            scheduling_delay = timedelta(seconds=started_at - requested_at)
+            duration = timedelta(seconds=completed_at - started_at)
+            metrics = EventSourceConsumptionMetrics(
+                consume_count=consume_count + 1,
+                failure_count=failure_count + (1 if failed else 0),
+                scheduling_delay=scheduling_delay,
+                duration=duration,
+                last_completed_at=self._clock.now(),
+            )
+            if identifier in self._delegates:
+                self._metrics[identifier] = metrics
+
+            await self._logger.adebug(
+                "event.consumer.subscription.consumed-source",
+                source=identifier.serialise(
+                    fallback=str_serialisation_fallback
+                ),
+                failed=failed,
+                scheduling_delay_seconds=scheduling_delay.total_seconds(),
+                duration_seconds=duration.total_seconds(),
+            )
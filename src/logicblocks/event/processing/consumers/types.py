@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+from logicblocks.event.store import EventNotification
 from logicblocks.event.types import JsonValue, StoredEvent
 
 
@@ -8,8 +10,24 @@ class EventConsumer(ABC):
     async def consume_all(self) -> None:
         raise NotImplementedError()
 
+    async def consume_notified(
+        self, notifications: Sequence[EventNotification]
+    ) -> None:
+        await self.consume_all()
+
+    async def lag(self) -> int | None:
+        return None
+
 
 class EventProcessor(ABC):
     @abstractmethod
     async def process_event(self, event: StoredEvent[str, JsonValue]) -> None:
         raise NotImplementedError()
+
+
+class BatchEventProcessor(ABC):
+    @abstractmethod
+    async def process_events(
+        self, events: Sequence[StoredEvent[str, JsonValue]]
+    ) -> None:
+        raise NotImplementedError()
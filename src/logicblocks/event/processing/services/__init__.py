@@ -20,6 +20,7 @@ from .manager import (
     IsolationMode,
     ServiceManager,
 )
+from .notification import NotificationAwareService
 from .polling import PollingService
 from .types import Service
 
@@ -32,6 +33,7 @@ __all__ = [
     "ExitErrorHandler",
     "ExitErrorHandlerDecision",
     "IsolationMode",
+    "NotificationAwareService",
     "PollingService",
     "RaiseErrorHandler",
     "RaiseErrorHandlerDecision",
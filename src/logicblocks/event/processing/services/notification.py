@@ -0,0 +1,68 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import timedelta
+from typing import Any
+
+from logicblocks.event.store import EventNotification, EventNotificationSource
+
+from .types import Service
+
+
+class NotificationAwareService(Service[None]):
+    def __init__(
+        self,
+        *,
+        notification_source: EventNotificationSource,
+        on_notifications: Callable[
+            [Sequence[EventNotification]], Awaitable[Any]
+        ],
+        on_poll: Callable[[], Awaitable[Any]],
+        poll_interval: timedelta = timedelta(seconds=5),
+    ):
+        self._notification_source = notification_source
+        self._on_notifications = on_notifications
+        self._on_poll = on_poll
+        self._poll_interval = poll_interval
+
+    async def execute(self) -> None:
+        pending: list[EventNotification] = []
+        received = asyncio.Event()
+
+        async with self._notification_source.listen() as notifications:
+
+            async def receive() -> None:
+                async for notification in notifications:
+                    pending.append(notification)
+                    received.set()
+
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(receive())
+
+                # note: polls run on a fixed cadence even under steady
+                #       notification traffic, so a source whose notification
+                #       was lost is still picked up within one interval.
+                loop = asyncio.get_running_loop()
+                interval = self._poll_interval.total_seconds()
+
+                await self._on_poll()
+                next_poll_at = loop.time() + interval
+
+                while True:
+                    timeout = next_poll_at - loop.time()
+                    if timeout <= 0:
+                        await self._on_poll()
+                        next_poll_at = loop.time() + interval
+                        continue
+
+                    try:
+                        await asyncio.wait_for(
+                            received.wait(), timeout=timeout
+                        )
+                    except TimeoutError:
+                        continue
+
+                    received.clear()
+                    batch = list(pending)
+                    pending.clear()
+
+                    await self._on_notifications(batch)
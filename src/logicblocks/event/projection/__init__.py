@@ -3,19 +3,51 @@ from .projector import (
     MissingProjectionHandlerError,
     Projector,
 )
+from .snapshots import (
+    InMemoryProjectionSnapshotStore,
+    PostgresProjectionSnapshotStore,
+    ProjectionSnapshot,
+    ProjectionSnapshotStore,
+)
 from .store import (
+    CachingProjectionRebuild,
+    CachingProjectionStorageAdapter,
+    InMemoryProjectionNotificationHub,
     InMemoryProjectionStorageAdapter,
+    InPlaceProjectionRebuild,
+    PostgresProjectionNotificationSource,
+    PostgresProjectionRebuild,
     PostgresProjectionStorageAdapter,
+    ProjectionCacheStatistics,
+    ProjectionNotification,
+    ProjectionNotificationSource,
+    ProjectionRebuild,
     ProjectionStorageAdapter,
     ProjectionStore,
+    SqliteProjectionStorageAdapter,
 )
 
 __all__ = [
+    "CachingProjectionRebuild",
+    "CachingProjectionStorageAdapter",
+    "InMemoryProjectionNotificationHub",
+    "InMemoryProjectionSnapshotStore",
     "InMemoryProjectionStorageAdapter",
+    "InPlaceProjectionRebuild",
     "MissingHandlerBehaviour",
     "MissingProjectionHandlerError",
+    "PostgresProjectionNotificationSource",
+    "PostgresProjectionRebuild",
+    "PostgresProjectionSnapshotStore",
     "PostgresProjectionStorageAdapter",
+    "ProjectionCacheStatistics",
+    "ProjectionNotification",
+    "ProjectionNotificationSource",
+    "ProjectionSnapshot",
+    "ProjectionSnapshotStore",
+    "ProjectionRebuild",
     "ProjectionStorageAdapter",
     "ProjectionStore",
     "Projector",
+    "SqliteProjectionStorageAdapter",
 ]
@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from enum import StrEnum
-from typing import Any
+from inspect import getattr_static
+from typing import Any, ClassVar
 
 from pyheck import kebab as to_kebab_case
 from pyheck import snake as to_snake_case
 
 from logicblocks.event.store import EventSource
+from logicblocks.event.store.constraints import (
+    QueryConstraint,
+    sequence_number_after,
+)
 from logicblocks.event.types import (
     EventSourceIdentifier,
     JsonValue,
@@ -14,6 +19,8 @@ from logicblocks.event.types import (
     StoredEvent,
 )
 
+from .snapshots import ProjectionSnapshot, ProjectionSnapshotStore
+
 
 class MissingProjectionHandlerError(Exception):
     def __init__(self, event: StoredEvent, projection_class: type):
@@ -28,6 +35,10 @@ class MissingHandlerBehaviour(StrEnum):
     IGNORE = "ignore"
 
 
+def ignore_event[State](state: State, event: StoredEvent) -> State:
+    return state
+
+
 class Projector[
     Identifier: EventSourceIdentifier,
     State,
@@ -39,6 +50,24 @@ class Projector[
         MissingHandlerBehaviour.RAISE
     )
 
+    snapshot_interval: int = 100
+
+    version: int = 1
+
+    _handler_functions: ClassVar[dict[str, tuple[str, Any]]] = {}
+    _handlers: dict[str, Callable[[State, StoredEvent], State]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._handler_functions = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # note: a callable assigned on the instance may replace a handler
+        #       that has already been bound, so bound handlers are dropped.
+        if callable(value):
+            vars(self).pop("_handlers", None)
+
     @abstractmethod
     def initial_state_factory(self) -> State:
         raise NotImplementedError()
@@ -64,9 +93,42 @@ class Projector[
         self, *, event: StoredEvent[Any], state: State | None = None
     ) -> State:
         state = self._resolve_state(state)
-        handler = self._resolve_handler(event)
 
-        return handler(state, event)
+        return self._handler_for(event)(state, event)
+
+    def apply_many(
+        self,
+        *,
+        events: Iterable[StoredEvent[Any]],
+        state: State | None = None,
+    ) -> State:
+        state = self._resolve_state(state)
+
+        apply = self._event_applier()
+        for event in events:
+            state = apply(state, event)
+
+        return state
+
+    def fold(
+        self,
+        *,
+        events: Iterable[StoredEvent[Any]],
+        state: State | None = None,
+        metadata: Metadata | None = None,
+    ) -> tuple[State, Metadata]:
+        metadata = self._resolve_metadata(metadata)
+        if not self._updates_metadata():
+            return self.apply_many(events=events, state=state), metadata
+
+        state = self._resolve_state(state)
+
+        apply = self._event_applier()
+        for event in events:
+            state = apply(state, event)
+            metadata = self.update_metadata(state, metadata, event)
+
+        return state, metadata
 
     async def project(
         self,
@@ -74,13 +136,58 @@ class Projector[
         source: EventSource[Identifier],
         state: State | None = None,
         metadata: Metadata | None = None,
+        snapshots: ProjectionSnapshotStore[State, Metadata] | None = None,
     ) -> Projection[State, Metadata]:
+        # note: snapshots are only used when projecting from the initial
+        #       state, since a caller provided state may not correspond to
+        #       every event in the source up to the last one applied.
+        if state is not None or metadata is not None:
+            snapshots = None
+
+        constraints: set[QueryConstraint] = set()
+        if snapshots is not None:
+            snapshot = await snapshots.load(
+                name=self.projection_name, source=source.identifier
+            )
+            # note: a snapshot taken by another version of the projector may
+            #       hold state its handlers no longer produce, so it is
+            #       ignored and the source is replayed from the start.
+            if snapshot is not None and snapshot.version == self.version:
+                state = snapshot.state
+                metadata = snapshot.metadata
+                constraints.add(
+                    sequence_number_after(snapshot.sequence_number)
+                )
+
         state = self._resolve_state(state)
         metadata = self._resolve_metadata(metadata)
 
-        async for event in source:
-            state = self.apply(state=state, event=event)
-            metadata = self.update_metadata(state, metadata, event)
+        updates_metadata = self._updates_metadata()
+        apply = self._event_applier()
+
+        events_since_snapshot = 0
+        async for event in source.iterate(constraints=constraints):
+            state = apply(state, event)
+            if updates_metadata:
+                metadata = self.update_metadata(state, metadata, event)
+
+            events_since_snapshot += 1
+            if (
+                snapshots is not None
+                and events_since_snapshot >= self.snapshot_interval
+            ):
+                await snapshots.save(
+                    snapshot=ProjectionSnapshot[State, Metadata](
+                        name=self.projection_name,
+                        source=source.identifier,
+                        state=state,
+                        metadata=metadata,
+                        position=event.position,
+                        sequence_number=event.sequence_number,
+                        version=self.version,
+                    )
+                )
+                events_since_snapshot = 0
 
         return Projection[State, Metadata](
             id=self.id_factory(state, source.identifier),
@@ -90,6 +197,23 @@ class Projector[
             metadata=metadata,
         )
 
+    def _updates_metadata(self) -> bool:
+        return (
+            type(self).update_metadata
+            is not Projector[Any, Any, Any].update_metadata
+        )
+
+    def _event_applier(self) -> Callable[[State, StoredEvent], State]:
+        # note: folding goes through apply so that subclasses overriding it
+        #       see every event, and otherwise straight to the handlers.
+        if type(self).apply is Projector[Any, Any, Any].apply:
+            return self._apply_handler
+
+        return lambda state, event: self.apply(event=event, state=state)
+
+    def _apply_handler(self, state: State, event: StoredEvent) -> State:
+        return self._handler_for(event)(state, event)
+
     def _resolve_state(self, state: State | None) -> State:
         if state is None:
             return self.initial_state_factory()
@@ -102,20 +226,45 @@ class Projector[
 
         return metadata
 
-    def _resolve_handler(
+    def _handler_for(
         self, event: StoredEvent
     ) -> Callable[[State, StoredEvent], State]:
-        handler_name = to_snake_case(event.name)
-        handler = getattr(self, handler_name, None)
+        try:
+            handlers = self._handlers
+        except AttributeError:
+            handlers = self._handlers = {}
 
+        handler = handlers.get(event.name, None)
         if handler is None:
-            if self.missing_handler_behaviour == MissingHandlerBehaviour.RAISE:
-                raise MissingProjectionHandlerError(event, self.__class__)
+            function_name, function = self._handler_function(event.name)
+            instance_function = vars(self).get(function_name, None)
+            if instance_function is not None:
+                handler = instance_function
+            elif function is None:
+                if (
+                    self.missing_handler_behaviour
+                    == MissingHandlerBehaviour.RAISE
+                ):
+                    raise MissingProjectionHandlerError(event, self.__class__)
+                handler = ignore_event
+            elif hasattr(function, "__get__"):
+                handler = function.__get__(self, type(self))
             else:
-                return lambda state, _: state
+                handler = function
+            handlers[event.name] = handler
 
         return handler
 
+    @classmethod
+    def _handler_function(cls, event_name: str) -> tuple[str, Any]:
+        if event_name not in cls._handler_functions:
+            function_name = to_snake_case(event_name)
+            cls._handler_functions[event_name] = (
+                function_name,
+                getattr_static(cls, function_name, None),
+            )
+        return cls._handler_functions[event_name]
+
     def _default_name(self) -> str:
         projector_name = self.__class__.__name__.replace("Projector", "")
         return to_kebab_case(projector_name)
@@ -0,0 +1,10 @@
+from .base import ProjectionSnapshot, ProjectionSnapshotStore
+from .memory import InMemoryProjectionSnapshotStore
+from .postgres import PostgresProjectionSnapshotStore
+
+__all__ = [
+    "InMemoryProjectionSnapshotStore",
+    "PostgresProjectionSnapshotStore",
+    "ProjectionSnapshot",
+    "ProjectionSnapshotStore",
+]
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from logicblocks.event.types import EventSourceIdentifier, JsonValue
+
+
+@dataclass(frozen=True)
+class ProjectionSnapshot[State, Metadata = JsonValue]:
+    name: str
+    source: EventSourceIdentifier
+    state: State
+    metadata: Metadata
+    position: int
+    sequence_number: int
+    version: int
+
+
+class ProjectionSnapshotStore[State, Metadata = JsonValue](ABC):
+    @abstractmethod
+    async def load(
+        self, *, name: str, source: EventSourceIdentifier
+    ) -> ProjectionSnapshot[State, Metadata] | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save(
+        self, *, snapshot: ProjectionSnapshot[State, Metadata]
+    ) -> None:
+        raise NotImplementedError()
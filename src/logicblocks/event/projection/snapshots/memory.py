@@ -0,0 +1,26 @@
+from copy import deepcopy
+
+from logicblocks.event.types import EventSourceIdentifier, JsonValue
+
+from .base import ProjectionSnapshot, ProjectionSnapshotStore
+
+
+class InMemoryProjectionSnapshotStore[State, Metadata = JsonValue](
+    ProjectionSnapshotStore[State, Metadata]
+):
+    def __init__(self):
+        self._snapshots: dict[
+            tuple[str, EventSourceIdentifier],
+            ProjectionSnapshot[State, Metadata],
+        ] = {}
+
+    async def load(
+        self, *, name: str, source: EventSourceIdentifier
+    ) -> ProjectionSnapshot[State, Metadata] | None:
+        snapshot = self._snapshots.get((name, source), None)
+        return deepcopy(snapshot) if snapshot is not None else None
+
+    async def save(
+        self, *, snapshot: ProjectionSnapshot[State, Metadata]
+    ) -> None:
+        self._snapshots[(snapshot.name, snapshot.source)] = deepcopy(snapshot)
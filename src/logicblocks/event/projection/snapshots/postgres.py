@@ -0,0 +1,153 @@
+from psycopg import AsyncConnection, sql
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
+
+import logicblocks.event.persistence.postgres as postgres
+from logicblocks.event.types import (
+    EventSourceIdentifier,
+    JsonPersistable,
+    JsonValue,
+    JsonValueType,
+    deserialise_from_json_value,
+    serialise_to_json_value,
+)
+
+from .base import ProjectionSnapshot, ProjectionSnapshotStore
+
+
+def upsert_query(
+    snapshot: ProjectionSnapshot[JsonPersistable, JsonPersistable],
+    table_settings: postgres.TableSettings,
+) -> postgres.ParameterisedQuery:
+    # note: a snapshot only replaces one taken later in the source when it
+    #       comes from another projector version, so a slow projector never
+    #       winds a newer snapshot of the same version back.
+    return (
+        sql.SQL(
+            """
+            INSERT INTO {0} AS snapshot (name,
+                                         source,
+                                         state,
+                                         metadata,
+                                         position,
+                                         sequence_number,
+                                         version,
+                                         saved_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, now())
+            ON CONFLICT (name, source)
+                DO
+            UPDATE
+                SET (state,
+                     metadata,
+                     position,
+                     sequence_number,
+                     version,
+                     saved_at) = (EXCLUDED.state,
+                                  EXCLUDED.metadata,
+                                  EXCLUDED.position,
+                                  EXCLUDED.sequence_number,
+                                  EXCLUDED.version,
+                                  EXCLUDED.saved_at)
+                WHERE snapshot.version <> EXCLUDED.version
+                   OR snapshot.sequence_number <= EXCLUDED.sequence_number;
+            """
+        ).format(sql.Identifier(table_settings.table_name)),
+        [
+            snapshot.name,
+            Jsonb(snapshot.source.serialise()),
+            Jsonb(serialise_to_json_value(snapshot.state)),
+            Jsonb(serialise_to_json_value(snapshot.metadata)),
+            snapshot.position,
+            snapshot.sequence_number,
+            snapshot.version,
+        ],
+    )
+
+
+def select_query(
+    name: str,
+    source: EventSourceIdentifier,
+    table_settings: postgres.TableSettings,
+) -> postgres.ParameterisedQuery:
+    return (
+        sql.SQL(
+            """
+            SELECT state, metadata, position, sequence_number, version
+            FROM {0}
+            WHERE name = %s
+              AND source = %s;
+            """
+        ).format(sql.Identifier(table_settings.table_name)),
+        [name, Jsonb(source.serialise())],
+    )
+
+
+class PostgresProjectionSnapshotStore[
+    State: JsonPersistable = JsonValue,
+    Metadata: JsonPersistable = JsonValue,
+](ProjectionSnapshotStore[State, Metadata]):
+    def __init__(
+        self,
+        *,
+        connection_source: postgres.ConnectionSource,
+        table_settings: postgres.TableSettings = postgres.TableSettings(
+            table_name="projection_snapshots"
+        ),
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+    ):
+        if isinstance(connection_source, postgres.ConnectionSettings):
+            self._connection_pool_owner = True
+            self.connection_pool = AsyncConnectionPool[AsyncConnection](
+                connection_source.to_connection_string(), open=False
+            )
+        else:
+            self._connection_pool_owner = False
+            self.connection_pool = connection_source
+
+        self.table_settings = table_settings
+        self.state_type = state_type
+        self.metadata_type = metadata_type
+
+    async def open(self) -> None:
+        if self._connection_pool_owner:
+            await self.connection_pool.open()
+
+    async def close(self) -> None:
+        if self._connection_pool_owner:
+            await self.connection_pool.close()
+
+    async def load(
+        self, *, name: str, source: EventSourceIdentifier
+    ) -> ProjectionSnapshot[State, Metadata] | None:
+        async with self.connection_pool.connection() as connection:
+            async with connection.cursor(row_factory=dict_row) as cursor:
+                results = await cursor.execute(
+                    *select_query(name, source, self.table_settings)
+                )
+                snapshot_dict = await results.fetchone()
+                if snapshot_dict is None:
+                    return None
+
+                return ProjectionSnapshot[State, Metadata](
+                    name=name,
+                    source=source,
+                    state=deserialise_from_json_value(
+                        self.state_type, snapshot_dict["state"]
+                    ),
+                    metadata=deserialise_from_json_value(
+                        self.metadata_type, snapshot_dict["metadata"]
+                    ),
+                    position=snapshot_dict["position"],
+                    sequence_number=snapshot_dict["sequence_number"],
+                    version=snapshot_dict["version"],
+                )
+
+    async def save(
+        self, *, snapshot: ProjectionSnapshot[State, Metadata]
+    ) -> None:
+        async with self.connection_pool.connection() as connection:
+            await connection.execute(
+                *upsert_query(snapshot, self.table_settings)
+            )
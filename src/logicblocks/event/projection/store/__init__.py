@@ -1,13 +1,37 @@
 from .adapters import (
+    CachingProjectionRebuild,
+    CachingProjectionStorageAdapter,
     InMemoryProjectionStorageAdapter,
+    InPlaceProjectionRebuild,
+    PostgresProjectionRebuild,
     PostgresProjectionStorageAdapter,
+    ProjectionCacheStatistics,
+    ProjectionRebuild,
     ProjectionStorageAdapter,
+    SqliteProjectionStorageAdapter,
+)
+from .notifications import (
+    InMemoryProjectionNotificationHub,
+    PostgresProjectionNotificationSource,
+    ProjectionNotification,
+    ProjectionNotificationSource,
 )
 from .store import ProjectionStore
 
 __all__ = [
+    "CachingProjectionRebuild",
+    "CachingProjectionStorageAdapter",
+    "InMemoryProjectionNotificationHub",
     "InMemoryProjectionStorageAdapter",
+    "InPlaceProjectionRebuild",
+    "PostgresProjectionNotificationSource",
+    "PostgresProjectionRebuild",
     "PostgresProjectionStorageAdapter",
+    "ProjectionCacheStatistics",
+    "ProjectionNotification",
+    "ProjectionNotificationSource",
+    "ProjectionRebuild",
     "ProjectionStorageAdapter",
     "ProjectionStore",
+    "SqliteProjectionStorageAdapter",
 ]
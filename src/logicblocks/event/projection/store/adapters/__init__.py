@@ -1,9 +1,29 @@
-from .base import ProjectionStorageAdapter
+from .base import (
+    InPlaceProjectionRebuild,
+    ProjectionRebuild,
+    ProjectionStorageAdapter,
+)
+from .caching import (
+    CachingProjectionRebuild,
+    CachingProjectionStorageAdapter,
+    ProjectionCacheStatistics,
+)
 from .memory import InMemoryProjectionStorageAdapter
-from .postgres import PostgresProjectionStorageAdapter
+from .postgres import (
+    PostgresProjectionRebuild,
+    PostgresProjectionStorageAdapter,
+)
+from .sqlite import SqliteProjectionStorageAdapter
 
 __all__ = [
+    "CachingProjectionRebuild",
+    "CachingProjectionStorageAdapter",
     "InMemoryProjectionStorageAdapter",
+    "InPlaceProjectionRebuild",
+    "PostgresProjectionRebuild",
     "PostgresProjectionStorageAdapter",
+    "ProjectionCacheStatistics",
+    "ProjectionRebuild",
     "ProjectionStorageAdapter",
+    "SqliteProjectionStorageAdapter",
 ]
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from types import TracebackType
+from typing import Any, Self
 
 from logicblocks.event.query import Lookup, Query, Search
 from logicblocks.event.types import (
@@ -10,6 +13,33 @@ from logicblocks.event.types import (
 )
 
 
+class ProjectionRebuild(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+    # note: projections saved inside the swap are the last of the rebuild.
+    #       Adapters that swap rebuilt projections in hold off concurrent
+    #       saves to the name from entry until the swap completes on exit.
+    def swap(self) -> AbstractAsyncContextManager[None]:
+        return nullcontext()
+
+    @abstractmethod
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        raise NotImplementedError()
+
+
 class ProjectionStorageAdapter[
     ItemQuery: Query = Lookup,
     CollectionQuery: Query = Search,
@@ -22,6 +52,22 @@ class ProjectionStorageAdapter[
     ) -> None:
         raise NotImplementedError()
 
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        for projection in projections:
+            await self.save(projection=projection)
+
+    # note: adapters without versioned rebuilds report no version, so every
+    #       rebuild runs, and rebuild in place by saving through the adapter.
+    async def version(self, *, name: str) -> int | None:
+        return None
+
+    def rebuild(self, *, name: str, version: int) -> ProjectionRebuild:
+        return InPlaceProjectionRebuild(adapter=self)
+
     @abstractmethod
     async def find_one[
         State: JsonPersistable = JsonValue,
@@ -47,3 +93,15 @@ class ProjectionStorageAdapter[
         metadata_type: type[Metadata] = JsonValueType,
     ) -> Sequence[Projection[State, Metadata]]:
         raise NotImplementedError()
+
+
+class InPlaceProjectionRebuild(ProjectionRebuild):
+    def __init__(self, *, adapter: ProjectionStorageAdapter[Any, Any]):
+        self.adapter = adapter
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        await self.adapter.save_many(projections=projections)
@@ -0,0 +1,290 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from types import TracebackType
+from typing import Any, Self
+
+from logicblocks.event.query import Lookup, Query, Search
+from logicblocks.event.types import (
+    JsonPersistable,
+    JsonValue,
+    JsonValueType,
+    Projection,
+    deserialise_projection,
+)
+from logicblocks.event.utils.clock import Clock, SystemClock
+
+from ..notifications import ProjectionNotificationSource
+from .base import ProjectionRebuild, ProjectionStorageAdapter
+
+type ProjectionKey = tuple[str, str]
+
+
+def cache_key(query: Query) -> Hashable | None:
+    match query:
+        case Lookup(filters=filters):
+            key: Hashable = (Lookup, tuple(filters))
+        case _:
+            key = query
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+@dataclass(frozen=True)
+class ProjectionCacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class ProjectionCacheEntry:
+    projection: Projection[JsonValue, JsonValue]
+    expires_at: datetime | None
+
+
+class CachingProjectionStorageAdapter[
+    ItemQuery: Query = Lookup,
+    CollectionQuery: Query = Search,
+](ProjectionStorageAdapter[ItemQuery, CollectionQuery]):
+    def __init__(
+        self,
+        *,
+        delegate: ProjectionStorageAdapter[ItemQuery, CollectionQuery],
+        capacity: int = 1024,
+        ttl: timedelta | None = timedelta(seconds=60),
+        clock: Clock = SystemClock(),
+    ):
+        if capacity < 1:
+            raise ValueError(
+                f"Cache capacity must be at least 1 but was {capacity}."
+            )
+
+        self.delegate = delegate
+        self.capacity = capacity
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, ProjectionCacheEntry] = (
+            OrderedDict()
+        )
+        self._keys: dict[ProjectionKey, set[Hashable]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def statistics(self) -> ProjectionCacheStatistics:
+        return ProjectionCacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
+
+    def invalidate(self, *, name: str, id: str | None = None) -> None:
+        self._generation += 1
+
+        if id is not None:
+            projection_keys = [(name, id)]
+        else:
+            projection_keys = [
+                projection_key
+                for projection_key in self._keys
+                if projection_key[0] == name
+            ]
+
+        for projection_key in projection_keys:
+            for key in self._keys.pop(projection_key, set()):
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys.clear()
+
+    async def listen(
+        self, *, notification_source: ProjectionNotificationSource
+    ) -> None:
+        async with notification_source.listen() as notifications:
+            # note: changes made before the listener was established were
+            #       never notified, so anything cached up to now may be stale.
+            self.clear()
+            async for notification in notifications:
+                self.invalidate(name=notification.name, id=notification.id)
+
+    async def save(
+        self,
+        *,
+        projection: Projection[JsonPersistable, JsonPersistable],
+    ) -> None:
+        try:
+            await self.delegate.save(projection=projection)
+        finally:
+            self.invalidate(name=projection.name, id=projection.id)
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        try:
+            await self.delegate.save_many(projections=projections)
+        finally:
+            for projection in projections:
+                self.invalidate(name=projection.name, id=projection.id)
+
+    async def version(self, *, name: str) -> int | None:
+        return await self.delegate.version(name=name)
+
+    def rebuild(self, *, name: str, version: int) -> ProjectionRebuild:
+        return CachingProjectionRebuild(
+            delegate=self.delegate.rebuild(name=name, version=version),
+            adapter=self,
+            name=name,
+        )
+
+    async def find_one[
+        State: JsonPersistable = JsonValue,
+        Metadata: JsonPersistable = JsonValue,
+    ](
+        self,
+        *,
+        lookup: ItemQuery,
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+    ) -> Projection[State, Metadata] | None:
+        key = cache_key(lookup)
+        if key is None:
+            return await self.delegate.find_one(
+                lookup=lookup,
+                state_type=state_type,
+                metadata_type=metadata_type,
+            )
+
+        now = self._clock.now(UTC)
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > now:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return deserialise_projection(
+                    entry.projection, state_type, metadata_type
+                )
+
+            self._evictions += 1
+            self._remove(key)
+
+        self._misses += 1
+
+        generation = self._generation
+        projection = await self.delegate.find_one(lookup=lookup)
+        if projection is None:
+            return None
+
+        # note: a save may have completed while the delegate was reading, in
+        #       which case the result could predate it and must not be cached.
+        if generation == self._generation:
+            self._store(key, projection, now)
+
+        return deserialise_projection(projection, state_type, metadata_type)
+
+    async def find_many[
+        State: JsonPersistable = JsonValue,
+        Metadata: JsonPersistable = JsonValue,
+    ](
+        self,
+        *,
+        search: CollectionQuery,
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+    ) -> Sequence[Projection[State, Metadata]]:
+        return await self.delegate.find_many(
+            search=search, state_type=state_type, metadata_type=metadata_type
+        )
+
+    def _store(
+        self,
+        key: Hashable,
+        projection: Projection[JsonValue, JsonValue],
+        now: datetime,
+    ) -> None:
+        self._remove(key)
+        self._entries[key] = ProjectionCacheEntry(
+            projection=projection,
+            expires_at=now + self.ttl if self.ttl is not None else None,
+        )
+        self._keys.setdefault((projection.name, projection.id), set()).add(key)
+
+        while len(self._entries) > self.capacity:
+            oldest = next(iter(self._entries))
+            self._evictions += 1
+            self._remove(oldest)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        projection_key = (entry.projection.name, entry.projection.id)
+        keys = self._keys.get(projection_key, None)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[projection_key]
+
+
+class CachingProjectionRebuild(ProjectionRebuild):
+    def __init__(
+        self,
+        *,
+        delegate: ProjectionRebuild,
+        adapter: CachingProjectionStorageAdapter[Any, Any],
+        name: str,
+    ):
+        self.delegate = delegate
+        self.adapter = adapter
+        self.name = name
+
+    async def __aenter__(self) -> Self:
+        await self.delegate.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            await self.delegate.__aexit__(exc_type, exc_value, traceback)
+        finally:
+            self.adapter.invalidate(name=self.name)
+
+    def swap(self) -> AbstractAsyncContextManager[None]:
+        return self.delegate.swap()
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        await self.delegate.save_many(projections=projections)
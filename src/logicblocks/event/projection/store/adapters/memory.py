@@ -21,6 +21,10 @@ from logicblocks.event.types import (
     serialise_to_json_value,
 )
 
+from ..notifications import (
+    InMemoryProjectionNotificationHub,
+    projection_notifications,
+)
 from .base import ProjectionStorageAdapter
 
 
@@ -34,6 +38,7 @@ class InMemoryProjectionStorageAdapter[
             Query, ResultSetTransformer[Projection[JsonValue, JsonValue]]
         ]
         | None = None,
+        notifications: InMemoryProjectionNotificationHub | None = None,
     ):
         self._projections: dict[
             tuple[str, str], Projection[JsonValue, JsonValue]
@@ -47,6 +52,7 @@ class InMemoryProjectionStorageAdapter[
                 ]().with_default_converters()
             )
         )
+        self._notifications = notifications
 
     async def save(
         self,
@@ -70,6 +76,9 @@ class InMemoryProjectionStorageAdapter[
                 projection
             )
 
+        if self._notifications is not None:
+            self._notifications.publish(projection_notifications([projection]))
+
     async def _find_raw(
         self, query: Query
     ) -> Sequence[Projection[JsonValue, JsonValue]]:
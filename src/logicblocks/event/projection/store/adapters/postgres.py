@@ -1,4 +1,10 @@
-from collections.abc import Sequence
+import hashlib
+import json
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Self
+from uuid import uuid4
 
 from psycopg import AsyncConnection, AsyncCursor, sql
 from psycopg.rows import TupleRow, dict_row
@@ -21,29 +27,36 @@ from logicblocks.event.types import (
     serialise_projection,
 )
 
-from .base import ProjectionStorageAdapter
+from ..notifications import ProjectionNotification, projection_notifications
+from .base import ProjectionRebuild, ProjectionStorageAdapter
 
 
 def insert_query(
     projection: Projection[JsonValue, JsonValue],
     table_settings: postgres.TableSettings,
 ) -> postgres.ParameterisedQuery:
+    lock_clause, lock_params = lock_names_clause(
+        [projection.name], table_settings, shared=True
+    )
     return (
         sql.SQL(
             """
+            WITH lock AS (SELECT {1})
             INSERT INTO {0} (id,
                              name,
                              source,
                              state,
                              metadata)
-            VALUES (%s, %s, %s, %s, %s)
+            SELECT %s, %s, %s, %s, %s
+            FROM lock
             ON CONFLICT (name, id)
                 DO
             UPDATE
                 SET (state, metadata) = (%s, %s);
             """
-        ).format(sql.Identifier(table_settings.table_name)),
+        ).format(sql.Identifier(table_settings.table_name), lock_clause),
         [
+            *lock_params,
             projection.id,
             projection.name,
             Jsonb(projection.source.serialise()),
@@ -55,6 +68,266 @@ def insert_query(
     )
 
 
+def insert_many_query(
+    projections: Sequence[Projection[JsonValue, JsonValue]],
+    table_settings: postgres.TableSettings,
+) -> postgres.ParameterisedQuery:
+    lock_clause, lock_params = lock_names_clause(
+        [projection.name for projection in projections],
+        table_settings,
+        shared=True,
+    )
+    rows: list[sql.Composable] = []
+    params: list[int | str | Jsonb] = [*lock_params]
+
+    for projection in projections:
+        rows.append(sql.SQL("(%s, %s, %s, %s, %s)"))
+        params.extend(
+            [
+                projection.id,
+                projection.name,
+                Jsonb(projection.source.serialise()),
+                Jsonb(projection.state),
+                Jsonb(projection.metadata),
+            ]
+        )
+
+    return (
+        sql.SQL(
+            """
+            WITH lock AS (SELECT {2})
+            INSERT INTO {0} (id,
+                             name,
+                             source,
+                             state,
+                             metadata)
+            SELECT projection.*
+            FROM lock,
+                 (VALUES {1}) AS projection (id, name, source, state, metadata)
+            ON CONFLICT (name, id)
+                DO
+            UPDATE
+                SET (state, metadata) = (EXCLUDED.state, EXCLUDED.metadata);
+            """
+        ).format(
+            sql.Identifier(table_settings.table_name),
+            sql.SQL(", ").join(rows),
+            lock_clause,
+        ),
+        params,
+    )
+
+
+def name_lock_digest(name: str, table_settings: postgres.TableSettings) -> int:
+    lock_name = f"{table_settings.table_name}.{name}"
+    return (
+        int(hashlib.sha256(lock_name.encode("utf-8")).hexdigest(), 16) % 10**16
+    )
+
+
+def lock_names_clause(
+    names: Sequence[str],
+    table_settings: postgres.TableSettings,
+    *,
+    shared: bool,
+) -> tuple[sql.Composable, list[int]]:
+    lock_function = sql.SQL(
+        "pg_advisory_xact_lock_shared({0})"
+        if shared
+        else "pg_advisory_xact_lock({0})"
+    )
+    digests = sorted(
+        {name_lock_digest(name, table_settings) for name in names}
+    )
+    return (
+        sql.SQL(", ").join(
+            [lock_function.format(sql.Placeholder()) for _ in digests]
+        ),
+        digests,
+    )
+
+
+def lock_names_query(
+    names: Sequence[str],
+    table_settings: postgres.TableSettings,
+    *,
+    shared: bool,
+) -> postgres.ParameterisedQuery:
+    lock_clause, lock_params = lock_names_clause(
+        names, table_settings, shared=shared
+    )
+    return sql.SQL("SELECT {0};").format(lock_clause), lock_params
+
+
+def rebuild_table_name(table_settings: postgres.TableSettings) -> str:
+    return f"{table_settings.table_name}_rebuild_{uuid4().hex[:16]}"
+
+
+def create_rebuild_table_query(
+    rebuild_table_name: str,
+) -> postgres.ParameterisedQuery:
+    return (
+        sql.SQL(
+            """
+            CREATE UNLOGGED TABLE {0} (
+                ordinal BIGINT NOT NULL,
+                id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                source JSONB NOT NULL,
+                state JSONB NOT NULL,
+                metadata JSONB NOT NULL
+            );
+            """
+        ).format(sql.Identifier(rebuild_table_name)),
+        [],
+    )
+
+
+def copy_into_rebuild_table_query(rebuild_table_name: str) -> sql.Composed:
+    return sql.SQL(
+        """
+        COPY {0} (ordinal,
+                  id,
+                  name,
+                  source,
+                  state,
+                  metadata)
+        FROM STDIN (FORMAT BINARY);
+        """
+    ).format(sql.Identifier(rebuild_table_name))
+
+
+copy_rebuild_table_types = ["int8", "text", "text", "jsonb", "jsonb", "jsonb"]
+
+
+def swap_rebuild_table_queries(
+    name: str,
+    version: int,
+    rebuild_table_name: str,
+    table_settings: postgres.TableSettings,
+    version_table_settings: postgres.TableSettings,
+) -> Sequence[postgres.ParameterisedQuery]:
+    return [
+        (
+            sql.SQL(
+                """
+                DELETE
+                FROM {0} AS live
+                WHERE live.name = %s
+                  AND NOT EXISTS (SELECT 1
+                                  FROM {1} AS rebuilt
+                                  WHERE rebuilt.id = live.id);
+                """
+            ).format(
+                sql.Identifier(table_settings.table_name),
+                sql.Identifier(rebuild_table_name),
+            ),
+            [name],
+        ),
+        (
+            sql.SQL(
+                """
+                INSERT INTO {0} AS live (id,
+                                         name,
+                                         source,
+                                         state,
+                                         metadata)
+                SELECT DISTINCT ON (id) id,
+                                        name,
+                                        source,
+                                        state,
+                                        metadata
+                FROM {1}
+                ORDER BY id, ordinal DESC
+                ON CONFLICT (name, id)
+                    DO
+                UPDATE
+                    SET (source, state, metadata) = (
+                        EXCLUDED.source, EXCLUDED.state, EXCLUDED.metadata
+                    )
+                    WHERE (live.source, live.state, live.metadata)
+                        IS DISTINCT FROM
+                          (EXCLUDED.source, EXCLUDED.state, EXCLUDED.metadata);
+                """
+            ).format(
+                sql.Identifier(table_settings.table_name),
+                sql.Identifier(rebuild_table_name),
+            ),
+            [],
+        ),
+        (
+            sql.SQL(
+                """
+                INSERT INTO {0} (name, version, rebuilt_at)
+                VALUES (%s, %s, now())
+                ON CONFLICT (name)
+                    DO
+                UPDATE
+                    SET (version, rebuilt_at) = (
+                        EXCLUDED.version, EXCLUDED.rebuilt_at
+                    );
+                """
+            ).format(sql.Identifier(version_table_settings.table_name)),
+            [name, version],
+        ),
+        (
+            sql.SQL("DROP TABLE {0};").format(
+                sql.Identifier(rebuild_table_name)
+            ),
+            [],
+        ),
+    ]
+
+
+def drop_rebuild_table_query(
+    rebuild_table_name: str,
+) -> postgres.ParameterisedQuery:
+    return (
+        sql.SQL("DROP TABLE IF EXISTS {0};").format(
+            sql.Identifier(rebuild_table_name)
+        ),
+        [],
+    )
+
+
+def read_version_query(
+    name: str, version_table_settings: postgres.TableSettings
+) -> postgres.ParameterisedQuery:
+    return (
+        sql.SQL("SELECT version FROM {0} WHERE name = %s;").format(
+            sql.Identifier(version_table_settings.table_name)
+        ),
+        [name],
+    )
+
+
+def notify_query() -> sql.SQL:
+    return sql.SQL(
+        "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload;"
+    )
+
+
+async def notify(
+    cursor: AsyncCursor[TupleRow],
+    *,
+    channel: str | None,
+    notifications: Sequence[ProjectionNotification],
+) -> None:
+    if channel is None or not notifications:
+        return
+
+    await cursor.execute(
+        notify_query(),
+        [
+            channel,
+            [
+                json.dumps(notification.serialise())
+                for notification in notifications
+            ],
+        ],
+    )
+
+
 async def upsert(
     cursor: AsyncCursor[TupleRow],
     *,
@@ -64,6 +337,160 @@ async def upsert(
     await cursor.execute(*insert_query(projection, table_settings))
 
 
+async def upsert_many(
+    cursor: AsyncCursor[TupleRow],
+    *,
+    projections: Sequence[Projection[JsonValue, JsonValue]],
+    table_settings: postgres.TableSettings,
+):
+    if not projections:
+        return
+
+    latest = {
+        (projection.name, projection.id): projection
+        for projection in projections
+    }
+    await cursor.execute(
+        *insert_many_query(list(latest.values()), table_settings)
+    )
+
+
+class PostgresProjectionRebuild(ProjectionRebuild):
+    def __init__(
+        self,
+        *,
+        connection_pool: AsyncConnectionPool[AsyncConnection],
+        table_settings: postgres.TableSettings,
+        version_table_settings: postgres.TableSettings,
+        name: str,
+        version: int,
+        notification_channel: str | None = None,
+    ):
+        self.connection_pool = connection_pool
+        self.table_settings = table_settings
+        self.version_table_settings = version_table_settings
+        self.name = name
+        self.version = version
+        self.notification_channel = notification_channel
+        self.rebuild_table_name = rebuild_table_name(table_settings)
+        self._ordinal = 0
+        self._swapped = False
+        self._swap_connection: AsyncConnection | None = None
+
+    async def __aenter__(self) -> Self:
+        async with self.connection_pool.connection() as connection:
+            await connection.execute(
+                *create_rebuild_table_query(self.rebuild_table_name)
+            )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None and not self._swapped:
+            try:
+                async with self.swap():
+                    pass
+            except BaseException:
+                await self._drop()
+                raise
+        elif exc_type is not None:
+            await self._drop()
+
+    @asynccontextmanager
+    async def swap(self) -> AsyncIterator[None]:
+        # note: the swap runs in a single transaction so readers see either
+        #       every projection from the old version or every projection
+        #       from the rebuilt one, never a mixture. It holds the name's
+        #       lock exclusively from entry, so saves to the name made while
+        #       it is held wait and then apply on top of the rebuilt
+        #       projections, and projections saved to the rebuild inside it
+        #       are written in the same transaction.
+        async with self.connection_pool.connection() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(
+                    *lock_names_query(
+                        [self.name], self.table_settings, shared=False
+                    )
+                )
+                self._swap_connection = connection
+                try:
+                    yield
+                finally:
+                    self._swap_connection = None
+                for query in swap_rebuild_table_queries(
+                    self.name,
+                    self.version,
+                    self.rebuild_table_name,
+                    self.table_settings,
+                    self.version_table_settings,
+                ):
+                    await cursor.execute(*query)
+                await notify(
+                    cursor,
+                    channel=self.notification_channel,
+                    notifications=[ProjectionNotification(name=self.name)],
+                )
+        self._swapped = True
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        for projection in projections:
+            if projection.name != self.name:
+                raise ValueError(
+                    f"Cannot save projection with name '{projection.name}' "
+                    f"to rebuild of projection '{self.name}'."
+                )
+        if self._swapped:
+            raise ValueError(
+                f"Cannot save projections to rebuild of projection "
+                f"'{self.name}' after it has been swapped in."
+            )
+
+        if self._swap_connection is not None:
+            await self._copy(self._swap_connection, projections)
+            return
+
+        async with self.connection_pool.connection() as connection:
+            await self._copy(connection, projections)
+
+    async def _drop(self) -> None:
+        async with self.connection_pool.connection() as connection:
+            await connection.execute(
+                *drop_rebuild_table_query(self.rebuild_table_name)
+            )
+
+    async def _copy(
+        self,
+        connection: AsyncConnection,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        async with connection.cursor() as cursor:
+            async with cursor.copy(
+                copy_into_rebuild_table_query(self.rebuild_table_name)
+            ) as copy:
+                copy.set_types(copy_rebuild_table_types)
+                for projection in projections:
+                    serialised = serialise_projection(projection)
+                    await copy.write_row(
+                        (
+                            self._ordinal,
+                            serialised.id,
+                            serialised.name,
+                            Jsonb(serialised.source.serialise()),
+                            Jsonb(serialised.state),
+                            Jsonb(serialised.metadata),
+                        )
+                    )
+                    self._ordinal += 1
+
+
 class PostgresProjectionStorageAdapter[
     ItemQuery: Query = Lookup,
     CollectionQuery: Query = Search,
@@ -75,7 +502,11 @@ class PostgresProjectionStorageAdapter[
         table_settings: postgres.TableSettings = postgres.TableSettings(
             table_name="projections"
         ),
+        version_table_settings: postgres.TableSettings = (
+            postgres.TableSettings(table_name="projection_versions")
+        ),
         query_converter: postgres.QueryConverter | None = None,
+        notification_channel: str | None = None,
     ):
         if isinstance(connection_source, postgres.ConnectionSettings):
             self._connection_pool_owner = True
@@ -87,6 +518,8 @@ class PostgresProjectionStorageAdapter[
             self.connection_pool = connection_source
 
         self.table_settings = table_settings
+        self.version_table_settings = version_table_settings
+        self.notification_channel = notification_channel
         self.query_converter = (
             query_converter
             if query_converter is not None
@@ -105,6 +538,25 @@ class PostgresProjectionStorageAdapter[
         if self._connection_pool_owner:
             await self.connection_pool.close()
 
+    async def version(self, *, name: str) -> int | None:
+        async with self.connection_pool.connection() as connection:
+            async with connection.cursor() as cursor:
+                results = await cursor.execute(
+                    *read_version_query(name, self.version_table_settings)
+                )
+                row = await results.fetchone()
+                return row[0] if row is not None else None
+
+    def rebuild(self, *, name: str, version: int) -> PostgresProjectionRebuild:
+        return PostgresProjectionRebuild(
+            connection_pool=self.connection_pool,
+            table_settings=self.table_settings,
+            version_table_settings=self.version_table_settings,
+            name=name,
+            version=version,
+            notification_channel=self.notification_channel,
+        )
+
     async def save(
         self,
         *,
@@ -117,6 +569,35 @@ class PostgresProjectionStorageAdapter[
                     projection=serialise_projection(projection),
                     table_settings=self.table_settings,
                 )
+                await notify(
+                    cursor,
+                    channel=self.notification_channel,
+                    notifications=projection_notifications([projection]),
+                )
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        if not projections:
+            return
+
+        async with self.connection_pool.connection() as connection:
+            async with connection.cursor() as cursor:
+                await upsert_many(
+                    cursor,
+                    projections=[
+                        serialise_projection(projection)
+                        for projection in projections
+                    ],
+                    table_settings=self.table_settings,
+                )
+                await notify(
+                    cursor,
+                    channel=self.notification_channel,
+                    notifications=projection_notifications(projections),
+                )
 
     async def find_one[
         State: JsonPersistable = JsonValue,
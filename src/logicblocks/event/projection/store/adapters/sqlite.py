@@ -0,0 +1,288 @@
+import json
+import sqlite3
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from logicblocks.event.persistence import sqlite
+from logicblocks.event.persistence.memory import (
+    DelegatingQueryConverter,
+    ResultSet,
+    ResultSetTransformer,
+)
+from logicblocks.event.query import (
+    FilterClause,
+    Lookup,
+    Operator,
+    Query,
+    Search,
+)
+from logicblocks.event.types import (
+    Converter,
+    EventSourceIdentifier,
+    JsonPersistable,
+    JsonValue,
+    JsonValueType,
+    Projection,
+    deserialise_projection,
+    identifier,
+    serialise_projection,
+)
+
+from .base import ProjectionStorageAdapter
+
+type ProjectionRow = tuple[str, str, str, str, str]
+
+projection_columns = "id, name, source, state, metadata"
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=64)
+def create_table_statement(table_name: str) -> str:
+    return f"""
+        CREATE TABLE IF NOT EXISTS {quote_identifier(table_name)} (
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            state TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            PRIMARY KEY (name, id)
+        )
+        """
+
+
+@lru_cache(maxsize=64)
+def create_source_index_statement(table_name: str) -> str:
+    return (
+        f"CREATE INDEX IF NOT EXISTS "
+        f"{quote_identifier(f'{table_name}_source_index')} "
+        f"ON {quote_identifier(table_name)} (source, name)"
+    )
+
+
+@lru_cache(maxsize=64)
+def upsert_statement(table_name: str) -> str:
+    return (
+        f"INSERT INTO {quote_identifier(table_name)} ({projection_columns}) "
+        f"VALUES (?, ?, ?, ?, ?) "
+        f"ON CONFLICT (name, id) DO UPDATE "
+        f"SET state = excluded.state, metadata = excluded.metadata"
+    )
+
+
+@lru_cache(maxsize=256)
+def select_statement(table_name: str, conditions: tuple[str, ...]) -> str:
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return (
+        f"SELECT {projection_columns} "
+        f"FROM {quote_identifier(table_name)}{where}"
+    )
+
+
+def projection_row(
+    projection: Projection[JsonValue, JsonValue],
+) -> ProjectionRow:
+    return (
+        projection.id,
+        projection.name,
+        json.dumps(projection.source.serialise()),
+        json.dumps(projection.state),
+        json.dumps(projection.metadata),
+    )
+
+
+def row_projection(row: ProjectionRow) -> Projection[JsonValue, JsonValue]:
+    id, name, source, state, metadata = row
+    return Projection[JsonValue, JsonValue](
+        id=id,
+        name=name,
+        source=identifier.event_sequence_identifier(json.loads(source)),
+        state=json.loads(state),
+        metadata=json.loads(metadata),
+    )
+
+
+def prefilter(query: Query) -> tuple[tuple[str, ...], Sequence[Any]]:
+    match query:
+        case Lookup(filters=filters) | Search(filters=filters):
+            pass
+        case _:
+            return (), []
+
+    # note: sources are stored serialised exactly as projection_row does,
+    #       so an equality filter on a source identifier can match the
+    #       stored text directly.
+    conditions: list[str] = []
+    params: list[Any] = []
+    for clause in filters:
+        if not isinstance(clause, FilterClause) or clause.field.is_nested():
+            continue
+        match clause.field.top_level, clause.operator, clause.value:
+            case ("id" | "name") as column, Operator.EQUAL, str(value):
+                conditions.append(f"{column} = ?")
+                params.append(value)
+            case "source", Operator.EQUAL, EventSourceIdentifier() as value:
+                conditions.append("source = ?")
+                params.append(json.dumps(value.serialise()))
+            case _:
+                continue
+
+    return tuple(conditions), params
+
+
+class SqliteProjectionStorageAdapter[
+    ItemQuery: Query = Lookup,
+    CollectionQuery: Query = Search,
+](ProjectionStorageAdapter[ItemQuery, CollectionQuery]):
+    def __init__(
+        self,
+        *,
+        connection_source: sqlite.ConnectionSource,
+        table_settings: sqlite.TableSettings = sqlite.TableSettings(
+            table_name="projections"
+        ),
+        query_converter: Converter[
+            Query, ResultSetTransformer[Projection[JsonValue, JsonValue]]
+        ]
+        | None = None,
+    ):
+        if isinstance(connection_source, sqlite.ConnectionSettings):
+            self._connection_owner = True
+            self.connection = sqlite.Connection(connection_source)
+        else:
+            self._connection_owner = False
+            self.connection = connection_source
+
+        self.table_settings = table_settings
+        self.query_converter = (
+            query_converter
+            if query_converter is not None
+            else (
+                DelegatingQueryConverter[
+                    Projection[JsonValue, JsonValue]
+                ]().with_default_converters()
+            )
+        )
+        self._table_created = False
+
+    async def close(self) -> None:
+        if self._connection_owner:
+            await self.connection.close()
+
+    def _create_table(self, connection: sqlite3.Connection) -> None:
+        if not self._table_created:
+            connection.execute(
+                create_table_statement(self.table_settings.table_name)
+            )
+            connection.execute(
+                create_source_index_statement(self.table_settings.table_name)
+            )
+            self._table_created = True
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        projections: Sequence[Projection[JsonValue, JsonValue]],
+    ) -> None:
+        self._create_table(connection)
+        latest = {
+            (projection.name, projection.id): projection
+            for projection in projections
+        }
+        with sqlite.transaction(connection):
+            connection.executemany(
+                upsert_statement(self.table_settings.table_name),
+                [projection_row(projection) for projection in latest.values()],
+            )
+
+    def _select(
+        self, connection: sqlite3.Connection, query: Query
+    ) -> Sequence[ProjectionRow]:
+        self._create_table(connection)
+        conditions, params = prefilter(query)
+        return connection.execute(
+            select_statement(self.table_settings.table_name, conditions),
+            params,
+        ).fetchall()
+
+    async def save(
+        self,
+        *,
+        projection: Projection[JsonPersistable, JsonPersistable],
+    ) -> None:
+        serialised = serialise_projection(projection)
+        await self.connection.run(
+            lambda connection: self._upsert(connection, [serialised])
+        )
+
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        if not projections:
+            return
+
+        serialised = [
+            serialise_projection(projection) for projection in projections
+        ]
+        await self.connection.run(
+            lambda connection: self._upsert(connection, serialised)
+        )
+
+    async def _find_raw(
+        self, query: Query
+    ) -> Sequence[Projection[JsonValue, JsonValue]]:
+        rows = await self.connection.run(
+            lambda connection: self._select(connection, query)
+        )
+        transformer = self.query_converter.convert(query)
+        result_set = transformer(
+            ResultSet[Projection[JsonValue, JsonValue]].of(
+                *(row_projection(row) for row in rows)
+            )
+        )
+
+        return result_set.records
+
+    async def find_one[
+        State: JsonPersistable = JsonValue,
+        Metadata: JsonPersistable = JsonValue,
+    ](
+        self,
+        *,
+        lookup: ItemQuery,
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+    ) -> Projection[State, Metadata] | None:
+        projections = await self._find_raw(lookup)
+
+        if len(projections) > 1:
+            raise ValueError(
+                f"Expected single projection for query: {lookup} "
+                f"but found {len(projections)} projections: {projections}."
+            )
+        if len(projections) == 0:
+            return None
+
+        return deserialise_projection(
+            projections[0], state_type, metadata_type
+        )
+
+    async def find_many[
+        State: JsonPersistable = JsonValue,
+        Metadata: JsonPersistable = JsonValue,
+    ](
+        self,
+        *,
+        search: CollectionQuery,
+        state_type: type[State] = JsonValueType,
+        metadata_type: type[Metadata] = JsonValueType,
+    ) -> Sequence[Projection[State, Metadata]]:
+        return [
+            deserialise_projection(projection, state_type, metadata_type)
+            for projection in (await self._find_raw(search))
+        ]
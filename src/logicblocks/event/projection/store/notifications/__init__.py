@@ -0,0 +1,15 @@
+from .base import (
+    ProjectionNotification,
+    ProjectionNotificationSource,
+    projection_notifications,
+)
+from .memory import InMemoryProjectionNotificationHub
+from .postgres import PostgresProjectionNotificationSource
+
+__all__ = [
+    "InMemoryProjectionNotificationHub",
+    "PostgresProjectionNotificationSource",
+    "ProjectionNotification",
+    "ProjectionNotificationSource",
+    "projection_notifications",
+]
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any, Self
+
+from logicblocks.event.types import (
+    JsonValue,
+    JsonValueConvertible,
+    Projection,
+    default_deserialisation_fallback,
+    default_serialisation_fallback,
+    is_json_object,
+)
+
+
+@dataclass(frozen=True)
+class ProjectionNotification(JsonValueConvertible):
+    name: str
+    id: str | None = None
+
+    @classmethod
+    def deserialise(
+        cls,
+        value: JsonValue,
+        fallback: Callable[
+            [Any, JsonValue], Any
+        ] = default_deserialisation_fallback,
+    ) -> Self:
+        if not is_json_object(value):
+            return fallback(cls, value)
+
+        name = value.get("name")
+        id = value.get("id")
+        if not isinstance(name, str) or not (
+            id is None or isinstance(id, str)
+        ):
+            return fallback(cls, value)
+
+        return cls(name, id)
+
+    def serialise(
+        self,
+        fallback: Callable[
+            [object], JsonValue
+        ] = default_serialisation_fallback,
+    ) -> JsonValue:
+        return {"name": self.name, "id": self.id}
+
+    def affects(self, *, name: str, id: str) -> bool:
+        return name == self.name and (self.id is None or id == self.id)
+
+
+def projection_notifications(
+    projections: Iterable[Projection[Any, Any]],
+) -> Sequence[ProjectionNotification]:
+    return [
+        ProjectionNotification(name=name, id=id)
+        for name, id in dict.fromkeys(
+            (projection.name, projection.id) for projection in projections
+        )
+    ]
+
+
+class ProjectionNotificationSource(ABC):
+    @abstractmethod
+    def listen(
+        self,
+    ) -> AbstractAsyncContextManager[AsyncIterator[ProjectionNotification]]:
+        raise NotImplementedError
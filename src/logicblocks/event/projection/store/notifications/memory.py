@@ -0,0 +1,33 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+from .base import ProjectionNotification, ProjectionNotificationSource
+
+
+class InMemoryProjectionNotificationHub(ProjectionNotificationSource):
+    def __init__(self):
+        self._queues: set[asyncio.Queue[ProjectionNotification]] = set()
+
+    def publish(self, notifications: Sequence[ProjectionNotification]) -> None:
+        for queue in self._queues:
+            for notification in notifications:
+                queue.put_nowait(notification)
+
+    @asynccontextmanager
+    async def listen(
+        self,
+    ) -> AsyncGenerator[AsyncIterator[ProjectionNotification]]:
+        queue = asyncio.Queue[ProjectionNotification]()
+        self._queues.add(queue)
+        try:
+            yield self._receive(queue)
+        finally:
+            self._queues.discard(queue)
+
+    @staticmethod
+    async def _receive(
+        queue: asyncio.Queue[ProjectionNotification],
+    ) -> AsyncIterator[ProjectionNotification]:
+        while True:
+            yield await queue.get()
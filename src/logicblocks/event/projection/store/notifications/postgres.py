@@ -0,0 +1,45 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+
+from psycopg import AsyncConnection, sql
+
+from logicblocks.event.persistence.postgres import ConnectionSettings
+
+from .base import ProjectionNotification, ProjectionNotificationSource
+
+
+class PostgresProjectionNotificationSource(ProjectionNotificationSource):
+    def __init__(
+        self,
+        *,
+        connection_settings: ConnectionSettings,
+        channel: str,
+    ):
+        self.connection_settings = connection_settings
+        self.channel = channel
+
+    @asynccontextmanager
+    async def listen(
+        self,
+    ) -> AsyncGenerator[AsyncIterator[ProjectionNotification]]:
+        async with await AsyncConnection.connect(
+            self.connection_settings.to_connection_string(), autocommit=True
+        ) as connection:
+            await connection.execute(
+                sql.SQL("LISTEN {0}").format(sql.Identifier(self.channel))
+            )
+            notifications = self._receive(connection)
+            try:
+                yield notifications
+            finally:
+                await notifications.aclose()
+
+    @staticmethod
+    async def _receive(
+        connection: AsyncConnection,
+    ) -> AsyncGenerator[ProjectionNotification]:
+        async for notify in connection.notifies():
+            yield ProjectionNotification.deserialise(
+                json.loads(notify.payload)
+            )
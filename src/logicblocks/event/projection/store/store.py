@@ -23,7 +23,7 @@ from logicblocks.event.types import (
 )
 
 from ..logger import default_logger
-from .adapters import ProjectionStorageAdapter
+from .adapters import ProjectionRebuild, ProjectionStorageAdapter
 
 
 def log_event_name(event: str) -> str:
@@ -61,6 +61,27 @@ class ProjectionStore:
                 ),
             )
 
+    async def save_many(
+        self,
+        *,
+        projections: Sequence[Projection[JsonPersistable, JsonPersistable]],
+    ) -> None:
+        await self._adapter.save_many(projections=projections)
+
+        await self._logger.ainfo(
+            log_event_name("saved-many"),
+            projections=[
+                projection.summarise(fallback=str_serialisation_fallback)
+                for projection in projections
+            ],
+        )
+
+    async def version(self, *, name: str) -> int | None:
+        return await self._adapter.version(name=name)
+
+    def rebuild(self, *, name: str, version: int) -> ProjectionRebuild:
+        return self._adapter.rebuild(name=name, version=version)
+
     async def locate[
         State: JsonPersistable = JsonValue,
         Metadata: JsonPersistable = JsonValue,
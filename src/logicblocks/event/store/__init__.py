@@ -1,10 +1,19 @@
 from . import conditions, constraints
 from .adapters import (
     EventStorageAdapter,
+    FileEventStorageAdapter,
     InMemoryEventStorageAdapter,
     PostgresEventStorageAdapter,
+    SqliteEventStorageAdapter,
 )
 from .exceptions import UnmetWriteConditionError
+from .heads import EventHeadTracker
+from .notifications import (
+    EventNotification,
+    EventNotificationSource,
+    InMemoryEventNotificationHub,
+    PostgresEventNotificationSource,
+)
 from .store import (
     EventCategory,
     EventLog,
@@ -23,13 +32,20 @@ from .types import StreamPublishDefinition, stream_publish_definition
 
 __all__ = [
     "EventCategory",
+    "EventHeadTracker",
     "EventLog",
+    "EventNotification",
+    "EventNotificationSource",
     "EventSource",
     "EventStore",
     "EventStorageAdapter",
     "EventStream",
+    "FileEventStorageAdapter",
+    "InMemoryEventNotificationHub",
     "InMemoryEventStorageAdapter",
+    "PostgresEventNotificationSource",
     "PostgresEventStorageAdapter",
+    "SqliteEventStorageAdapter",
     "StreamPublishDefinition",
     "UnmetWriteConditionError",
     "conditions",
@@ -2,16 +2,29 @@ from .base import (
     AnyEventSerialisationGuarantee,
     EventSerialisationGuarantee,
     EventStorageAdapter,
+    StripedEventSerialisationGuarantee,
 )
-from .memory import InMemoryEventStorageAdapter
+from .file import FileEventStorageAdapter
+from .memory import InMemoryEventStorageAdapter, InMemoryStorageMode
+from .postgres import GroupCommitSettings as PostgresGroupCommitSettings
 from .postgres import PostgresEventStorageAdapter
 from .postgres import QuerySettings as PostgresQuerySettings
+from .postgres import ScanMode as PostgresScanMode
+from .postgres import ScanOrdering as PostgresScanOrdering
+from .sqlite import SqliteEventStorageAdapter
 
 __all__ = [
     "EventStorageAdapter",
     "EventSerialisationGuarantee",
     "AnyEventSerialisationGuarantee",
+    "FileEventStorageAdapter",
     "InMemoryEventStorageAdapter",
+    "InMemoryStorageMode",
     "PostgresEventStorageAdapter",
+    "PostgresGroupCommitSettings",
     "PostgresQuerySettings",
+    "PostgresScanMode",
+    "PostgresScanOrdering",
+    "SqliteEventStorageAdapter",
+    "StripedEventSerialisationGuarantee",
 ]
@@ -1,3 +1,4 @@
+import zlib
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Mapping, Sequence, Set
 from typing import overload
@@ -39,6 +40,7 @@ type AnyEventSerialisationGuarantee = (
     LogEventSerialisationGuarantee
     | CategoryEventSerialisationGuarantee
     | StreamEventSerialisationGuarantee
+    | StripedEventSerialisationGuarantee
 )
 
 
@@ -71,12 +73,54 @@ class StreamEventSerialisationGuarantee(
         return f"{namespace}.{target.category}.{target.stream}"
 
 
+class StripedEventSerialisationGuarantee(
+    EventSerialisationGuarantee[StreamIdentifier]
+):
+    def __init__(self, stripes: int = 64):
+        if stripes < 1:
+            raise ValueError("Stripes must be at least 1.")
+
+        self.stripes = stripes
+        self._lock_names: dict[str, Sequence[str]] = {}
+
+    def stripe(self, target: StreamIdentifier) -> int:
+        key = f"{target.category}.{target.stream}".encode("utf-8")
+        return zlib.crc32(key) % self.stripes
+
+    def lock_name(self, namespace: str, target: StreamIdentifier) -> str:
+        lock_names = self._lock_names.get(namespace, None)
+        if lock_names is None:
+            lock_names = [
+                f"{namespace}.stripe.{stripe}"
+                for stripe in range(self.stripes)
+            ]
+            self._lock_names[namespace] = lock_names
+
+        return lock_names[self.stripe(target)]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, StripedEventSerialisationGuarantee)
+            and other.stripes == self.stripes
+        )
+
+    def __hash__(self) -> int:
+        return hash((StripedEventSerialisationGuarantee, self.stripes))
+
+    def __repr__(self) -> str:
+        return f"StripedEventSerialisationGuarantee(stripes={self.stripes})"
+
+
 EventSerialisationGuarantee.LOG = LogEventSerialisationGuarantee()
 EventSerialisationGuarantee.CATEGORY = CategoryEventSerialisationGuarantee()
 EventSerialisationGuarantee.STREAM = StreamEventSerialisationGuarantee()
 
 
 class EventStorageAdapter(ABC):
+    @property
+    def scans_in_sequence_order(self) -> bool:
+        return True
+
     @overload
     @abstractmethod
     async def save[Name: StringPersistable, Payload: JsonPersistable](
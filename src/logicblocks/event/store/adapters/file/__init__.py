@@ -0,0 +1,5 @@
+from .adapter import FileEventStorageAdapter as FileEventStorageAdapter
+
+__all__ = [
+    "FileEventStorageAdapter",
+]
@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+from typing import Any
+
+from logicblocks.event.types import Converter
+
+from ...conditions import WriteCondition
+from ...constraints import QueryConstraint
+from ...notifications import InMemoryEventNotificationHub
+from ..base import EventSerialisationGuarantee
+from ..memory.adapter import InMemoryEventStorageAdapter
+from ..memory.converters import WriteConditionEnforcer
+from ..memory.db import InMemoryEventsDB
+from ..memory.records import StorageMode
+from ..memory.types import QueryConstraintCheck
+from .segments import DEFAULT_SEGMENT_SIZE, SegmentEventRecords
+
+
+class FileEventStorageAdapter(InMemoryEventStorageAdapter):
+    def __init__(
+        self,
+        *,
+        directory: str | os.PathLike[str],
+        serialisation_guarantee: EventSerialisationGuarantee[
+            Any
+        ] = EventSerialisationGuarantee.LOG,
+        constraint_converter: Converter[QueryConstraint, QueryConstraintCheck]
+        | None = None,
+        condition_converter: Converter[WriteCondition, WriteConditionEnforcer]
+        | None = None,
+        notifications: InMemoryEventNotificationHub | None = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        fsync: bool = True,
+    ):
+        self._records = SegmentEventRecords(
+            Path(directory), segment_size=segment_size, fsync=fsync
+        )
+        super().__init__(
+            serialisation_guarantee=serialisation_guarantee,
+            constraint_converter=constraint_converter,
+            condition_converter=condition_converter,
+            notifications=notifications,
+        )
+
+    def _create_db(self, storage_mode: StorageMode) -> InMemoryEventsDB:
+        return InMemoryEventsDB(
+            constraint_converter=self._constraint_converter,
+            records=self._records,
+        )
+
+    def close(self) -> None:
+        self._records.close()
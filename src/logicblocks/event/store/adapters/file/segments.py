@@ -0,0 +1,446 @@
+import asyncio
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from logicblocks.event.types import JsonValue, StoredEvent
+
+from ..memory.records import (
+    CategoryKey,
+    EventIndexDict,
+    EventRecords,
+    StreamKey,
+    StringTable,
+)
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+KEY_HEADER = struct.Struct("<I")
+LOG_INDEX_ENTRY = struct.Struct("<IQIq")
+CATEGORY_INDEX_ENTRY = struct.Struct("<IQ")
+STREAM_INDEX_ENTRY = struct.Struct("<IIQ")
+COMMIT_ENTRY = struct.Struct("<Q")
+
+KEYS_FILE_NAME = "keys"
+LOG_INDEX_FILE_NAME = "log.index"
+CATEGORY_INDEX_FILE_NAME = "category.index"
+STREAM_INDEX_FILE_NAME = "stream.index"
+COMMITS_FILE_NAME = "commits"
+LOCK_FILE_NAME = "lock"
+SEGMENT_FILE_SUFFIX = ".segment"
+
+
+def encode_event(event: StoredEvent[str, JsonValue]) -> bytes:
+    return json.dumps(event.serialise(), separators=(",", ":")).encode()
+
+
+def decode_event(data: bytes | memoryview) -> StoredEvent[str, JsonValue]:
+    value = json.loads(str(data, "utf-8"))
+    return StoredEvent[str, JsonValue](
+        id=value["id"],
+        name=value["name"],
+        stream=value["stream"],
+        category=value["category"],
+        position=value["position"],
+        sequence_number=value["sequence_number"],
+        payload=value["payload"],
+        observed_at=datetime.fromisoformat(value["observed_at"]),
+        occurred_at=datetime.fromisoformat(value["occurred_at"]),
+    )
+
+
+def read_file(path: Path) -> bytes:
+    return path.read_bytes() if path.exists() else b""
+
+
+def whole_entries(data: bytes, entry: struct.Struct) -> bytes:
+    return data[: len(data) - len(data) % entry.size]
+
+
+def truncate_file(path: Path, size: int) -> None:
+    with open(path, "ab") as file:
+        file.truncate(size)
+
+
+class SegmentEventRecords(EventRecords):
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        fsync: bool = True,
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self._directory = directory
+        self._segment_size = segment_size
+        self._fsync = fsync
+
+        self._lock_file = open(directory / LOCK_FILE_NAME, "ab")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._lock_file.close()
+            raise ValueError(
+                f"Event store directory {directory} is already in use."
+            )
+
+        self._keys = StringTable()
+        self._segments = array("I")
+        self._offsets = array("q")
+        self._lengths = array("I")
+        self._sequence_numbers = array("q")
+        self._category_index: EventIndexDict[CategoryKey] = {}
+        self._stream_index: EventIndexDict[StreamKey] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+
+        self._segment_id, self._segment_offset = self._recover()
+
+        self._keys_file = open(directory / KEYS_FILE_NAME, "ab")
+        self._log_index_file = open(directory / LOG_INDEX_FILE_NAME, "ab")
+        self._category_index_file = open(
+            directory / CATEGORY_INDEX_FILE_NAME, "ab"
+        )
+        self._stream_index_file = open(
+            directory / STREAM_INDEX_FILE_NAME, "ab"
+        )
+        self._commits_file = open(directory / COMMITS_FILE_NAME, "ab")
+        self._segment_file = open(self._segment_path(self._segment_id), "ab")
+        self._sealed_segment_files: list[BinaryIO] = []
+        self._directory_changed = True
+
+        self._write_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._committed_length = len(self._sequence_numbers)
+        self._synced_length = self._committed_length
+
+    def __len__(self) -> int:
+        return len(self._sequence_numbers)
+
+    def __getitem__(self, position: int) -> StoredEvent[str, JsonValue]:
+        if position >= self._synced_length:
+            self._flush_segments()
+
+        offset = self._offsets[position]
+        end = offset + self._lengths[position]
+        segment_map = self._segment_map(self._segments[position], end)
+
+        # note: the record is decoded straight out of the mapping through a
+        #       memoryview; the views are released before returning so the
+        #       mapping can be closed when it is later replaced.
+        with memoryview(segment_map) as view, view[offset:end] as record:
+            return decode_event(record)
+
+    def append(self, event: StoredEvent[str, JsonValue]) -> int:
+        data = encode_event(event)
+
+        with self._write_lock:
+            if (
+                self._segment_offset > 0
+                and self._segment_offset + len(data) > self._segment_size
+            ):
+                self._roll_segment()
+
+            position = len(self._sequence_numbers)
+            category_code = self._key_code(event.category)
+            stream_code = self._key_code(event.stream)
+
+            self._segment_file.write(data)
+            self._log_index_file.write(
+                LOG_INDEX_ENTRY.pack(
+                    self._segment_id,
+                    self._segment_offset,
+                    len(data),
+                    event.sequence_number,
+                )
+            )
+            self._category_index_file.write(
+                CATEGORY_INDEX_ENTRY.pack(category_code, position)
+            )
+            self._stream_index_file.write(
+                STREAM_INDEX_ENTRY.pack(category_code, stream_code, position)
+            )
+
+            self._segments.append(self._segment_id)
+            self._offsets.append(self._segment_offset)
+            self._lengths.append(len(data))
+            self._sequence_numbers.append(event.sequence_number)
+            self._segment_offset += len(data)
+
+            return position
+
+    def commit(self) -> None:
+        with self._write_lock:
+            length = len(self._sequence_numbers)
+            if length > self._committed_length:
+                self._commits_file.write(COMMIT_ENTRY.pack(length))
+                self._committed_length = length
+
+    def sequence_number_at(self, position: int) -> int:
+        return self._sequence_numbers[position]
+
+    def position_after(self, sequence_number: int, end: int) -> int:
+        return bisect_right(self._sequence_numbers, sequence_number, hi=end)
+
+    def visible_length(self) -> int:
+        return self._synced_length
+
+    def load_indexes(
+        self,
+    ) -> tuple[EventIndexDict[CategoryKey], EventIndexDict[StreamKey]]:
+        indexes = self._category_index, self._stream_index
+        self._category_index, self._stream_index = {}, {}
+        return indexes
+
+    async def sync(self) -> None:
+        length = self._committed_length
+        if self._synced_length >= length:
+            return
+        await asyncio.to_thread(self._sync_to, length)
+
+    def close(self) -> None:
+        self._sync_to(self._committed_length)
+        with self._write_lock:
+            for file in (
+                self._keys_file,
+                self._log_index_file,
+                self._category_index_file,
+                self._stream_index_file,
+                self._commits_file,
+                self._segment_file,
+            ):
+                file.close()
+            for segment_map in self._maps.values():
+                segment_map.close()
+            self._maps.clear()
+            self._lock_file.close()
+
+    def _sync_to(self, length: int) -> None:
+        # note: callers queue on the sync lock while a sync is in flight, so
+        #       a single fsync covers every append made before it started
+        #       and later callers usually find their appends already synced.
+        with self._sync_lock:
+            if self._synced_length >= length:
+                return
+
+            with self._write_lock:
+                sealed_segment_files = self._sealed_segment_files
+                self._sealed_segment_files = []
+                directory_changed = self._directory_changed
+                self._directory_changed = False
+                files = [
+                    self._keys_file,
+                    *sealed_segment_files,
+                    self._segment_file,
+                    self._log_index_file,
+                    self._category_index_file,
+                    self._stream_index_file,
+                    self._commits_file,
+                ]
+                for file in files:
+                    file.flush()
+                target = self._committed_length
+
+            if self._fsync:
+                for file in files:
+                    os.fsync(file.fileno())
+                if directory_changed:
+                    self._sync_directory()
+
+            for file in sealed_segment_files:
+                file.close()
+
+            self._synced_length = target
+
+    def _sync_directory(self) -> None:
+        descriptor = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _flush_segments(self) -> None:
+        with self._write_lock:
+            for file in [*self._sealed_segment_files, self._segment_file]:
+                file.flush()
+
+    def _roll_segment(self) -> None:
+        self._sealed_segment_files.append(self._segment_file)
+        self._segment_id += 1
+        self._segment_offset = 0
+        self._segment_file = open(self._segment_path(self._segment_id), "ab")
+        self._directory_changed = True
+
+    def _key_code(self, key: str) -> int:
+        count = len(self._keys)
+        code = self._keys.code(key)
+        if code == count:
+            data = key.encode()
+            self._keys_file.write(KEY_HEADER.pack(len(data)) + data)
+        return code
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"{segment:08d}{SEGMENT_FILE_SUFFIX}"
+
+    def _segment_map(self, segment: int, end: int) -> mmap.mmap:
+        segment_map = self._maps.get(segment, None)
+        if segment_map is None or len(segment_map) < end:
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._segment_path(segment), "rb") as file:
+                segment_map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            self._maps[segment] = segment_map
+        return segment_map
+
+    def _recover(self) -> tuple[int, int]:
+        # note: appends that were never synced may have reached some files
+        #       but not others; recovery keeps the longest prefix of whole
+        #       batches that is present in every file and has a commit
+        #       record, and truncates the rest.
+        keys_end = self._recover_keys()
+
+        segment_sizes: dict[int, int] = {}
+
+        def segment_size(segment: int) -> int:
+            if segment not in segment_sizes:
+                path = self._segment_path(segment)
+                segment_sizes[segment] = (
+                    path.stat().st_size if path.exists() else 0
+                )
+            return segment_sizes[segment]
+
+        for (
+            segment,
+            offset,
+            length,
+            sequence_number,
+        ) in LOG_INDEX_ENTRY.iter_unpack(
+            whole_entries(
+                read_file(self._directory / LOG_INDEX_FILE_NAME),
+                LOG_INDEX_ENTRY,
+            )
+        ):
+            if offset + length > segment_size(segment):
+                break
+            self._segments.append(segment)
+            self._offsets.append(offset)
+            self._lengths.append(length)
+            self._sequence_numbers.append(sequence_number)
+
+        category_codes: list[int] = []
+        for category_code, position in CATEGORY_INDEX_ENTRY.iter_unpack(
+            whole_entries(
+                read_file(self._directory / CATEGORY_INDEX_FILE_NAME),
+                CATEGORY_INDEX_ENTRY,
+            )
+        ):
+            if position != len(category_codes) or category_code >= len(
+                self._keys
+            ):
+                break
+            category_codes.append(category_code)
+
+        stream_codes: list[int] = []
+        for (
+            category_code,
+            stream_code,
+            position,
+        ) in STREAM_INDEX_ENTRY.iter_unpack(
+            whole_entries(
+                read_file(self._directory / STREAM_INDEX_FILE_NAME),
+                STREAM_INDEX_ENTRY,
+            )
+        ):
+            if (
+                position != len(stream_codes)
+                or position >= len(category_codes)
+                or category_code != category_codes[position]
+                or stream_code >= len(self._keys)
+            ):
+                break
+            stream_codes.append(stream_code)
+
+        length = self._recover_commits(
+            min(len(self._sequence_numbers), len(stream_codes))
+        )
+        for column in (
+            self._segments,
+            self._offsets,
+            self._lengths,
+            self._sequence_numbers,
+        ):
+            del column[length:]
+
+        for position in range(length):
+            category = self._keys.value(category_codes[position])
+            stream = self._keys.value(stream_codes[position])
+            self._category_index.setdefault(category, array("q")).append(
+                position
+            )
+            self._stream_index.setdefault(
+                (category, stream), array("q")
+            ).append(position)
+
+        segment_id = self._segments[-1] if length else 0
+        segment_offset = self._offsets[-1] + self._lengths[-1] if length else 0
+
+        truncate_file(self._directory / KEYS_FILE_NAME, keys_end)
+        truncate_file(
+            self._directory / LOG_INDEX_FILE_NAME,
+            length * LOG_INDEX_ENTRY.size,
+        )
+        truncate_file(
+            self._directory / CATEGORY_INDEX_FILE_NAME,
+            length * CATEGORY_INDEX_ENTRY.size,
+        )
+        truncate_file(
+            self._directory / STREAM_INDEX_FILE_NAME,
+            length * STREAM_INDEX_ENTRY.size,
+        )
+        truncate_file(self._segment_path(segment_id), segment_offset)
+        for path in self._directory.glob(f"*{SEGMENT_FILE_SUFFIX}"):
+            if int(path.stem) > segment_id:
+                path.unlink()
+
+        return segment_id, segment_offset
+
+    def _recover_commits(self, available: int) -> int:
+        length = 0
+        commits = 0
+        for (committed_length,) in COMMIT_ENTRY.iter_unpack(
+            whole_entries(
+                read_file(self._directory / COMMITS_FILE_NAME), COMMIT_ENTRY
+            )
+        ):
+            if committed_length <= length or committed_length > available:
+                break
+            length = committed_length
+            commits += 1
+
+        truncate_file(
+            self._directory / COMMITS_FILE_NAME, commits * COMMIT_ENTRY.size
+        )
+
+        return length
+
+    def _recover_keys(self) -> int:
+        data = read_file(self._directory / KEYS_FILE_NAME)
+        offset = 0
+        while offset + KEY_HEADER.size <= len(data):
+            (size,) = KEY_HEADER.unpack_from(data, offset)
+            end = offset + KEY_HEADER.size + size
+            if end > len(data):
+                break
+            self._keys.code(data[offset + KEY_HEADER.size : end].decode())
+            offset = end
+        return offset
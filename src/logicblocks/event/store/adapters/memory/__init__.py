@@ -4,10 +4,12 @@ from .converters import (
     TypeRegistryConstraintConverter as InMemoryTypeRegistryConstraintConverter,
 )
 from .locks import MultiLock as MultiLock
+from .records import StorageMode as InMemoryStorageMode
 
 __all__ = [
     "InMemoryEventStorageAdapter",
     "InMemoryQueryConstraintCheck",
+    "InMemoryStorageMode",
     "InMemoryTypeRegistryConstraintConverter",
     "MultiLock",
 ]
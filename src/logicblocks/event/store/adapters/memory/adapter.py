@@ -7,7 +7,7 @@ from collections.abc import (
     Sequence,
     Set,
 )
-from typing import overload
+from typing import Any, overload
 from uuid import uuid4
 
 from aiologic import Lock
@@ -31,6 +31,7 @@ from ...conditions import (
     WriteCondition,
 )
 from ...constraints import QueryConstraint
+from ...notifications import InMemoryEventNotificationHub, event_notifications
 from ...types import StreamPublishDefinition
 from ..base import (
     EventSerialisationGuarantee,
@@ -38,6 +39,8 @@ from ..base import (
     Latestable,
     Saveable,
     Scannable,
+    StreamEventSerialisationGuarantee,
+    StripedEventSerialisationGuarantee,
 )
 from .converters import (
     TypeRegistryConditionConverter,
@@ -45,22 +48,61 @@ from .converters import (
     WriteConditionEnforcer,
     WriteConditionEnforcerContext,
 )
-from .db import InMemoryEventsDB, InMemorySequence
+from .db import InMemoryEventsDB
 from .locks import MultiLock
+from .records import StorageMode
 from .types import QueryConstraintCheck
 
 
+def serialise_new_event(
+    event: NewEvent[StringPersistable, JsonPersistable],
+    *,
+    target: StreamIdentifier,
+    position: int,
+) -> StoredEvent[str, JsonValue]:
+    return StoredEvent[str, JsonValue](
+        id=uuid4().hex,
+        name=serialise_to_string(event.name),
+        stream=target.stream,
+        category=target.category,
+        position=position,
+        sequence_number=-1,
+        payload=serialise_to_json_value(event.payload),
+        observed_at=event.observed_at,
+        occurred_at=event.occurred_at,
+    )
+
+
+def committed_event[Name: StringPersistable, Payload: JsonPersistable](
+    event: NewEvent[Name, Payload],
+    stored_event: StoredEvent[str, JsonValue],
+) -> StoredEvent[Name, Payload]:
+    return StoredEvent[Name, Payload](
+        id=stored_event.id,
+        name=event.name,
+        stream=stored_event.stream,
+        category=stored_event.category,
+        position=stored_event.position,
+        sequence_number=stored_event.sequence_number,
+        payload=event.payload,
+        observed_at=stored_event.observed_at,
+        occurred_at=stored_event.occurred_at,
+    )
+
+
 class InMemoryEventStorageAdapter(EventStorageAdapter):
     def __init__(
         self,
         *,
         serialisation_guarantee: EventSerialisationGuarantee[
-            CategoryIdentifier | StreamIdentifier | LogIdentifier
+            Any
         ] = EventSerialisationGuarantee.LOG,
         constraint_converter: Converter[QueryConstraint, QueryConstraintCheck]
         | None = None,
         condition_converter: Converter[WriteCondition, WriteConditionEnforcer]
         | None = None,
+        notifications: InMemoryEventNotificationHub | None = None,
+        storage_mode: StorageMode = StorageMode.OBJECTS,
     ):
         self._constraint_converter = (
             constraint_converter
@@ -77,15 +119,15 @@ class InMemoryEventStorageAdapter(EventStorageAdapter):
             )
         )
         self._locks: dict[str, Lock] = defaultdict(lambda: Lock())
-        self._sequence = InMemorySequence()
-        self._db = InMemoryEventsDB(
-            events=None,
-            log_index=None,
-            category_index=None,
-            stream_index=None,
+        self._db = self._create_db(storage_mode)
+        self._serialisation_guarantee = serialisation_guarantee
+        self._notifications = notifications
+
+    def _create_db(self, storage_mode: StorageMode) -> InMemoryEventsDB:
+        return InMemoryEventsDB(
             constraint_converter=self._constraint_converter,
+            storage_mode=storage_mode,
         )
-        self._serialisation_guarantee = serialisation_guarantee
 
     def _lock_name(self, target: Saveable) -> str:
         return self._serialisation_guarantee.lock_name(
@@ -100,15 +142,20 @@ class InMemoryEventStorageAdapter(EventStorageAdapter):
         ],
     ) -> list[str]:
         match self._serialisation_guarantee:
-            case EventSerialisationGuarantee.STREAM:
-                return [
-                    self._lock_name(
-                        StreamIdentifier(
-                            category=target.category, stream=stream_name
+            case (
+                StreamEventSerialisationGuarantee()
+                | StripedEventSerialisationGuarantee()
+            ):
+                return sorted(
+                    {
+                        self._lock_name(
+                            StreamIdentifier(
+                                category=target.category, stream=stream_name
+                            )
                         )
-                    )
-                    for stream_name in sorted(streams.keys())
-                ]
+                        for stream_name in streams.keys()
+                    }
+                )
             case _:
                 return [self._lock_name(target)]
 
@@ -193,35 +240,28 @@ class InMemoryEventStorageAdapter(EventStorageAdapter):
 
             last_stream_position = transaction.last_stream_position(target)
 
-            new_stored_events: list[StoredEvent[Name, Payload]] = []
             for new_event, count in zip(events, range(len(events))):
-                new_stored_event = StoredEvent[Name, Payload](
-                    id=uuid4().hex,
-                    name=new_event.name,
-                    stream=target.stream,
-                    category=target.category,
-                    position=last_stream_position + count + 1,
-                    sequence_number=next(self._sequence),
-                    payload=new_event.payload,
-                    observed_at=new_event.observed_at,
-                    occurred_at=new_event.occurred_at,
-                )
-                serialised_stored_event = StoredEvent[str, JsonValue](
-                    id=new_stored_event.id,
-                    name=serialise_to_string(new_stored_event.name),
-                    stream=new_stored_event.stream,
-                    category=new_stored_event.category,
-                    position=new_stored_event.position,
-                    sequence_number=new_stored_event.sequence_number,
-                    payload=serialise_to_json_value(new_stored_event.payload),
-                    observed_at=new_stored_event.observed_at,
-                    occurred_at=new_stored_event.occurred_at,
+                transaction.add(
+                    serialise_new_event(
+                        new_event,
+                        target=target,
+                        position=last_stream_position + count + 1,
+                    )
                 )
-                transaction.add(serialised_stored_event)
-                new_stored_events.append(new_stored_event)
                 await asyncio.sleep(0)
 
-            transaction.commit()
+            new_stored_events = [
+                committed_event(new_event, stored_event)
+                for new_event, stored_event in zip(
+                    events, transaction.commit()
+                )
+            ]
+            await self._db.sync()
+
+            if self._notifications is not None:
+                self._notifications.publish(
+                    event_notifications(new_stored_events)
+                )
 
             return new_stored_events
 
@@ -274,39 +314,32 @@ class InMemoryEventStorageAdapter(EventStorageAdapter):
                     stream_target
                 )
 
-                new_stored_events: list[StoredEvent[Name, Payload]] = []
                 for new_event, count in zip(events, range(len(events))):
-                    new_stored_event = StoredEvent[Name, Payload](
-                        id=uuid4().hex,
-                        name=new_event.name,
-                        stream=stream_target.stream,
-                        category=stream_target.category,
-                        position=last_stream_position + count + 1,
-                        sequence_number=next(self._sequence),
-                        payload=new_event.payload,
-                        observed_at=new_event.observed_at,
-                        occurred_at=new_event.occurred_at,
-                    )
-                    serialised_stored_event = StoredEvent[str, JsonValue](
-                        id=new_stored_event.id,
-                        name=serialise_to_string(new_stored_event.name),
-                        stream=new_stored_event.stream,
-                        category=new_stored_event.category,
-                        position=new_stored_event.position,
-                        sequence_number=new_stored_event.sequence_number,
-                        payload=serialise_to_json_value(
-                            new_stored_event.payload
-                        ),
-                        observed_at=new_stored_event.observed_at,
-                        occurred_at=new_stored_event.occurred_at,
+                    transaction.add(
+                        serialise_new_event(
+                            new_event,
+                            target=stream_target,
+                            position=last_stream_position + count + 1,
+                        )
                     )
-                    transaction.add(serialised_stored_event)
-                    new_stored_events.append(new_stored_event)
                     await asyncio.sleep(0)
 
-                results[stream_name] = new_stored_events
-
-            transaction.commit()
+            committed_events = iter(transaction.commit())
+            for stream_name in sorted(streams.keys()):
+                results[stream_name] = [
+                    committed_event(new_event, next(committed_events))
+                    for new_event in streams[stream_name]["events"]
+                ]
+            await self._db.sync()
+
+            if self._notifications is not None:
+                self._notifications.publish(
+                    event_notifications(
+                        event
+                        for stream_events in results.values()
+                        for event in stream_events
+                    )
+                )
 
             return results
 
@@ -1,7 +1,9 @@
-import copy
-from collections import defaultdict
-from collections.abc import AsyncIterator, Set
-from typing import Self, cast
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator, Iterator, Sequence, Set
+from dataclasses import replace
+from itertools import islice
 
 from logicblocks.event.types import (
     CategoryIdentifier,
@@ -17,12 +19,28 @@ from ..base import (
     Latestable,
     Scannable,
 )
+from .planning import plan_scan
+from .records import (
+    CategoryKey,
+    ColumnarEventRecords,
+    EventIndexDict,
+    EventPositionList,
+    EventRecords,
+    ObjectEventRecords,
+    StorageMode,
+    StreamKey,
+)
 from .types import QueryConstraintCheck
 
-type StreamKey = tuple[str, str]
-type CategoryKey = str
-type EventPositionList = list[int]
-type EventIndexDict[T] = defaultdict[T, EventPositionList]
+empty_index: EventPositionList = array("q")
+
+
+def make_records(storage_mode: StorageMode) -> EventRecords:
+    match storage_mode:
+        case StorageMode.OBJECTS:
+            return ObjectEventRecords()
+        case StorageMode.COLUMNAR:
+            return ColumnarEventRecords()
 
 
 class InMemorySequence:
@@ -39,113 +57,170 @@ class InMemoryEventsDB:
     def __init__(
         self,
         *,
-        events: list[StoredEvent[str, JsonValue] | None] | None = None,
-        log_index: EventPositionList | None = None,
-        category_index: EventIndexDict[CategoryKey] | None = None,
-        stream_index: EventIndexDict[StreamKey] | None = None,
         constraint_converter: Converter[QueryConstraint, QueryConstraintCheck],
+        sequence: InMemorySequence | None = None,
+        storage_mode: StorageMode = StorageMode.OBJECTS,
+        records: EventRecords | None = None,
     ):
-        self._events: list[StoredEvent[str, JsonValue] | None] = (
-            events if events is not None else []
-        )
-        self._log_index: EventPositionList = (
-            log_index if log_index is not None else []
-        )
-        self._category_index: EventIndexDict[CategoryKey] = (
-            category_index
-            if category_index is not None
-            else defaultdict(lambda: [])
+        self._log = (
+            records if records is not None else make_records(storage_mode)
         )
-        self._stream_index: EventIndexDict[StreamKey] = (
-            stream_index
-            if stream_index is not None
-            else defaultdict(lambda: [])
+        self._category_index, self._stream_index = self._log.load_indexes()
+        self._stream_heads: dict[StreamKey, int] = {
+            stream_key: index[-1]
+            for stream_key, index in self._stream_index.items()
+            if index
+        }
+        self._sequence = (
+            sequence
+            if sequence is not None
+            else InMemorySequence(
+                self._log.sequence_number_at(len(self._log) - 1) + 1
+                if len(self._log)
+                else 0
+            )
         )
+        self._commit_lock = threading.Lock()
         self._constraint_converter = constraint_converter
 
-    def snapshot(self) -> Self:
-        return self.__class__(
-            events=list(self._events),
-            log_index=list(self._log_index),
-            category_index=copy.deepcopy(self._category_index),
-            stream_index=copy.deepcopy(self._stream_index),
+    def snapshot(self) -> "InMemoryEventsDBSnapshot":
+        return InMemoryEventsDBSnapshot(
+            log=self._log,
+            category_index=self._category_index,
+            stream_index=self._stream_index,
+            length=self._log.visible_length(),
             constraint_converter=self._constraint_converter,
         )
 
     def transaction(self) -> "InMemoryEventsDBTransaction":
         return InMemoryEventsDBTransaction(db=self)
 
-    def stream_events(
-        self, target: StreamIdentifier
-    ) -> list[StoredEvent[str, JsonValue]]:
-        stream_key = (target.category, target.stream)
-        events = [self._events[i] for i in self._stream_index[stream_key]]
-        if any(event is None for event in events):
-            raise ValueError(
-                f"Invalid state: stream {target.category}/{target.stream} "
-                f"contains None values."
-            )
-
-        return cast(list[StoredEvent[str, JsonValue]], events)
-
     def last_stream_event(
         self, target: StreamIdentifier
     ) -> StoredEvent[str, JsonValue] | None:
-        stream_events = self.stream_events(target)
-        return stream_events[-1] if stream_events else None
+        log_position = self._stream_heads.get(
+            (target.category, target.stream), None
+        )
+        return self._log[log_position] if log_position is not None else None
 
     def last_stream_position(self, target: StreamIdentifier) -> int:
         last_stream_event = self.last_stream_event(target)
         return -1 if last_stream_event is None else last_stream_event.position
 
-    def add(self, event: StoredEvent[str, JsonValue]) -> None:
-        category_key = event.category
-        stream_key = (event.category, event.stream)
-        if len(self._events) <= event.sequence_number:
-            self._events += [None] * (
-                event.sequence_number - len(self._events) + 1
-            )
-        self._events[event.sequence_number] = event
-        self._log_index += [event.sequence_number]
-        self._stream_index[stream_key] += [event.sequence_number]
-        self._category_index[category_key] += [event.sequence_number]
+    def append(
+        self, events: Sequence[StoredEvent[str, JsonValue]]
+    ) -> Sequence[StoredEvent[str, JsonValue]]:
+        with self._commit_lock:
+            committed: list[StoredEvent[str, JsonValue]] = []
+            for event in events:
+                event = replace(event, sequence_number=next(self._sequence))
+                log_position = len(self._log)
+                stream_key = (event.category, event.stream)
+                self._category_index.setdefault(
+                    event.category, array("q")
+                ).append(log_position)
+                self._stream_index.setdefault(stream_key, array("q")).append(
+                    log_position
+                )
+                self._log.append(event)
+                self._stream_heads[stream_key] = log_position
+                committed.append(event)
+            self._log.commit()
+
+            return committed
+
+    async def sync(self) -> None:
+        await self._log.sync()
+
+
+class InMemoryEventsDBSnapshot:
+    def __init__(
+        self,
+        *,
+        log: EventRecords,
+        category_index: EventIndexDict[CategoryKey],
+        stream_index: EventIndexDict[StreamKey],
+        length: int,
+        constraint_converter: Converter[QueryConstraint, QueryConstraintCheck],
+    ):
+        self._log = log
+        self._category_index = category_index
+        self._stream_index = stream_index
+        self._length = length
+        self._constraint_converter = constraint_converter
+
+    def __len__(self) -> int:
+        return self._length
 
     def last_event(
         self, target: Latestable
     ) -> StoredEvent[str, JsonValue] | None:
-        index = self._select_index(target)
-
-        return self._events[index[-1]] if index else None
+        match target:
+            case LogIdentifier():
+                return self._log[self._length - 1] if self._length else None
+            case _:
+                index = self._select_index(target)
+                end = self._end_of(index)
+                return self._log[index[end - 1]] if end else None
 
     async def scan_events(
         self,
         target: Scannable,
         constraints: Set[QueryConstraint] = frozenset(),
     ) -> AsyncIterator[StoredEvent[str, JsonValue]]:
-        index = self._select_index(target)
-
-        for sequence_number in index:
-            event = self._events[sequence_number]
-            if event is None:
-                raise ValueError(
-                    f"Invalid state: event at sequence number {sequence_number} "
-                    f"is None"
-                )
-            if not all(
-                self._constraint_converter.convert(constraint)(event)
-                for constraint in constraints
-            ):
+        plan = plan_scan(constraints, self._constraint_converter)
+        check = plan.check
+
+        for log_position in self._log_positions(
+            target, plan.sequence_number_after
+        ):
+            event = self._log[log_position]
+            if check is not None and not check(event):
                 continue
             yield event
 
-    def _select_index(self, target: Scannable) -> EventPositionList:
+    def _log_positions(
+        self, target: Scannable, sequence_number_after: int | None
+    ) -> Iterator[int]:
         match target:
             case LogIdentifier():
-                return self._log_index
+                start = (
+                    self._log.position_after(
+                        sequence_number_after, self._length
+                    )
+                    if sequence_number_after is not None
+                    else 0
+                )
+                return iter(range(start, self._length))
+            case _:
+                index = self._select_index(target)
+                end = self._end_of(index)
+                start = (
+                    bisect_right(
+                        index,
+                        sequence_number_after,
+                        hi=end,
+                        key=self._log.sequence_number_at,
+                    )
+                    if sequence_number_after is not None
+                    else 0
+                )
+                return islice(index, start, end)
+
+    def _end_of(self, index: EventPositionList) -> int:
+        end = len(index)
+        if end == 0 or index[end - 1] < self._length:
+            return end
+        return bisect_left(index, self._length, hi=end)
+
+    def _select_index(
+        self, target: CategoryIdentifier | StreamIdentifier | Scannable
+    ) -> EventPositionList:
+        match target:
             case CategoryIdentifier(category):
-                return self._category_index[category]
+                return self._category_index.get(category, empty_index)
             case StreamIdentifier(category, stream):
-                return self._stream_index[(category, stream)]
+                return self._stream_index.get((category, stream), empty_index)
             case _:  # pragma: no cover
                 raise ValueError(f"Unknown target: {target}")
 
@@ -158,9 +233,8 @@ class InMemoryEventsDBTransaction:
     def add(self, event: StoredEvent[str, JsonValue]) -> None:
         self._added_events.append(event)
 
-    def commit(self) -> None:
-        for event in self._added_events:
-            self._db.add(event)
+    def commit(self) -> Sequence[StoredEvent[str, JsonValue]]:
+        return self._db.append(self._added_events)
 
     def last_stream_event(
         self, target: StreamIdentifier
@@ -0,0 +1,55 @@
+from collections.abc import Sequence, Set
+from dataclasses import dataclass
+
+from logicblocks.event.types import Converter, JsonValue, StoredEvent
+
+from ...constraints import QueryConstraint, SequenceNumberAfterConstraint
+from .types import QueryConstraintCheck
+
+
+def fuse_checks(
+    checks: Sequence[QueryConstraintCheck],
+) -> QueryConstraintCheck | None:
+    match checks:
+        case []:
+            return None
+        case [check]:
+            return check
+        case _:
+
+            def fused(event: StoredEvent[str, JsonValue]) -> bool:
+                for check in checks:
+                    if not check(event):
+                        return False
+                return True
+
+            return fused
+
+
+@dataclass(frozen=True)
+class InMemoryScanPlan:
+    sequence_number_after: int | None = None
+    check: QueryConstraintCheck | None = None
+
+
+def plan_scan(
+    constraints: Set[QueryConstraint],
+    constraint_converter: Converter[QueryConstraint, QueryConstraintCheck],
+) -> InMemoryScanPlan:
+    sequence_number_after: int | None = None
+    checks: list[QueryConstraintCheck] = []
+
+    for constraint in constraints:
+        if isinstance(constraint, SequenceNumberAfterConstraint):
+            sequence_number_after = (
+                constraint.sequence_number
+                if sequence_number_after is None
+                else max(sequence_number_after, constraint.sequence_number)
+            )
+        else:
+            checks.append(constraint_converter.convert(constraint))
+
+    return InMemoryScanPlan(
+        sequence_number_after=sequence_number_after,
+        check=fuse_checks(checks),
+    )
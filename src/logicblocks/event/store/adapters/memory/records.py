@@ -0,0 +1,185 @@
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from datetime import UTC, datetime, timedelta, tzinfo
+from enum import StrEnum
+
+from logicblocks.event.types import JsonValue, StoredEvent
+
+type StreamKey = tuple[str, str]
+type CategoryKey = str
+type EventPositionList = array[int]
+type EventIndexDict[T] = dict[T, EventPositionList]
+
+EPOCH = datetime(1970, 1, 1)
+UTC_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class StorageMode(StrEnum):
+    OBJECTS = "objects"
+    COLUMNAR = "columnar"
+
+
+class EventRecords(ABC):
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __getitem__(self, position: int) -> StoredEvent[str, JsonValue]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def append(self, event: StoredEvent[str, JsonValue]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def sequence_number_at(self, position: int) -> int:
+        raise NotImplementedError
+
+    def commit(self) -> None:
+        pass
+
+    def position_after(self, sequence_number: int, end: int) -> int:
+        return bisect_right(
+            range(end), sequence_number, key=self.sequence_number_at
+        )
+
+    def visible_length(self) -> int:
+        return len(self)
+
+    def load_indexes(
+        self,
+    ) -> tuple[EventIndexDict[CategoryKey], EventIndexDict[StreamKey]]:
+        return {}, {}
+
+    async def sync(self) -> None:
+        pass
+
+
+class ObjectEventRecords(EventRecords):
+    def __init__(self):
+        self._events: list[StoredEvent[str, JsonValue]] = []
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __getitem__(self, position: int) -> StoredEvent[str, JsonValue]:
+        return self._events[position]
+
+    def append(self, event: StoredEvent[str, JsonValue]) -> int:
+        self._events.append(event)
+        return len(self._events) - 1
+
+    def sequence_number_at(self, position: int) -> int:
+        return self._events[position].sequence_number
+
+
+class StringTable:
+    def __init__(self):
+        self._values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value, None)
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[value] = code
+        return code
+
+    def value(self, code: int) -> str:
+        return self._values[code]
+
+
+class ColumnarEventRecords(EventRecords):
+    def __init__(self):
+        self._strings = StringTable()
+        self._time_zones: list[tzinfo | None] = []
+        self._time_zone_codes: dict[tzinfo | None, int] = {}
+        self._ids: list[str] = []
+        self._names = array("L")
+        self._streams = array("L")
+        self._categories = array("L")
+        self._positions = array("q")
+        self._sequence_numbers = array("q")
+        self._payloads: list[JsonValue] = []
+        self._observed_at = array("q")
+        self._observed_at_time_zones = array("L")
+        self._occurred_at = array("q")
+        self._occurred_at_time_zones = array("L")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, position: int) -> StoredEvent[str, JsonValue]:
+        return StoredEvent[str, JsonValue](
+            id=self._ids[position],
+            name=self._strings.value(self._names[position]),
+            stream=self._strings.value(self._streams[position]),
+            category=self._strings.value(self._categories[position]),
+            position=self._positions[position],
+            sequence_number=self._sequence_numbers[position],
+            payload=self._payloads[position],
+            observed_at=self._datetime(
+                self._observed_at[position],
+                self._observed_at_time_zones[position],
+            ),
+            occurred_at=self._datetime(
+                self._occurred_at[position],
+                self._occurred_at_time_zones[position],
+            ),
+        )
+
+    def append(self, event: StoredEvent[str, JsonValue]) -> int:
+        observed_at, observed_at_time_zone = self._microseconds(
+            event.observed_at
+        )
+        occurred_at, occurred_at_time_zone = self._microseconds(
+            event.occurred_at
+        )
+
+        self._names.append(self._strings.code(event.name))
+        self._streams.append(self._strings.code(event.stream))
+        self._categories.append(self._strings.code(event.category))
+        self._positions.append(event.position)
+        self._sequence_numbers.append(event.sequence_number)
+        self._payloads.append(event.payload)
+        self._observed_at.append(observed_at)
+        self._observed_at_time_zones.append(observed_at_time_zone)
+        self._occurred_at.append(occurred_at)
+        self._occurred_at_time_zones.append(occurred_at_time_zone)
+        self._ids.append(event.id)
+
+        return len(self._ids) - 1
+
+    def sequence_number_at(self, position: int) -> int:
+        return self._sequence_numbers[position]
+
+    def position_after(self, sequence_number: int, end: int) -> int:
+        return bisect_right(self._sequence_numbers, sequence_number, hi=end)
+
+    def _time_zone_code(self, time_zone: tzinfo | None) -> int:
+        code = self._time_zone_codes.get(time_zone, None)
+        if code is None:
+            code = len(self._time_zones)
+            self._time_zones.append(time_zone)
+            self._time_zone_codes[time_zone] = code
+        return code
+
+    def _microseconds(self, value: datetime) -> tuple[int, int]:
+        time_zone_code = self._time_zone_code(value.tzinfo)
+        offset = (
+            value - UTC_EPOCH if value.tzinfo is not None else value - EPOCH
+        )
+        return offset // timedelta(microseconds=1), time_zone_code
+
+    def _datetime(self, microseconds: int, time_zone_code: int) -> datetime:
+        time_zone = self._time_zones[time_zone_code]
+        offset = timedelta(microseconds=microseconds)
+        if time_zone is None:
+            return EPOCH + offset
+        return (UTC_EPOCH + offset).astimezone(time_zone)
@@ -1,6 +1,25 @@
-from .adapter import PostgresEventStorageAdapter, QuerySettings
+from .adapter import (
+    GroupCommitSettings,
+    PostgresEventStorageAdapter,
+    QuerySettings,
+    ScanMode,
+    ScanOrdering,
+)
+from .paging import (
+    AdaptivePageSizingStrategy,
+    FixedPageSizingStrategy,
+    PageSizingStrategy,
+    ScanPageObservation,
+)
 
 __all__ = [
+    "AdaptivePageSizingStrategy",
+    "FixedPageSizingStrategy",
+    "GroupCommitSettings",
+    "PageSizingStrategy",
     "PostgresEventStorageAdapter",
     "QuerySettings",
+    "ScanMode",
+    "ScanOrdering",
+    "ScanPageObservation",
 ]
@@ -1,11 +1,23 @@
 import hashlib
-from collections.abc import AsyncIterator, Mapping, Set
+import json
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Hashable,
+    Mapping,
+    Set,
+)
+from contextlib import aclosing
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Sequence, TypedDict, overload
+from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import lru_cache
+from typing import Any, Sequence, TypedDict, cast, overload
 from uuid import uuid4
 
 from psycopg import AsyncConnection, AsyncCursor, sql
+from psycopg.errors import UniqueViolation
 from psycopg.rows import class_row
 from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
@@ -22,8 +34,13 @@ from logicblocks.event.persistence.postgres import (
     TableSettings,
 )
 from logicblocks.event.persistence.postgres.query import (
+    Cast,
     ColumnReference,
+    FunctionApplication,
+    ResultTarget,
+    SetQuantifier,
     SortBy,
+    SortDirection,
 )
 from logicblocks.event.types import (
     CategoryIdentifier,
@@ -44,6 +61,8 @@ from ...constraints import (
     QueryConstraint,
     SequenceNumberAfterConstraint,
 )
+from ...exceptions import UnmetWriteConditionError
+from ...notifications import EventNotification, event_notifications
 from ...types import StreamPublishDefinition
 from ..base import (
     AnyEventSerialisationGuarantee,
@@ -55,13 +74,23 @@ from ..base import (
     Saveable,
     Scannable,
     StreamEventSerialisationGuarantee,
+    StripedEventSerialisationGuarantee,
 )
+from .coalescing import PendingWrite, WriteCoalescer
 from .converters import (
+    SequenceNumberAfterConstraintQueryApplier,
     TypeRegistryConditionConverter,
     TypeRegistryConstraintConverter,
     WriteConditionEnforcer,
     WriteConditionEnforcerContext,
 )
+from .heads import StreamHeadCache
+from .paging import (
+    FixedPageSizingStrategy,
+    PageSizingStrategy,
+    ScanPageObservation,
+)
+from .statements import StatementCache, execute_statement
 
 
 class StreamInsertDefinition[
@@ -72,30 +101,120 @@ class StreamInsertDefinition[
     position: int
 
 
+class ScanMode(StrEnum):
+    PAGED = "paged"
+    STREAMED = "streamed"
+
+
+class ScanOrdering(StrEnum):
+    SEQUENCE_NUMBER = "sequence-number"
+    COMMIT = "commit"
+
+
+stored_event_columns = (
+    "id",
+    "name",
+    "stream",
+    "category",
+    "position",
+    "sequence_number",
+    "payload",
+    "observed_at",
+    "occurred_at",
+)
+
+
+def stored_event_columns_clause() -> sql.Composable:
+    return sql.SQL(", ").join(
+        [sql.Identifier(column) for column in stored_event_columns]
+    )
+
+
 @dataclass(frozen=True)
 class QuerySettings:
     scan_query_page_size: int
+    scan_mode: ScanMode
+    scan_ordering: ScanOrdering
+    scan_stream_batch_size: int
+    copy_insert_threshold: int | None
+    statement_cache_size: int
+    prepare_statements: bool | None
+    stream_head_cache_size: int
 
-    def __init__(self, *, scan_query_page_size: int = 100):
+    def __init__(
+        self,
+        *,
+        scan_query_page_size: int = 100,
+        scan_mode: ScanMode = ScanMode.PAGED,
+        scan_ordering: ScanOrdering = ScanOrdering.SEQUENCE_NUMBER,
+        scan_stream_batch_size: int = 10000,
+        copy_insert_threshold: int | None = None,
+        statement_cache_size: int = 256,
+        prepare_statements: bool | None = None,
+        stream_head_cache_size: int = 0,
+    ):
         object.__setattr__(self, "scan_query_page_size", scan_query_page_size)
+        object.__setattr__(self, "scan_mode", scan_mode)
+        object.__setattr__(self, "scan_ordering", scan_ordering)
+        object.__setattr__(
+            self, "scan_stream_batch_size", scan_stream_batch_size
+        )
+        object.__setattr__(
+            self, "copy_insert_threshold", copy_insert_threshold
+        )
+        object.__setattr__(self, "statement_cache_size", statement_cache_size)
+        object.__setattr__(self, "prepare_statements", prepare_statements)
+        object.__setattr__(
+            self, "stream_head_cache_size", stream_head_cache_size
+        )
+
+
+@dataclass(frozen=True)
+class GroupCommitSettings:
+    max_batch_size: int
+    max_wait: timedelta
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = 100,
+        max_wait: timedelta = timedelta(milliseconds=5),
+    ):
+        object.__setattr__(self, "max_batch_size", max_batch_size)
+        object.__setattr__(self, "max_wait", max_wait)
+
+
+@dataclass(frozen=True)
+class StreamSaveRequest:
+    target: StreamIdentifier
+    events: Sequence[NewEvent[StringPersistable, JsonPersistable]]
+    condition: WriteCondition
+
+
+type StreamSaveResult = Sequence[
+    StoredEvent[StringPersistable, JsonPersistable]
+]
 
 
 @dataclass(frozen=True)
 class ScanQueryParameters:
     target: Scannable
     constraints: Set[QueryConstraint]
-    page_size: int
+    page_size: int | None
+    ordering: ScanOrdering
 
     def __init__(
         self,
         *,
         target: Scannable,
         constraints: Set[QueryConstraint] = frozenset(),
-        page_size: int,
+        page_size: int | None,
+        ordering: ScanOrdering = ScanOrdering.SEQUENCE_NUMBER,
     ):
         object.__setattr__(self, "target", target)
         object.__setattr__(self, "constraints", constraints)
         object.__setattr__(self, "page_size", page_size)
+        object.__setattr__(self, "ordering", ordering)
 
     @property
     def category(self) -> str | None:
@@ -169,18 +288,94 @@ class CategoryStreamsLatestQueryParameters:
         return self._streams
 
 
+@lru_cache(maxsize=4096)
 def get_digest(lock_id: str) -> int:
     return (
         int(hashlib.sha256(lock_id.encode("utf-8")).hexdigest(), 16) % 10**16
     )
 
 
+def commit_watermark_condition() -> Condition:
+    return (
+        Condition()
+        .left(ColumnReference(field="transaction_id"))
+        .operator(Operator.LESS_THAN)
+        .right(
+            FunctionApplication(
+                function_name="pg_snapshot_xmin",
+                arguments=[
+                    FunctionApplication(function_name="pg_current_snapshot")
+                ],
+            )
+        )
+    )
+
+
+def commit_position_after_condition(
+    sequence_number: int, table_settings: TableSettings
+) -> Condition:
+    recorded_position = (
+        Query()
+        .select("transaction_id", "sequence_number")
+        .from_table(table_settings.table_name)
+        .where(
+            Condition()
+            .left(ColumnReference(field="sequence_number"))
+            .operator(Operator.EQUALS)
+            .right(Constant(sequence_number))
+        )
+    )
+    fallback_position = Query().select(
+        ResultTarget(
+            expression=Cast(expression=Constant("0"), typename="xid8"),
+            label="transaction_id",
+        ),
+        ResultTarget(
+            expression=Constant(sequence_number), label="sequence_number"
+        ),
+    )
+
+    return (
+        Condition()
+        .left(
+            [
+                ColumnReference(field="transaction_id"),
+                ColumnReference(field="sequence_number"),
+            ]
+        )
+        .operator(Operator.GREATER_THAN)
+        .right(
+            Query()
+            .select("transaction_id", "sequence_number")
+            .from_subquery(
+                Query.union(
+                    recorded_position,
+                    fallback_position,
+                    mode=SetQuantifier.ALL,
+                ),
+                "positions",
+            )
+            .order_by(
+                SortBy(
+                    expression=ColumnReference(field="transaction_id"),
+                    direction=SortDirection.DESC,
+                )
+            )
+            .limit(1)
+        )
+    )
+
+
 def scan_query(
     parameters: ScanQueryParameters,
     constraint_converter: Converter[QueryConstraint, QueryApplier],
     table_settings: TableSettings,
 ) -> ParameterisedQuery:
-    builder = Query().select_all().from_table(table_settings.table_name)
+    builder = (
+        Query()
+        .select(*stored_event_columns)
+        .from_table(table_settings.table_name)
+    )
 
     if parameters.category:
         builder = builder.where(
@@ -198,10 +393,29 @@ def scan_query(
             .right(Constant(parameters.stream))
         )
 
+    is_commit_ordered = parameters.ordering == ScanOrdering.COMMIT
+    if is_commit_ordered:
+        builder = builder.where(commit_watermark_condition())
+
     for constraint in parameters.constraints:
+        if is_commit_ordered and isinstance(
+            constraint, SequenceNumberAfterConstraint
+        ):
+            builder = builder.where(
+                commit_position_after_condition(
+                    constraint.sequence_number, table_settings
+                )
+            )
+            continue
+
         applier = constraint_converter.convert(constraint)
         builder = applier.apply(builder)
 
+    if is_commit_ordered:
+        builder = builder.order_by(
+            SortBy(expression=ColumnReference(field="transaction_id"))
+        )
+
     builder = builder.order_by(
         SortBy(expression=ColumnReference(field="sequence_number"))
     ).limit(parameters.page_size)
@@ -209,6 +423,52 @@ def scan_query(
     return builder.build()
 
 
+def scan_query_shape(
+    parameters: ScanQueryParameters,
+    constraint_converter: Converter[QueryConstraint, QueryApplier],
+    table_settings: TableSettings,
+) -> tuple[Hashable, Sequence[Any]] | None:
+    sequence_numbers: list[int] = []
+    for constraint in parameters.constraints:
+        applier = constraint_converter.convert(constraint)
+        if not isinstance(applier, SequenceNumberAfterConstraintQueryApplier):
+            return None
+        sequence_numbers.append(applier.sequence_number)
+
+    if len(sequence_numbers) > 1:
+        return None
+
+    constraint_params: list[Any] = list(sequence_numbers)
+    if parameters.ordering == ScanOrdering.COMMIT and sequence_numbers:
+        constraint_params = list(
+            commit_position_after_condition(
+                sequence_numbers[0], table_settings
+            ).to_fragment()[1]
+        )
+
+    key = (
+        "scan",
+        table_settings.table_name,
+        bool(parameters.category),
+        bool(parameters.stream),
+        len(sequence_numbers) > 0,
+        parameters.page_size is not None,
+        parameters.ordering,
+    )
+    params = [
+        param
+        for param in [
+            parameters.category or None,
+            parameters.stream or None,
+            *constraint_params,
+            parameters.page_size,
+        ]
+        if param is not None
+    ]
+
+    return key, params
+
+
 @overload
 def obtain_write_locks_query(
     targets: StreamIdentifier,
@@ -236,7 +496,8 @@ def obtain_write_locks_query(
 @overload
 def obtain_write_locks_query(
     targets: Sequence[StreamIdentifier],
-    serialisation_guarantee: StreamEventSerialisationGuarantee,
+    serialisation_guarantee: StreamEventSerialisationGuarantee
+    | StripedEventSerialisationGuarantee,
     table_settings: TableSettings,
 ) -> ParameterisedQuery: ...
 
@@ -274,14 +535,20 @@ def obtain_write_locks_query(
                 sql.SQL("SELECT pg_advisory_xact_lock(%s);"),
                 [lock_digest],
             )
-        case [*targets], StreamEventSerialisationGuarantee():
-            lock_names = [
-                serialisation_guarantee.lock_name(
-                    namespace=table_settings.table_name, target=target
-                )
-                for target in targets
-            ]
-            lock_digests = [get_digest(lock_name) for lock_name in lock_names]
+        case [*targets], (
+            StreamEventSerialisationGuarantee()
+            | StripedEventSerialisationGuarantee()
+        ):
+            lock_digests = sorted(
+                {
+                    get_digest(
+                        serialisation_guarantee.lock_name(
+                            namespace=table_settings.table_name, target=target
+                        )
+                    )
+                    for target in targets
+                }
+            )
             lock_placeholders = sql.SQL(", ").join(
                 [sql.SQL("pg_advisory_xact_lock(%s)") for _ in lock_digests]
             )
@@ -297,12 +564,43 @@ def obtain_write_locks_query(
             )
 
 
+def obtain_group_write_locks_query(
+    targets: Sequence[StreamIdentifier],
+    serialisation_guarantee: AnyEventSerialisationGuarantee,
+    table_settings: TableSettings,
+) -> ParameterisedQuery:
+    lock_digests = sorted(
+        {
+            get_digest(
+                serialisation_guarantee.lock_name(
+                    namespace=table_settings.table_name, target=target
+                )
+            )
+            for target in targets
+        }
+    )
+
+    if not lock_digests:
+        return sql.SQL("SELECT 1;"), []
+
+    return (
+        sql.SQL("SELECT {0};").format(
+            sql.SQL(", ").join(
+                [sql.SQL("pg_advisory_xact_lock(%s)") for _ in lock_digests]
+            )
+        ),
+        lock_digests,
+    )
+
+
 def read_last_query(
     parameters: LatestQueryParameters, table_settings: TableSettings
 ) -> ParameterisedQuery:
     table = table_settings.table_name
 
-    select_clause = sql.SQL("SELECT *")
+    select_clause = sql.SQL("SELECT {columns}").format(
+        columns=stored_event_columns_clause()
+    )
     from_clause = sql.SQL("FROM {table}").format(table=sql.Identifier(table))
 
     category_where_clause = (
@@ -341,14 +639,31 @@ def read_last_query(
     ]
 
     query = sql.SQL(" ").join(clauses)
-    params = [
+    params = read_last_query_params(parameters)
+
+    return query, params
+
+
+def read_last_query_key(
+    parameters: LatestQueryParameters, table_settings: TableSettings
+) -> Hashable:
+    return (
+        "read-last",
+        table_settings.table_name,
+        parameters.category is not None,
+        parameters.stream is not None,
+    )
+
+
+def read_last_query_params(
+    parameters: LatestQueryParameters,
+) -> Sequence[Any]:
+    return [
         param
         for param in [parameters.category, parameters.stream, 1]
         if param is not None
     ]
 
-    return query, params
-
 
 def read_last_category_batch_query(
     parameters: CategoryStreamsLatestQueryParameters,
@@ -356,7 +671,9 @@ def read_last_category_batch_query(
 ) -> ParameterisedQuery:
     table = table_settings.table_name
 
-    select_clause = sql.SQL("SELECT DISTINCT ON (category, stream ) *")
+    select_clause = sql.SQL(
+        "SELECT DISTINCT ON (category, stream ) {columns}"
+    ).format(columns=stored_event_columns_clause())
     from_clause = sql.SQL("FROM {table}").format(table=sql.Identifier(table))
 
     category_where_clause = sql.SQL("category = %s")
@@ -404,7 +721,22 @@ def insert_batch_query[Name: StringPersistable, Payload: JsonPersistable](
     ],
     table_settings: TableSettings,
 ) -> ParameterisedQuery:
-    rows: list[sql.SQL] = []
+    values = insert_batch_query_params(definitions)
+
+    return (
+        insert_batch_statement(len(values) // 8, table_settings),
+        values,
+    )
+
+
+def insert_batch_query_params[
+    Name: StringPersistable,
+    Payload: JsonPersistable,
+](
+    definitions: Mapping[
+        StreamIdentifier, StreamInsertDefinition[Name, Payload]
+    ],
+) -> list[str | int | Jsonb | datetime]:
     values: list[str | int | Jsonb | datetime] = []
 
     for identifier, definition in definitions.items():
@@ -412,7 +744,6 @@ def insert_batch_query[Name: StringPersistable, Payload: JsonPersistable](
         start_position = definition["position"]
 
         for i, event in enumerate(events):
-            rows.append(sql.SQL("(%s, %s, %s, %s, %s, %s, %s, %s)"))
             values.extend(
                 [
                     uuid4().hex,
@@ -426,10 +757,17 @@ def insert_batch_query[Name: StringPersistable, Payload: JsonPersistable](
                 ]
             )
 
-    rows_expression = sql.SQL(", ").join(rows)
+    return values
 
-    return (
-        sql.SQL("""
+
+def insert_batch_statement(
+    row_count: int, table_settings: TableSettings
+) -> sql.Composed:
+    rows_expression = sql.SQL(", ").join(
+        [sql.SQL("(%s, %s, %s, %s, %s, %s, %s, %s)")] * row_count
+    )
+
+    return sql.SQL("""
                 INSERT INTO {0} (id,
                                  name,
                                  stream,
@@ -440,20 +778,113 @@ def insert_batch_query[Name: StringPersistable, Payload: JsonPersistable](
                                  occurred_at)
                 VALUES
                     {1}
-                    RETURNING *;
+                    RETURNING {2};
                 """).format(
-            sql.Identifier(table_settings.table_name), rows_expression
+        sql.Identifier(table_settings.table_name),
+        rows_expression,
+        stored_event_columns_clause(),
+    )
+
+
+def copy_staging_table_name(table_settings: TableSettings) -> str:
+    return f"{table_settings.table_name}_copy_staging"
+
+
+def create_copy_staging_table_query(
+    table_settings: TableSettings,
+) -> ParameterisedQuery:
+    return (
+        sql.SQL("""
+                CREATE TEMPORARY TABLE IF NOT EXISTS {0} (
+                    ordinal BIGINT NOT NULL,
+                    id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    stream TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    position INT NOT NULL,
+                    payload JSONB NOT NULL,
+                    observed_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                    occurred_at TIMESTAMP WITH TIME ZONE NOT NULL
+                ) ON COMMIT DELETE ROWS;
+                """).format(
+            sql.Identifier(copy_staging_table_name(table_settings))
         ),
-        values,
+        [],
     )
 
 
+def copy_into_staging_table_query(
+    table_settings: TableSettings,
+) -> sql.Composed:
+    return sql.SQL("""
+                   COPY {0} (ordinal,
+                             id,
+                             name,
+                             stream,
+                             category,
+                             position,
+                             payload,
+                             observed_at,
+                             occurred_at)
+                   FROM STDIN (FORMAT BINARY);
+                   """).format(
+        sql.Identifier(copy_staging_table_name(table_settings))
+    )
+
+
+def insert_from_staging_table_query(
+    table_settings: TableSettings,
+) -> ParameterisedQuery:
+    return (
+        sql.SQL("""
+                INSERT INTO {0} (id,
+                                 name,
+                                 stream,
+                                 category,
+                                 position,
+                                 payload,
+                                 observed_at,
+                                 occurred_at)
+                SELECT id,
+                       name,
+                       stream,
+                       category,
+                       position,
+                       payload,
+                       observed_at,
+                       occurred_at
+                FROM {1}
+                ORDER BY ordinal
+                    RETURNING {2};
+                """).format(
+            sql.Identifier(table_settings.table_name),
+            sql.Identifier(copy_staging_table_name(table_settings)),
+            stored_event_columns_clause(),
+        ),
+        [],
+    )
+
+
+copy_staging_table_types = [
+    "int8",
+    "text",
+    "text",
+    "text",
+    "text",
+    "int4",
+    "jsonb",
+    "timestamptz",
+    "timestamptz",
+]
+
+
 @overload
 async def obtain_write_locks(
     cursor: AsyncCursor[StoredEvent[str, JsonValue]],
     targets: StreamIdentifier,
     serialisation_guarantee: AnyEventSerialisationGuarantee,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> None: ...
 
 
@@ -463,6 +894,7 @@ async def obtain_write_locks(
     targets: CategoryIdentifier,
     serialisation_guarantee: CategoryEventSerialisationGuarantee,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> None: ...
 
 
@@ -472,6 +904,7 @@ async def obtain_write_locks(
     targets: CategoryIdentifier,
     serialisation_guarantee: LogEventSerialisationGuarantee,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> None: ...
 
 
@@ -479,8 +912,10 @@ async def obtain_write_locks(
 async def obtain_write_locks(
     cursor: AsyncCursor[StoredEvent[str, JsonValue]],
     targets: Sequence[StreamIdentifier],
-    serialisation_guarantee: StreamEventSerialisationGuarantee,
+    serialisation_guarantee: StreamEventSerialisationGuarantee
+    | StripedEventSerialisationGuarantee,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> None: ...
 
 
@@ -491,6 +926,7 @@ async def obtain_write_locks(
     | Sequence[StreamIdentifier],
     serialisation_guarantee: AnyEventSerialisationGuarantee,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> None:
     match targets, serialisation_guarantee:
         case StreamIdentifier() as target, _:
@@ -505,7 +941,10 @@ async def obtain_write_locks(
             query = obtain_write_locks_query(
                 target, serialisation_guarantee, table_settings
             )
-        case [*targets], StreamEventSerialisationGuarantee():
+        case [*targets], (
+            StreamEventSerialisationGuarantee()
+            | StripedEventSerialisationGuarantee()
+        ):
             query = obtain_write_locks_query(
                 targets, serialisation_guarantee, table_settings
             )
@@ -515,7 +954,33 @@ async def obtain_write_locks(
                 "CategoryIdentifier, or a sequence of StreamIdentifiers."
             )
 
-    await cursor.execute(*query)
+    statement, params = query
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("write-locks", len(params)),
+        query=lambda: statement,
+        params=params,
+    )
+
+
+async def obtain_group_write_locks(
+    cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+    targets: Sequence[StreamIdentifier],
+    serialisation_guarantee: AnyEventSerialisationGuarantee,
+    table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
+) -> None:
+    statement, params = obtain_group_write_locks_query(
+        targets, serialisation_guarantee, table_settings
+    )
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("write-locks", len(params)),
+        query=lambda: statement,
+        params=params,
+    )
 
 
 async def read_last(
@@ -523,8 +988,15 @@ async def read_last(
     *,
     parameters: LatestQueryParameters,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ):
-    await cursor.execute(*read_last_query(parameters, table_settings))
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=read_last_query_key(parameters, table_settings),
+        query=lambda: read_last_query(parameters, table_settings)[0],
+        params=read_last_query_params(parameters),
+    )
     return await cursor.fetchone()
 
 
@@ -533,15 +1005,109 @@ async def read_last_category_batch(
     *,
     parameters: CategoryStreamsLatestQueryParameters,
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ):
-    await cursor.execute(
-        *read_last_category_batch_query(parameters, table_settings)
+    statement, params = read_last_category_batch_query(
+        parameters, table_settings
+    )
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=(
+            "read-last-category-batch",
+            table_settings.table_name,
+            len(parameters.streams),
+        ),
+        query=lambda: statement,
+        params=params,
     )
     results = await cursor.fetchall()
 
     return {result.stream: result for result in results}
 
 
+async def scan_page(
+    cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+    *,
+    parameters: ScanQueryParameters,
+    constraint_converter: Converter[QueryConstraint, QueryApplier],
+    table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
+) -> AsyncCursor[StoredEvent[str, JsonValue]]:
+    shape = scan_query_shape(parameters, constraint_converter, table_settings)
+
+    if shape is None:
+        await cursor.execute(
+            *scan_query(parameters, constraint_converter, table_settings)
+        )
+    else:
+        key, params = shape
+        await execute_statement(
+            cursor,
+            statement_cache=statement_cache,
+            key=key,
+            query=lambda: scan_query(
+                parameters, constraint_converter, table_settings
+            )[0],
+            params=params,
+        )
+
+    return cursor
+
+
+def notify_query() -> sql.SQL:
+    return sql.SQL(
+        "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload;"
+    )
+
+
+async def notify(
+    cursor: AsyncCursor[Any],
+    *,
+    channel: str,
+    notifications: Sequence[EventNotification],
+    statement_cache: StatementCache | None = None,
+) -> None:
+    if not notifications:
+        return
+
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("notify",),
+        query=notify_query,
+        params=[
+            channel,
+            [
+                json.dumps(notification.serialise())
+                for notification in notifications
+            ],
+        ],
+    )
+
+
+def result_size_bytes(
+    cursor: AsyncCursor[Any], *, sample_rows: int = 16
+) -> int:
+    result = cursor.pgresult
+    if result is None or result.ntuples == 0:
+        return 0
+
+    # note: reading a value copies it out of the result, so only a spread
+    #       of rows is measured and the page size is extrapolated from them.
+    rows = result.ntuples
+    sampled = range(0, rows, max(1, rows // sample_rows))[:sample_rows]
+    sampled_size = sum(
+        len(value)
+        for row in sampled
+        for column in range(result.nfields)
+        for value in [result.get_value(row, column)]
+        if value is not None
+    )
+
+    return sampled_size * rows // len(sampled)
+
+
 async def insert_batch[Name: StringPersistable, Payload: JsonPersistable](
     cursor: AsyncCursor[StoredEvent[str, JsonValue]],
     *,
@@ -549,11 +1115,20 @@ async def insert_batch[Name: StringPersistable, Payload: JsonPersistable](
         StreamIdentifier, StreamInsertDefinition[Name, Payload]
     ],
     table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
 ) -> Mapping[StreamIdentifier, Sequence[StoredEvent[Name, Payload]]]:
     if not definitions:
         return {}
 
-    await cursor.execute(*insert_batch_query(definitions, table_settings))
+    params = insert_batch_query_params(definitions)
+    row_count = len(params) // 8
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("insert-batch", table_settings.table_name, row_count),
+        query=lambda: insert_batch_statement(row_count, table_settings),
+        params=params,
+    )
     stored_events = await cursor.fetchall()
 
     expected_event_count = sum(
@@ -593,6 +1168,96 @@ async def insert_batch[Name: StringPersistable, Payload: JsonPersistable](
     return results
 
 
+async def insert_batch_copy[Name: StringPersistable, Payload: JsonPersistable](
+    cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+    *,
+    definitions: Mapping[
+        StreamIdentifier, StreamInsertDefinition[Name, Payload]
+    ],
+    table_settings: TableSettings,
+    statement_cache: StatementCache | None = None,
+) -> Mapping[StreamIdentifier, Sequence[StoredEvent[Name, Payload]]]:
+    if not definitions:
+        return {}
+
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("create-copy-staging-table", table_settings.table_name),
+        query=lambda: create_copy_staging_table_query(table_settings)[0],
+        params=[],
+    )
+
+    ids: dict[StreamIdentifier, list[str]] = {}
+    async with cursor.copy(
+        copy_into_staging_table_query(table_settings)
+    ) as copy:
+        copy.set_types(copy_staging_table_types)
+
+        ordinal = 0
+        for identifier, definition in definitions.items():
+            events = definition["events"]
+            start_position = definition["position"]
+            stream_ids = ids.setdefault(identifier, [])
+
+            for i, event in enumerate(events):
+                id = uuid4().hex
+                stream_ids.append(id)
+                await copy.write_row(
+                    (
+                        ordinal,
+                        id,
+                        serialise_to_string(event.name),
+                        identifier.stream,
+                        identifier.category,
+                        start_position + i,
+                        Jsonb(serialise_to_json_value(event.payload)),
+                        event.observed_at,
+                        event.occurred_at,
+                    )
+                )
+                ordinal += 1
+
+    await execute_statement(
+        cursor,
+        statement_cache=statement_cache,
+        key=("insert-from-copy-staging-table", table_settings.table_name),
+        query=lambda: insert_from_staging_table_query(table_settings)[0],
+        params=[],
+    )
+    stored_events = {
+        stored_event.id: stored_event
+        for stored_event in await cursor.fetchall()
+    }
+
+    if len(stored_events) != ordinal:
+        raise RuntimeError(
+            f"Batch copy failed: expected {ordinal} rows, "
+            f"got {len(stored_events)}"
+        )
+
+    results: dict[StreamIdentifier, list[StoredEvent[Name, Payload]]] = {}
+
+    for identifier, definition in definitions.items():
+        results[identifier] = [
+            StoredEvent[Name, Payload](
+                id=stored_event.id,
+                name=event.name,
+                stream=stored_event.stream,
+                category=stored_event.category,
+                position=stored_event.position,
+                sequence_number=stored_event.sequence_number,
+                payload=event.payload,
+                observed_at=stored_event.observed_at,
+                occurred_at=stored_event.occurred_at,
+            )
+            for event, id in zip(definition["events"], ids[identifier])
+            for stored_event in [stored_events[id]]
+        ]
+
+    return results
+
+
 class PostgresEventStorageAdapter(EventStorageAdapter):
     def __init__(
         self,
@@ -606,6 +1271,9 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
         condition_converter: Converter[WriteCondition, WriteConditionEnforcer]
         | None = None,
         max_insert_batch_size: int = 1000,
+        scan_page_sizing_strategy: PageSizingStrategy | None = None,
+        notification_channel: str | None = None,
+        group_commit: GroupCommitSettings | None = None,
     ):
         if isinstance(connection_source, ConnectionSettings):
             self._connection_pool_owner = True
@@ -634,15 +1302,100 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
             )
         )
         self.max_insert_batch_size = max_insert_batch_size
+        self.notification_channel = notification_channel
+        self.scan_page_sizing_strategy = (
+            scan_page_sizing_strategy
+            if scan_page_sizing_strategy is not None
+            else FixedPageSizingStrategy(query_settings.scan_query_page_size)
+        )
+        self.statement_cache = StatementCache(
+            max_size=query_settings.statement_cache_size,
+            prepare=query_settings.prepare_statements,
+        )
+        self.stream_head_cache = StreamHeadCache(
+            max_size=query_settings.stream_head_cache_size
+        )
+        self.group_commit = group_commit
+        self._group_committer = (
+            WriteCoalescer[StreamSaveRequest, StreamSaveResult](
+                flush=self._save_stream_group,
+                max_batch_size=group_commit.max_batch_size,
+                max_wait=group_commit.max_wait,
+            )
+            if group_commit is not None
+            else None
+        )
+
+    @property
+    def scans_in_sequence_order(self) -> bool:
+        return (
+            self.query_settings.scan_ordering == ScanOrdering.SEQUENCE_NUMBER
+        )
 
     async def open(self) -> None:
         if self._connection_pool_owner:
             await self.connection_pool.open()
 
     async def close(self) -> None:
+        if self._group_committer is not None:
+            await self._group_committer.close()
         if self._connection_pool_owner:
             await self.connection_pool.close()
 
+    async def _insert_batch[
+        Name: StringPersistable,
+        Payload: JsonPersistable,
+    ](
+        self,
+        cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+        *,
+        definitions: Mapping[
+            StreamIdentifier, StreamInsertDefinition[Name, Payload]
+        ],
+    ) -> Mapping[StreamIdentifier, Sequence[StoredEvent[Name, Payload]]]:
+        copy_insert_threshold = self.query_settings.copy_insert_threshold
+        event_count = sum(
+            len(definition["events"]) for definition in definitions.values()
+        )
+
+        if (
+            copy_insert_threshold is not None
+            and event_count >= copy_insert_threshold
+        ):
+            return await insert_batch_copy(
+                cursor,
+                definitions=definitions,
+                table_settings=self.table_settings,
+                statement_cache=self.statement_cache,
+            )
+
+        return await insert_batch(
+            cursor,
+            definitions=definitions,
+            table_settings=self.table_settings,
+            statement_cache=self.statement_cache,
+        )
+
+    async def _notify[Name: StringPersistable, Payload: JsonPersistable](
+        self,
+        cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+        *,
+        results: Mapping[
+            StreamIdentifier, Sequence[StoredEvent[Name, Payload]]
+        ],
+    ) -> None:
+        if self.notification_channel is None:
+            return
+
+        await notify(
+            cursor,
+            channel=self.notification_channel,
+            notifications=event_notifications(
+                event for events in results.values() for event in events
+            ),
+            statement_cache=self.statement_cache,
+        )
+
     @overload
     async def save[Name: StringPersistable, Payload: JsonPersistable](
         self,
@@ -703,6 +1456,107 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
         target: StreamIdentifier,
         events: Sequence[NewEvent[Name, Payload]],
         condition: WriteCondition = NoCondition(),
+    ) -> Sequence[StoredEvent[Name, Payload]]:
+        if self._group_committer is not None:
+            return cast(
+                Sequence[StoredEvent[Name, Payload]],
+                await self._group_committer.submit(
+                    StreamSaveRequest(
+                        target=target, events=events, condition=condition
+                    )
+                ),
+            )
+
+        try:
+            stored_events = await self._try_save_to_stream(
+                target=target,
+                events=events,
+                condition=condition,
+                use_cached_heads=True,
+            )
+        except UniqueViolation:
+            if not self.stream_head_cache.enabled:
+                raise
+            self.stream_head_cache.invalidate([target])
+            stored_events = await self._try_save_to_stream(
+                target=target,
+                events=events,
+                condition=condition,
+                use_cached_heads=False,
+            )
+
+        self.stream_head_cache.record({target: stored_events})
+
+        return stored_events
+
+    async def _read_latest_event(
+        self,
+        cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+        *,
+        target: StreamIdentifier,
+        use_cached_heads: bool,
+    ) -> tuple[StoredEvent[str, JsonValue] | None, bool]:
+        if use_cached_heads:
+            cached_event = self.stream_head_cache.get(target)
+            if cached_event is not None:
+                return cached_event, True
+
+        latest_event = await read_last(
+            cursor,
+            parameters=LatestQueryParameters(target=target),
+            table_settings=self.table_settings,
+            statement_cache=self.statement_cache,
+        )
+
+        return latest_event, False
+
+    async def _enforce_condition(
+        self,
+        connection: AsyncConnection,
+        cursor: AsyncCursor[StoredEvent[str, JsonValue]],
+        *,
+        target: StreamIdentifier,
+        condition: WriteCondition,
+        latest_event: StoredEvent[str, JsonValue] | None,
+        cached: bool,
+    ) -> StoredEvent[str, JsonValue] | None:
+        condition_enforcer = self.condition_converter.convert(condition)
+
+        try:
+            await condition_enforcer.assert_satisfied(
+                context=WriteConditionEnforcerContext(
+                    identifier=target, latest_event=latest_event
+                ),
+                connection=connection,
+            )
+            return latest_event
+        except UnmetWriteConditionError:
+            if not cached:
+                raise
+
+        self.stream_head_cache.invalidate([target])
+        latest_event, _ = await self._read_latest_event(
+            cursor, target=target, use_cached_heads=False
+        )
+        await condition_enforcer.assert_satisfied(
+            context=WriteConditionEnforcerContext(
+                identifier=target, latest_event=latest_event
+            ),
+            connection=connection,
+        )
+
+        return latest_event
+
+    async def _try_save_to_stream[
+        Name: StringPersistable,
+        Payload: JsonPersistable,
+    ](
+        self,
+        *,
+        target: StreamIdentifier,
+        events: Sequence[NewEvent[Name, Payload]],
+        condition: WriteCondition,
+        use_cached_heads: bool,
     ) -> Sequence[StoredEvent[Name, Payload]]:
         async with self.connection_pool.connection() as connection:
             async with connection.cursor(
@@ -713,23 +1567,19 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                     target,
                     serialisation_guarantee=self.serialisation_guarantee,
                     table_settings=self.table_settings,
+                    statement_cache=self.statement_cache,
                 )
 
-                latest_event = await read_last(
-                    cursor,
-                    parameters=LatestQueryParameters(target=target),
-                    table_settings=self.table_settings,
-                )
-
-                condition_enforcer = self.condition_converter.convert(
-                    condition
+                latest_event, cached = await self._read_latest_event(
+                    cursor, target=target, use_cached_heads=use_cached_heads
                 )
-                await condition_enforcer.assert_satisfied(
-                    context=WriteConditionEnforcerContext(
-                        identifier=target,
-                        latest_event=latest_event,
-                    ),
-                    connection=connection,
+                latest_event = await self._enforce_condition(
+                    connection,
+                    cursor,
+                    target=target,
+                    condition=condition,
+                    latest_event=latest_event,
+                    cached=cached,
                 )
 
                 current_position = (
@@ -742,13 +1592,167 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                     )
                 }
 
-                batch_results = await insert_batch(
+                batch_results = await self._insert_batch(
+                    cursor, definitions=definitions
+                )
+                await self._notify(cursor, results=batch_results)
+
+                return batch_results[target]
+
+    async def _save_stream_group(
+        self,
+        writes: Sequence[PendingWrite[StreamSaveRequest, StreamSaveResult]],
+    ) -> None:
+        try:
+            completed, failed, inserted = await self._try_save_stream_group(
+                writes, use_cached_heads=True
+            )
+        except UniqueViolation:
+            if not self.stream_head_cache.enabled:
+                raise
+            self.stream_head_cache.invalidate(
+                write.request.target for write in writes
+            )
+            completed, failed, inserted = await self._try_save_stream_group(
+                writes, use_cached_heads=False
+            )
+
+        self.stream_head_cache.record(inserted)
+
+        for write, error in failed:
+            if not write.future.done():
+                write.future.set_exception(error)
+        for write, stored_events in completed:
+            if not write.future.done():
+                write.future.set_result(stored_events)
+
+    async def _try_save_stream_group(
+        self,
+        writes: Sequence[PendingWrite[StreamSaveRequest, StreamSaveResult]],
+        *,
+        use_cached_heads: bool,
+    ) -> tuple[
+        Sequence[
+            tuple[
+                PendingWrite[StreamSaveRequest, StreamSaveResult],
+                StreamSaveResult,
+            ]
+        ],
+        Sequence[
+            tuple[
+                PendingWrite[StreamSaveRequest, StreamSaveResult],
+                UnmetWriteConditionError,
+            ]
+        ],
+        Mapping[StreamIdentifier, Sequence[StoredEvent[Any, Any]]],
+    ]:
+        completed: list[
+            tuple[
+                PendingWrite[StreamSaveRequest, StreamSaveResult],
+                StreamSaveResult,
+            ]
+        ] = []
+        failed: list[
+            tuple[
+                PendingWrite[StreamSaveRequest, StreamSaveResult],
+                UnmetWriteConditionError,
+            ]
+        ] = []
+        inserted: dict[StreamIdentifier, list[StoredEvent[Any, Any]]] = {}
+
+        async with self.connection_pool.connection() as connection:
+            async with connection.cursor(
+                row_factory=class_row(StoredEvent[str, JsonValue])
+            ) as cursor:
+                await obtain_group_write_locks(
                     cursor,
-                    definitions=definitions,
+                    [write.request.target for write in writes],
+                    serialisation_guarantee=self.serialisation_guarantee,
                     table_settings=self.table_settings,
+                    statement_cache=self.statement_cache,
                 )
 
-                return batch_results[target]
+                latest_events: dict[
+                    StreamIdentifier, StoredEvent[Any, Any] | None
+                ] = {}
+                cached_targets: set[StreamIdentifier] = set()
+                pending: dict[
+                    StreamIdentifier,
+                    tuple[
+                        PendingWrite[StreamSaveRequest, StreamSaveResult],
+                        StreamInsertDefinition[
+                            StringPersistable, JsonPersistable
+                        ],
+                    ],
+                ] = {}
+
+                async def insert_pending() -> None:
+                    if not pending:
+                        return
+
+                    batch_results = await self._insert_batch(
+                        cursor,
+                        definitions={
+                            target: definition
+                            for target, (_, definition) in pending.items()
+                        },
+                    )
+                    for target, (write, _) in pending.items():
+                        stored_events = batch_results[target]
+                        if stored_events:
+                            latest_events[target] = stored_events[-1]
+                            cached_targets.discard(target)
+                        inserted.setdefault(target, []).extend(stored_events)
+                        completed.append((write, stored_events))
+                    pending.clear()
+
+                for write in writes:
+                    target = write.request.target
+                    if target in pending:
+                        await insert_pending()
+
+                    if target not in latest_events:
+                        latest_event, cached = await self._read_latest_event(
+                            cursor,
+                            target=target,
+                            use_cached_heads=use_cached_heads,
+                        )
+                        latest_events[target] = latest_event
+                        if cached:
+                            cached_targets.add(target)
+
+                    try:
+                        latest_event = await self._enforce_condition(
+                            connection,
+                            cursor,
+                            target=target,
+                            condition=write.request.condition,
+                            latest_event=latest_events[target],
+                            cached=target in cached_targets,
+                        )
+                    except UnmetWriteConditionError as error:
+                        failed.append((write, error))
+                        continue
+                    latest_events[target] = latest_event
+
+                    pending[target] = (
+                        write,
+                        StreamInsertDefinition[
+                            StringPersistable, JsonPersistable
+                        ](
+                            events=write.request.events,
+                            position=(
+                                latest_event.position + 1
+                                if latest_event
+                                else 0
+                            ),
+                        ),
+                    )
+
+                await insert_pending()
+                await self._notify(cursor, results=inserted)
+
+        return completed, failed, inserted
 
     async def _save_to_category[
         Name: StringPersistable,
@@ -758,6 +1762,42 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
         *,
         target: CategoryIdentifier,
         streams: Mapping[str, StreamPublishDefinition[Name, Payload]],
+    ) -> Mapping[str, Sequence[StoredEvent[Name, Payload]]]:
+        try:
+            results = await self._try_save_to_category(
+                target=target, streams=streams, use_cached_heads=True
+            )
+        except UniqueViolation:
+            if not self.stream_head_cache.enabled:
+                raise
+            self.stream_head_cache.invalidate(
+                StreamIdentifier(category=target.category, stream=stream)
+                for stream in streams.keys()
+            )
+            results = await self._try_save_to_category(
+                target=target, streams=streams, use_cached_heads=False
+            )
+
+        self.stream_head_cache.record(
+            {
+                StreamIdentifier(
+                    category=target.category, stream=stream
+                ): stored_events
+                for stream, stored_events in results.items()
+            }
+        )
+
+        return results
+
+    async def _try_save_to_category[
+        Name: StringPersistable,
+        Payload: JsonPersistable,
+    ](
+        self,
+        *,
+        target: CategoryIdentifier,
+        streams: Mapping[str, StreamPublishDefinition[Name, Payload]],
+        use_cached_heads: bool,
     ) -> Mapping[str, Sequence[StoredEvent[Name, Payload]]]:
         async with self.connection_pool.connection() as connection:
             async with connection.cursor(
@@ -765,7 +1805,8 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
             ) as cursor:
                 if isinstance(
                     self.serialisation_guarantee,
-                    StreamEventSerialisationGuarantee,
+                    StreamEventSerialisationGuarantee
+                    | StripedEventSerialisationGuarantee,
                 ):
                     await obtain_write_locks(
                         cursor,
@@ -777,6 +1818,7 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                         ],
                         serialisation_guarantee=self.serialisation_guarantee,
                         table_settings=self.table_settings,
+                        statement_cache=self.statement_cache,
                     )
                 else:
                     await obtain_write_locks(
@@ -784,19 +1826,43 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                         target,
                         serialisation_guarantee=self.serialisation_guarantee,
                         table_settings=self.table_settings,
+                        statement_cache=self.statement_cache,
                     )
 
                 definitions: dict[
                     StreamIdentifier, StreamInsertDefinition[Name, Payload]
                 ] = {}
 
-                latest_events = await read_last_category_batch(
-                    cursor,
-                    parameters=CategoryStreamsLatestQueryParameters(
-                        target=target, streams=list(streams.keys())
-                    ),
-                    table_settings=self.table_settings,
-                )
+                latest_events: dict[
+                    str, StoredEvent[str, JsonValue] | None
+                ] = {}
+                if use_cached_heads:
+                    for stream_name in streams.keys():
+                        cached_event = self.stream_head_cache.get(
+                            StreamIdentifier(
+                                category=target.category, stream=stream_name
+                            )
+                        )
+                        if cached_event is not None:
+                            latest_events[stream_name] = cached_event
+                cached_streams = set(latest_events.keys())
+
+                uncached_streams = [
+                    stream_name
+                    for stream_name in streams.keys()
+                    if stream_name not in cached_streams
+                ]
+                if uncached_streams:
+                    latest_events.update(
+                        await read_last_category_batch(
+                            cursor,
+                            parameters=CategoryStreamsLatestQueryParameters(
+                                target=target, streams=uncached_streams
+                            ),
+                            table_settings=self.table_settings,
+                            statement_cache=self.statement_cache,
+                        )
+                    )
 
                 for stream_name, stream_request in streams.items():
                     identifier = StreamIdentifier(
@@ -806,17 +1872,13 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                     condition = stream_request.get("condition", NoCondition())
                     events = stream_request["events"]
 
-                    latest_event = latest_events.get(stream_name, None)
-
-                    condition_enforcer = self.condition_converter.convert(
-                        condition
-                    )
-                    await condition_enforcer.assert_satisfied(
-                        context=WriteConditionEnforcerContext(
-                            identifier=identifier,
-                            latest_event=latest_event,
-                        ),
-                        connection=connection,
+                    latest_event = await self._enforce_condition(
+                        connection,
+                        cursor,
+                        target=identifier,
+                        condition=condition,
+                        latest_event=latest_events.get(stream_name, None),
+                        cached=stream_name in cached_streams,
                     )
 
                     current_position = (
@@ -827,11 +1889,10 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                         Name, Payload
                     ](events=events, position=current_position)
 
-                batch_results = await insert_batch(
-                    cursor,
-                    definitions=definitions,
-                    table_settings=self.table_settings,
+                batch_results = await self._insert_batch(
+                    cursor, definitions=definitions
                 )
+                await self._notify(cursor, results=batch_results)
 
                 results: dict[str, Sequence[StoredEvent[Name, Payload]]] = {}
                 for stream_name in streams.keys():
@@ -849,13 +1910,12 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
             async with connection.cursor(
                 row_factory=class_row(StoredEvent[str, JsonValue])
             ) as cursor:
-                await cursor.execute(
-                    *read_last_query(
-                        parameters=LatestQueryParameters(target=target),
-                        table_settings=self.table_settings,
-                    )
+                return await read_last(
+                    cursor,
+                    parameters=LatestQueryParameters(target=target),
+                    table_settings=self.table_settings,
+                    statement_cache=self.statement_cache,
                 )
-                return await cursor.fetchone()
 
     async def scan(
         self,
@@ -863,15 +1923,68 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
         target: Scannable = LogIdentifier(),
         constraints: Set[QueryConstraint] = frozenset(),
     ) -> AsyncIterator[StoredEvent[str, JsonValue]]:
+        match self.query_settings.scan_mode:
+            case ScanMode.STREAMED:
+                events = self._scan_streamed(
+                    target=target, constraints=constraints
+                )
+            case ScanMode.PAGED:
+                events = self._scan_paged(
+                    target=target, constraints=constraints
+                )
+
+        async with aclosing(events):
+            async for event in events:
+                yield event
+
+    async def _scan_streamed(
+        self,
+        *,
+        target: Scannable,
+        constraints: Set[QueryConstraint],
+    ) -> AsyncGenerator[StoredEvent[str, JsonValue]]:
+        async with self.connection_pool.connection() as connection:
+            await connection.execute(
+                "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"
+            )
+            async with connection.cursor(
+                name=f"scan_{uuid4().hex}",
+                row_factory=class_row(StoredEvent[str, JsonValue]),
+            ) as cursor:
+                cursor.itersize = self.query_settings.scan_stream_batch_size
+                await cursor.execute(
+                    *scan_query(
+                        parameters=ScanQueryParameters(
+                            target=target,
+                            constraints=constraints,
+                            page_size=None,
+                            ordering=self.query_settings.scan_ordering,
+                        ),
+                        constraint_converter=self.constraint_converter,
+                        table_settings=self.table_settings,
+                    )
+                )
+
+                async for event in cursor:
+                    yield event
+
+    async def _scan_paged(
+        self,
+        *,
+        target: Scannable,
+        constraints: Set[QueryConstraint],
+    ) -> AsyncGenerator[StoredEvent[str, JsonValue]]:
         async with self.connection_pool.connection() as connection:
             async with connection.cursor(
                 row_factory=class_row(StoredEvent[str, JsonValue])
             ) as cursor:
-                page_size = self.query_settings.scan_query_page_size
+                page_sizing_strategy = self.scan_page_sizing_strategy
                 last_sequence_number = None
                 keep_querying = True
 
                 while keep_querying:
+                    page_size = page_sizing_strategy.page_size(target)
+
                     if last_sequence_number is not None:
                         constraint = SequenceNumberAfterConstraint(
                             sequence_number=last_sequence_number
@@ -889,15 +2002,30 @@ class PostgresEventStorageAdapter(EventStorageAdapter):
                         target=target,
                         page_size=page_size,
                         constraints=constraints,
+                        ordering=self.query_settings.scan_ordering,
                     )
-                    results = await cursor.execute(
-                        *scan_query(
-                            parameters=parameters,
-                            constraint_converter=self.constraint_converter,
-                            table_settings=self.table_settings,
-                        )
+                    started_at = time.perf_counter()
+                    results = await scan_page(
+                        cursor,
+                        parameters=parameters,
+                        constraint_converter=self.constraint_converter,
+                        table_settings=self.table_settings,
+                        statement_cache=self.statement_cache,
                     )
 
+                    if page_sizing_strategy.observes_pages:
+                        page_sizing_strategy.observe(
+                            target,
+                            ScanPageObservation(
+                                page_size=page_size,
+                                rows=results.rowcount,
+                                size_bytes=result_size_bytes(results),
+                                duration_seconds=(
+                                    time.perf_counter() - started_at
+                                ),
+                            ),
+                        )
+
                     keep_querying = results.rowcount == page_size
 
                     async for event in results:
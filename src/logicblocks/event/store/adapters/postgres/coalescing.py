@@ -0,0 +1,113 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from weakref import WeakKeyDictionary
+
+
+@dataclass(frozen=True)
+class PendingWrite[Request, Result]:
+    request: Request
+    future: asyncio.Future[Result]
+
+
+class WriteBatch[Request, Result]:
+    def __init__(
+        self,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        flush: Callable[
+            [Sequence[PendingWrite[Request, Result]]], Awaitable[None]
+        ],
+    ):
+        self.loop = loop
+        self.pending: list[PendingWrite[Request, Result]] = []
+        self.timer: asyncio.TimerHandle | None = None
+        self.flushes: set[asyncio.Task[None]] = set()
+        self._flush = flush
+
+    def start_flush(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        batch = [write for write in self.pending if not write.future.done()]
+        self.pending = []
+        if not batch:
+            return
+
+        task = self.loop.create_task(self._flush_batch(batch))
+        self.flushes.add(task)
+        task.add_done_callback(self.flushes.discard)
+
+    async def _flush_batch(
+        self, batch: Sequence[PendingWrite[Request, Result]]
+    ) -> None:
+        try:
+            await self._flush(batch)
+        except asyncio.CancelledError:
+            for write in batch:
+                write.future.cancel()
+            raise
+        except BaseException as error:
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(error)
+        else:
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(
+                        RuntimeError("Write was not completed by flush.")
+                    )
+
+
+class WriteCoalescer[Request, Result]:
+    def __init__(
+        self,
+        *,
+        flush: Callable[
+            [Sequence[PendingWrite[Request, Result]]], Awaitable[None]
+        ],
+        max_batch_size: int,
+        max_wait: timedelta,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be at least 1.")
+
+        self._flush = flush
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._batches: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, WriteBatch[Request, Result]
+        ] = WeakKeyDictionary()
+
+    async def submit(self, request: Request) -> Result:
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop, None)
+        if batch is None:
+            batch = WriteBatch[Request, Result](loop=loop, flush=self._flush)
+            self._batches[loop] = batch
+
+        future: asyncio.Future[Result] = loop.create_future()
+        batch.pending.append(PendingWrite(request=request, future=future))
+
+        if len(batch.pending) >= self._max_batch_size:
+            batch.start_flush()
+        elif batch.timer is None:
+            batch.timer = loop.call_later(
+                self._max_wait.total_seconds(), batch.start_flush
+            )
+
+        return await future
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        for batch_loop, batch in list(self._batches.items()):
+            if batch_loop is not loop:
+                if not batch_loop.is_closed():
+                    batch_loop.call_soon_threadsafe(batch.start_flush)
+                continue
+
+            batch.start_flush()
+            if batch.flushes:
+                await asyncio.gather(*batch.flushes, return_exceptions=True)
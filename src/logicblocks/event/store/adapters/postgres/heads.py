@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from logicblocks.event.types import JsonValue, StoredEvent, StreamIdentifier
+
+
+@dataclass
+class StreamHeadCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class StreamHeadCache:
+    def __init__(self, *, max_size: int = 0):
+        self._heads: OrderedDict[
+            StreamIdentifier, StoredEvent[str, JsonValue]
+        ] = OrderedDict()
+        self._max_size = max_size
+        self.metrics = StreamHeadCacheMetrics()
+
+    def __len__(self) -> int:
+        return len(self._heads)
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def get(
+        self, target: StreamIdentifier
+    ) -> StoredEvent[str, JsonValue] | None:
+        if not self.enabled:
+            return None
+
+        head = self._heads.get(target, None)
+        if head is None:
+            self.metrics.misses += 1
+            return None
+
+        self._heads.move_to_end(target)
+        self.metrics.hits += 1
+        return head
+
+    def record(
+        self,
+        results: Mapping[StreamIdentifier, Sequence[StoredEvent[Any, Any]]],
+    ) -> None:
+        if not self.enabled:
+            return
+
+        for target, events in results.items():
+            if not events:
+                continue
+            self._heads[target] = events[-1]
+            self._heads.move_to_end(target)
+
+        while len(self._heads) > self._max_size:
+            self._heads.popitem(last=False)
+
+    def invalidate(self, targets: Iterable[StreamIdentifier]) -> None:
+        for target in targets:
+            if self._heads.pop(target, None) is not None:
+                self.metrics.invalidations += 1
+
+    def clear(self) -> None:
+        self._heads.clear()
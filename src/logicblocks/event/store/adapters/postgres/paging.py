@@ -0,0 +1,149 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import structlog
+from structlog.typing import FilteringBoundLogger
+
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    LogIdentifier,
+    StreamIdentifier,
+)
+
+from ..base import Scannable
+
+_default_logger = structlog.get_logger("logicblocks.event.store")
+
+
+def scan_target_kind(target: Scannable) -> str:
+    match target:
+        case LogIdentifier():
+            return "log"
+        case CategoryIdentifier():
+            return "category"
+        case StreamIdentifier():
+            return "stream"
+
+
+@dataclass(frozen=True)
+class ScanPageObservation:
+    page_size: int
+    rows: int
+    size_bytes: int
+    duration_seconds: float
+
+
+class PageSizingStrategy(ABC):
+    @property
+    def observes_pages(self) -> bool:
+        return False
+
+    @abstractmethod
+    def page_size(self, target: Scannable) -> int:
+        raise NotImplementedError
+
+    def observe(
+        self, target: Scannable, observation: ScanPageObservation
+    ) -> None:
+        return None
+
+
+class FixedPageSizingStrategy(PageSizingStrategy):
+    def __init__(self, page_size: int):
+        self._page_size = page_size
+
+    def page_size(self, target: Scannable) -> int:
+        return self._page_size
+
+
+class AdaptivePageSizingStrategy(PageSizingStrategy):
+    def __init__(
+        self,
+        *,
+        initial_page_size: int = 100,
+        minimum_page_size: int = 10,
+        maximum_page_size: int = 10000,
+        target_bytes_per_page: int = 1024 * 1024,
+        target_seconds_per_page: float = 0.1,
+        maximum_growth_factor: float = 2.0,
+        maximum_tracked_targets: int = 1024,
+        logger: FilteringBoundLogger = _default_logger,
+    ):
+        if not minimum_page_size <= initial_page_size <= maximum_page_size:
+            raise ValueError(
+                "Initial page size must be between minimum and maximum "
+                "page sizes."
+            )
+        if maximum_growth_factor < 1.0:
+            raise ValueError("Maximum growth factor must be at least 1.")
+        if maximum_tracked_targets < 1:
+            raise ValueError("Maximum tracked targets must be at least 1.")
+
+        self._initial_page_size = initial_page_size
+        self._minimum_page_size = minimum_page_size
+        self._maximum_page_size = maximum_page_size
+        self._target_bytes_per_page = target_bytes_per_page
+        self._target_seconds_per_page = target_seconds_per_page
+        self._maximum_growth_factor = maximum_growth_factor
+        self._maximum_tracked_targets = maximum_tracked_targets
+        self._logger = logger
+        self._page_sizes: OrderedDict[Scannable, int] = OrderedDict()
+
+    @property
+    def observes_pages(self) -> bool:
+        return True
+
+    @property
+    def page_sizes(self) -> Mapping[Scannable, int]:
+        return dict(self._page_sizes)
+
+    def page_size(self, target: Scannable) -> int:
+        return self._page_sizes.get(target, self._initial_page_size)
+
+    def observe(
+        self, target: Scannable, observation: ScanPageObservation
+    ) -> None:
+        # note: a short page is the tail of a scan, whose cost is dominated
+        #       by per-query overhead rather than per-row work, so it says
+        #       nothing about how large a full page should be.
+        if observation.rows == 0 or observation.rows < observation.page_size:
+            return
+
+        current = self._page_sizes.get(target, self._initial_page_size)
+
+        desired = self._maximum_page_size
+        if observation.size_bytes > 0:
+            bytes_per_row = observation.size_bytes / observation.rows
+            desired = min(desired, self._target_bytes_per_page / bytes_per_row)
+        if observation.duration_seconds > 0:
+            seconds_per_row = observation.duration_seconds / observation.rows
+            desired = min(
+                desired, self._target_seconds_per_page / seconds_per_row
+            )
+
+        desired = min(
+            max(desired, current / self._maximum_growth_factor),
+            current * self._maximum_growth_factor,
+        )
+        adjusted = max(
+            self._minimum_page_size,
+            min(self._maximum_page_size, int(desired)),
+        )
+
+        self._page_sizes[target] = adjusted
+        self._page_sizes.move_to_end(target)
+        while len(self._page_sizes) > self._maximum_tracked_targets:
+            self._page_sizes.popitem(last=False)
+
+        if adjusted != current:
+            self._logger.debug(
+                "event.store.scan.page-size-adjusted",
+                target_kind=scan_target_kind(target),
+                previous_page_size=current,
+                page_size=adjusted,
+                rows=observation.rows,
+                size_bytes=observation.size_bytes,
+                duration_seconds=observation.duration_seconds,
+            )
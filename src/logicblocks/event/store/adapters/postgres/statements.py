@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from psycopg import AsyncCursor, abc, sql
+
+
+@dataclass
+class StatementCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+
+
+def render_statement(query: abc.Query) -> bytes:
+    match query:
+        case bytes():
+            return query
+        case str():
+            return query.encode("utf-8")
+        case sql.Composable():
+            return query.as_bytes(None)
+
+
+class StatementCache:
+    def __init__(self, *, max_size: int = 256, prepare: bool | None = None):
+        self._statements: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._max_size = max_size
+        self.prepare = prepare
+        self.metrics = StatementCacheMetrics()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def statement(
+        self, key: Hashable, factory: Callable[[], abc.Query]
+    ) -> bytes:
+        statement = self._statements.get(key, None)
+        if statement is not None:
+            self._statements.move_to_end(key)
+            self.metrics.hits += 1
+            return statement
+
+        self.metrics.misses += 1
+        statement = render_statement(factory())
+
+        if self._max_size > 0:
+            self._statements[key] = statement
+            if len(self._statements) > self._max_size:
+                self._statements.popitem(last=False)
+
+        return statement
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+
+async def execute_statement(
+    cursor: AsyncCursor[Any],
+    *,
+    statement_cache: StatementCache | None,
+    key: Hashable,
+    query: Callable[[], abc.Query],
+    params: Sequence[Any],
+) -> None:
+    if statement_cache is None:
+        await cursor.execute(query(), params)
+    else:
+        await cursor.execute(
+            statement_cache.statement(key, query),
+            params,
+            prepare=statement_cache.prepare,
+        )
@@ -0,0 +1,5 @@
+from .adapter import SqliteEventStorageAdapter as SqliteEventStorageAdapter
+
+__all__ = [
+    "SqliteEventStorageAdapter",
+]
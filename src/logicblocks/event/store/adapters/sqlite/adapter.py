@@ -0,0 +1,438 @@
+import json
+import sqlite3
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Mapping,
+    Sequence,
+    Set,
+)
+from datetime import datetime
+from functools import lru_cache
+from typing import overload
+from uuid import uuid4
+
+from logicblocks.event.persistence import sqlite
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    Converter,
+    JsonPersistable,
+    JsonValue,
+    LogIdentifier,
+    NewEvent,
+    StoredEvent,
+    StreamIdentifier,
+    StringPersistable,
+    serialise_to_json_value,
+    serialise_to_string,
+)
+
+from ...conditions import NoCondition, WriteCondition
+from ...constraints import QueryConstraint
+from ...types import StreamPublishDefinition
+from ..base import (
+    EventStorageAdapter,
+    Latestable,
+    Saveable,
+    Scannable,
+)
+from .converters import (
+    QueryConstraintCondition,
+    TypeRegistryConditionConverter,
+    TypeRegistryConstraintConverter,
+    WriteConditionEnforcer,
+    WriteConditionEnforcerContext,
+)
+
+type EventRow = tuple[int, str, str, str, str, int, str, str, str]
+
+event_columns = (
+    "sequence_number, id, name, stream, category, position, "
+    "payload, observed_at, occurred_at"
+)
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=64)
+def create_table_statements(table_name: str) -> Sequence[str]:
+    table = quote_identifier(table_name)
+    return [
+        f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            sequence_number INTEGER PRIMARY KEY,
+            id TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            stream TEXT NOT NULL,
+            category TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            observed_at TEXT NOT NULL,
+            occurred_at TEXT NOT NULL
+        )
+        """,
+        f"""
+        CREATE UNIQUE INDEX IF NOT EXISTS
+            {quote_identifier(f"{table_name}_stream_position_index")}
+        ON {table} (category, stream, position)
+        """,
+        f"""
+        CREATE INDEX IF NOT EXISTS
+            {quote_identifier(f"{table_name}_category_index")}
+        ON {table} (category, sequence_number)
+        """,
+    ]
+
+
+@lru_cache(maxsize=64)
+def insert_statement(table_name: str) -> str:
+    return (
+        f"INSERT INTO {quote_identifier(table_name)} ({event_columns}) "
+        f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+
+@lru_cache(maxsize=64)
+def next_sequence_number_statement(table_name: str) -> str:
+    return (
+        f"SELECT COALESCE(MAX(sequence_number), 0) + 1 "
+        f"FROM {quote_identifier(table_name)}"
+    )
+
+
+@lru_cache(maxsize=64)
+def read_last_statement(
+    table_name: str, condition: str, order_column: str
+) -> str:
+    return (
+        f"SELECT {event_columns} FROM {quote_identifier(table_name)} "
+        f"WHERE {condition} "
+        f"ORDER BY {order_column} DESC LIMIT 1"
+    )
+
+
+def target_condition(target: Scannable) -> QueryConstraintCondition:
+    match target:
+        case LogIdentifier():
+            return "1 = 1", []
+        case CategoryIdentifier(category):
+            return "category = ?", [category]
+        case StreamIdentifier(category, stream):
+            return "category = ? AND stream = ?", [category, stream]
+        case _:  # pragma: no cover
+            raise ValueError(f"Unknown target: {target}")
+
+
+def scan_page_statement(table_name: str, conditions: Sequence[str]) -> str:
+    return (
+        f"SELECT {event_columns} FROM {quote_identifier(table_name)} "
+        f"WHERE {' AND '.join(conditions)} AND sequence_number > ? "
+        f"ORDER BY sequence_number LIMIT ?"
+    )
+
+
+def event_row(
+    event: NewEvent[StringPersistable, JsonPersistable],
+    *,
+    target: StreamIdentifier,
+    position: int,
+    sequence_number: int,
+) -> EventRow:
+    return (
+        sequence_number,
+        uuid4().hex,
+        serialise_to_string(event.name),
+        target.stream,
+        target.category,
+        position,
+        json.dumps(serialise_to_json_value(event.payload)),
+        event.observed_at.isoformat(),
+        event.occurred_at.isoformat(),
+    )
+
+
+def row_event(row: EventRow) -> StoredEvent[str, JsonValue]:
+    (
+        sequence_number,
+        id,
+        name,
+        stream,
+        category,
+        position,
+        payload,
+        observed_at,
+        occurred_at,
+    ) = row
+    return StoredEvent[str, JsonValue](
+        id=id,
+        name=name,
+        stream=stream,
+        category=category,
+        position=position,
+        sequence_number=sequence_number,
+        payload=json.loads(payload),
+        observed_at=datetime.fromisoformat(observed_at),
+        occurred_at=datetime.fromisoformat(occurred_at),
+    )
+
+
+def inserted_event[Name: StringPersistable, Payload: JsonPersistable](
+    event: NewEvent[Name, Payload], row: EventRow
+) -> StoredEvent[Name, Payload]:
+    sequence_number, id, _, stream, category, position, *_ = row
+    return StoredEvent[Name, Payload](
+        id=id,
+        name=event.name,
+        stream=stream,
+        category=category,
+        position=position,
+        sequence_number=sequence_number,
+        payload=event.payload,
+        observed_at=event.observed_at,
+        occurred_at=event.occurred_at,
+    )
+
+
+class SqliteEventStorageAdapter(EventStorageAdapter):
+    def __init__(
+        self,
+        *,
+        connection_source: sqlite.ConnectionSource,
+        table_settings: sqlite.TableSettings = sqlite.TableSettings(
+            table_name="events"
+        ),
+        constraint_converter: Converter[
+            QueryConstraint, QueryConstraintCondition
+        ]
+        | None = None,
+        condition_converter: Converter[WriteCondition, WriteConditionEnforcer]
+        | None = None,
+        scan_page_size: int = 1000,
+    ):
+        if isinstance(connection_source, sqlite.ConnectionSettings):
+            self._connection_owner = True
+            self.connection = sqlite.Connection(connection_source)
+        else:
+            self._connection_owner = False
+            self.connection = connection_source
+
+        self.table_settings = table_settings
+        self.scan_page_size = scan_page_size
+        self._constraint_converter = (
+            constraint_converter
+            if constraint_converter is not None
+            else (
+                TypeRegistryConstraintConverter().with_default_constraint_converters()
+            )
+        )
+        self._condition_converter = (
+            condition_converter
+            if condition_converter is not None
+            else (
+                TypeRegistryConditionConverter().with_default_condition_converters()
+            )
+        )
+        self._table_created = False
+
+    async def close(self) -> None:
+        if self._connection_owner:
+            await self.connection.close()
+
+    async def _run[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        def run(connection: sqlite3.Connection) -> T:
+            if not self._table_created:
+                for statement in create_table_statements(
+                    self.table_settings.table_name
+                ):
+                    connection.execute(statement)
+                self._table_created = True
+            return function(connection)
+
+        return await self.connection.run(run)
+
+    @overload
+    async def save[Name: StringPersistable, Payload: JsonPersistable](
+        self,
+        *,
+        target: StreamIdentifier,
+        events: Sequence[NewEvent[Name, Payload]],
+        condition: WriteCondition = NoCondition(),
+    ) -> Sequence[StoredEvent[Name, Payload]]: ...
+
+    @overload
+    async def save[Name: StringPersistable, Payload: JsonPersistable](
+        self,
+        *,
+        target: CategoryIdentifier,
+        streams: Mapping[str, StreamPublishDefinition[Name, Payload]],
+    ) -> Mapping[str, Sequence[StoredEvent[Name, Payload]]]: ...
+
+    async def save[Name: StringPersistable, Payload: JsonPersistable](
+        self,
+        *,
+        target: Saveable,
+        events: Sequence[NewEvent[Name, Payload]] | None = None,
+        condition: WriteCondition = NoCondition(),
+        streams: Mapping[str, StreamPublishDefinition[Name, Payload]]
+        | None = None,
+    ) -> (
+        Sequence[StoredEvent[Name, Payload]]
+        | Mapping[str, Sequence[StoredEvent[Name, Payload]]]
+    ):
+        match target:
+            case StreamIdentifier():
+                if events is None:
+                    raise ValueError(
+                        "The `events` parameter must be provided for "
+                        "stream level publish."
+                    )
+                results = await self._run(
+                    lambda connection: self._save_streams(
+                        connection, {target: (events, condition)}
+                    )
+                )
+                return results[target]
+            case CategoryIdentifier():
+                if streams is None:
+                    raise ValueError(
+                        "The `streams` parameter must be provided for "
+                        "category level publish."
+                    )
+                requests = {
+                    StreamIdentifier(
+                        category=target.category, stream=stream_name
+                    ): (
+                        streams[stream_name]["events"],
+                        streams[stream_name].get("condition", NoCondition()),
+                    )
+                    for stream_name in sorted(streams.keys())
+                }
+                results = await self._run(
+                    lambda connection: self._save_streams(connection, requests)
+                )
+                return {
+                    stream_target.stream: stream_events
+                    for stream_target, stream_events in results.items()
+                }
+            case _:
+                raise ValueError(f"Unsupported target type: {type(target)}")
+
+    def _save_streams[Name: StringPersistable, Payload: JsonPersistable](
+        self,
+        connection: sqlite3.Connection,
+        requests: Mapping[
+            StreamIdentifier,
+            tuple[Sequence[NewEvent[Name, Payload]], WriteCondition],
+        ],
+    ) -> Mapping[StreamIdentifier, Sequence[StoredEvent[Name, Payload]]]:
+        table_name = self.table_settings.table_name
+
+        with sqlite.transaction(connection):
+            (sequence_number,) = connection.execute(
+                next_sequence_number_statement(table_name)
+            ).fetchone()
+
+            rows: list[EventRow] = []
+            results: dict[
+                StreamIdentifier, Sequence[StoredEvent[Name, Payload]]
+            ] = {}
+
+            for target, (events, condition) in requests.items():
+                latest_event = self._read_last(connection, target)
+
+                enforcer = self._condition_converter.convert(condition)
+                enforcer.assert_satisfied(
+                    context=WriteConditionEnforcerContext(
+                        identifier=target, latest_event=latest_event
+                    ),
+                    transaction=connection,
+                )
+
+                last_position = (
+                    latest_event.position if latest_event is not None else -1
+                )
+                stream_rows = [
+                    event_row(
+                        event,
+                        target=target,
+                        position=last_position + count + 1,
+                        sequence_number=sequence_number + len(rows) + count,
+                    )
+                    for count, event in enumerate(events)
+                ]
+                results[target] = [
+                    inserted_event(event, row)
+                    for event, row in zip(events, stream_rows)
+                ]
+                rows.extend(stream_rows)
+
+            connection.executemany(insert_statement(table_name), rows)
+
+        return results
+
+    def _read_last(
+        self, connection: sqlite3.Connection, target: Latestable
+    ) -> StoredEvent[str, JsonValue] | None:
+        condition, params = target_condition(target)
+        order_column = (
+            "position"
+            if isinstance(target, StreamIdentifier)
+            else "sequence_number"
+        )
+        row = connection.execute(
+            read_last_statement(
+                self.table_settings.table_name, condition, order_column
+            ),
+            params,
+        ).fetchone()
+        return row_event(row) if row is not None else None
+
+    async def latest(
+        self, *, target: Latestable
+    ) -> StoredEvent[str, JsonValue] | None:
+        return await self._run(
+            lambda connection: self._read_last(connection, target)
+        )
+
+    async def scan(
+        self,
+        *,
+        target: Scannable = LogIdentifier(),
+        constraints: Set[QueryConstraint] = frozenset(),
+    ) -> AsyncIterator[StoredEvent[str, JsonValue]]:
+        condition, params = target_condition(target)
+        conditions = [condition]
+        parameters = list(params)
+        for constraint in constraints:
+            constraint_condition, constraint_params = (
+                self._constraint_converter.convert(constraint)
+            )
+            conditions.append(constraint_condition)
+            parameters.extend(constraint_params)
+
+        statement = scan_page_statement(
+            self.table_settings.table_name, conditions
+        )
+        last_sequence_number = -1
+
+        while True:
+            page_params = [
+                *parameters,
+                last_sequence_number,
+                self.scan_page_size,
+            ]
+            rows: list[EventRow] = await self._run(
+                lambda connection: connection.execute(
+                    statement, page_params
+                ).fetchall()
+            )
+
+            for row in rows:
+                yield row_event(row)
+
+            if len(rows) < self.scan_page_size:
+                return
+
+            last_sequence_number = rows[-1][0]
@@ -0,0 +1,126 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    EventSourceIdentifier,
+    LogIdentifier,
+    StreamIdentifier,
+)
+from logicblocks.event.types.identifier import (
+    CategoryPartitionIdentifier,
+    LogPartitionIdentifier,
+)
+from logicblocks.event.utils.clock import Clock, SystemClock
+
+from .adapters import EventStorageAdapter
+from .notifications import EventNotification
+
+type HeadIdentifier = LogIdentifier | CategoryIdentifier
+
+
+def head_identifier(
+    identifier: EventSourceIdentifier,
+) -> HeadIdentifier | None:
+    match identifier:
+        case LogIdentifier() | LogPartitionIdentifier():
+            return LogIdentifier()
+        case (
+            CategoryIdentifier(category)
+            | CategoryPartitionIdentifier(category=category)
+            | StreamIdentifier(category=category)
+        ):
+            return CategoryIdentifier(category=category)
+        case _:
+            return None
+
+
+class EventHeadTracker:
+    """Tracks the latest sequence number of the log and of each category.
+
+    Heads are refreshed from the storage adapter at most once per
+    `refresh_interval` per log or category, no matter how many callers
+    ask. Notifications passed to `observe` move heads forward between
+    refreshes. Stream sources are answered at category granularity, so
+    a write to any stream in the category counts as new events.
+
+    Heads are compared by sequence number, so the tracker refuses
+    adapters whose scans are not in sequence number order. Under commit
+    ordering an event can become visible after a later sequence number
+    has been consumed, and the tracker would never report it.
+    """
+
+    def __init__(
+        self,
+        *,
+        adapter: EventStorageAdapter,
+        refresh_interval: timedelta = timedelta(seconds=1),
+        clock: Clock = SystemClock(),
+    ):
+        if not adapter.scans_in_sequence_order:
+            raise ValueError(
+                "EventHeadTracker requires an adapter that scans in sequence "
+                "number order."
+            )
+
+        self._adapter = adapter
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._heads: dict[HeadIdentifier, int] = {}
+        self._refreshed_at: dict[HeadIdentifier, datetime] = {}
+        self._locks: dict[HeadIdentifier, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+
+    def observe(self, notifications: Sequence[EventNotification]) -> None:
+        for notification in notifications:
+            for identifier in (
+                LogIdentifier(),
+                CategoryIdentifier(category=notification.category),
+            ):
+                self._advance(identifier, notification.sequence_number)
+
+    async def head(self, identifier: HeadIdentifier) -> int | None:
+        if self._is_stale(identifier):
+            async with self._locks[identifier]:
+                if self._is_stale(identifier):
+                    await self._refresh(identifier)
+
+        return self._heads.get(identifier, None)
+
+    async def has_events_after(
+        self,
+        identifier: EventSourceIdentifier,
+        sequence_number: int | None,
+    ) -> bool:
+        tracked_identifier = head_identifier(identifier)
+        if tracked_identifier is None:
+            return True
+
+        head = await self.head(tracked_identifier)
+        if head is None:
+            return False
+        if sequence_number is None:
+            return True
+
+        return head > sequence_number
+
+    def _advance(self, identifier: HeadIdentifier, sequence_number: int):
+        current = self._heads.get(identifier, None)
+        if current is None or sequence_number > current:
+            self._heads[identifier] = sequence_number
+
+    def _is_stale(self, identifier: HeadIdentifier) -> bool:
+        refreshed_at = self._refreshed_at.get(identifier, None)
+        return (
+            refreshed_at is None
+            or self._clock.now() - refreshed_at >= self._refresh_interval
+        )
+
+    async def _refresh(self, identifier: HeadIdentifier) -> None:
+        latest = await self._adapter.latest(target=identifier)
+        if latest is not None:
+            self._advance(identifier, latest.sequence_number)
+        self._refreshed_at[identifier] = self._clock.now()
@@ -0,0 +1,15 @@
+from .base import (
+    EventNotification,
+    EventNotificationSource,
+    event_notifications,
+)
+from .memory import InMemoryEventNotificationHub
+from .postgres import PostgresEventNotificationSource
+
+__all__ = [
+    "EventNotification",
+    "EventNotificationSource",
+    "InMemoryEventNotificationHub",
+    "PostgresEventNotificationSource",
+    "event_notifications",
+]
@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any, Self
+
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    EventSourceIdentifier,
+    JsonValue,
+    JsonValueConvertible,
+    StoredEvent,
+    StreamIdentifier,
+    default_deserialisation_fallback,
+    default_serialisation_fallback,
+    is_json_object,
+)
+from logicblocks.event.types.identifier import CategoryPartitionIdentifier
+
+
+@dataclass(frozen=True)
+class EventNotification(JsonValueConvertible):
+    category: str
+    stream: str
+    sequence_number: int
+
+    @classmethod
+    def deserialise(
+        cls,
+        value: JsonValue,
+        fallback: Callable[
+            [Any, JsonValue], Any
+        ] = default_deserialisation_fallback,
+    ) -> Self:
+        if not is_json_object(value):
+            return fallback(cls, value)
+
+        category = value.get("category")
+        stream = value.get("stream")
+        sequence_number = value.get("sequence_number")
+        if (
+            not isinstance(category, str)
+            or not isinstance(stream, str)
+            or not isinstance(sequence_number, int)
+        ):
+            return fallback(cls, value)
+
+        return cls(category, stream, sequence_number)
+
+    def serialise(
+        self,
+        fallback: Callable[
+            [object], JsonValue
+        ] = default_serialisation_fallback,
+    ) -> JsonValue:
+        return {
+            "category": self.category,
+            "stream": self.stream,
+            "sequence_number": self.sequence_number,
+        }
+
+    def affects(self, identifier: EventSourceIdentifier) -> bool:
+        match identifier:
+            case StreamIdentifier(category, stream):
+                return category == self.category and stream == self.stream
+            case CategoryIdentifier(category):
+                return category == self.category
+            case CategoryPartitionIdentifier(category=category):
+                return category == self.category
+            case _:
+                return True
+
+
+def event_notifications(
+    events: Iterable[StoredEvent[Any, Any]],
+) -> Sequence[EventNotification]:
+    sequence_numbers: dict[tuple[str, str], int] = {}
+    for event in events:
+        key = (event.category, event.stream)
+        sequence_numbers[key] = max(
+            event.sequence_number, sequence_numbers.get(key, -1)
+        )
+
+    return [
+        EventNotification(
+            category=category, stream=stream, sequence_number=sequence_number
+        )
+        for (category, stream), sequence_number in sequence_numbers.items()
+    ]
+
+
+class EventNotificationSource(ABC):
+    @abstractmethod
+    def listen(
+        self,
+    ) -> AbstractAsyncContextManager[AsyncIterator[EventNotification]]:
+        raise NotImplementedError
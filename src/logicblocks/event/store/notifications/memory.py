@@ -0,0 +1,33 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+from .base import EventNotification, EventNotificationSource
+
+
+class InMemoryEventNotificationHub(EventNotificationSource):
+    def __init__(self):
+        self._queues: set[asyncio.Queue[EventNotification]] = set()
+
+    def publish(self, notifications: Sequence[EventNotification]) -> None:
+        for queue in self._queues:
+            for notification in notifications:
+                queue.put_nowait(notification)
+
+    @asynccontextmanager
+    async def listen(
+        self,
+    ) -> AsyncGenerator[AsyncIterator[EventNotification]]:
+        queue = asyncio.Queue[EventNotification]()
+        self._queues.add(queue)
+        try:
+            yield self._receive(queue)
+        finally:
+            self._queues.discard(queue)
+
+    @staticmethod
+    async def _receive(
+        queue: asyncio.Queue[EventNotification],
+    ) -> AsyncIterator[EventNotification]:
+        while True:
+            yield await queue.get()
@@ -0,0 +1,43 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+
+from psycopg import AsyncConnection, sql
+
+from logicblocks.event.persistence.postgres import ConnectionSettings
+
+from .base import EventNotification, EventNotificationSource
+
+
+class PostgresEventNotificationSource(EventNotificationSource):
+    def __init__(
+        self,
+        *,
+        connection_settings: ConnectionSettings,
+        channel: str,
+    ):
+        self.connection_settings = connection_settings
+        self.channel = channel
+
+    @asynccontextmanager
+    async def listen(
+        self,
+    ) -> AsyncGenerator[AsyncIterator[EventNotification]]:
+        async with await AsyncConnection.connect(
+            self.connection_settings.to_connection_string(), autocommit=True
+        ) as connection:
+            await connection.execute(
+                sql.SQL("LISTEN {0}").format(sql.Identifier(self.channel))
+            )
+            notifications = self._receive(connection)
+            try:
+                yield notifications
+            finally:
+                await notifications.aclose()
+
+    @staticmethod
+    async def _receive(
+        connection: AsyncConnection,
+    ) -> AsyncGenerator[EventNotification]:
+        async for notify in connection.notifies():
+            yield EventNotification.deserialise(json.loads(notify.payload))
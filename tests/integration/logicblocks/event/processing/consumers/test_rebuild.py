@@ -0,0 +1,207 @@
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_asyncio
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
+
+from logicblocks.event.persistence.postgres import ConnectionSettings
+from logicblocks.event.processing import (
+    EventConsumerStateStore,
+    ProjectionRebuilder,
+)
+from logicblocks.event.projection import (
+    CachingProjectionStorageAdapter,
+    PostgresProjectionStorageAdapter,
+    ProjectionStorageAdapter,
+    ProjectionStore,
+    Projector,
+)
+from logicblocks.event.store import EventStore
+from logicblocks.event.store.adapters import InMemoryEventStorageAdapter
+from logicblocks.event.testing import NewEventBuilder, data
+from logicblocks.event.testsupport import (
+    connection_pool,
+    create_table,
+    drop_table,
+)
+from logicblocks.event.types import StoredEvent, StreamIdentifier
+
+connection_settings = ConnectionSettings(
+    user="admin",
+    password="super-secret",
+    host=os.getenv("DB_HOST", "localhost"),
+    port=int(os.getenv("DB_PORT", "5432")),
+    dbname="some-database",
+)
+
+
+class TotalProjector(
+    Projector[StreamIdentifier, Mapping[str, int], Mapping[str, int]]
+):
+    name = "total"
+
+    def initial_state_factory(self) -> Mapping[str, int]:
+        return {"total": 0}
+
+    def initial_metadata_factory(self) -> Mapping[str, int]:
+        return {}
+
+    def id_factory(
+        self, state: Mapping[str, int], source: StreamIdentifier
+    ) -> str:
+        return source.stream
+
+    @staticmethod
+    def thing_occurred(
+        state: Mapping[str, int], event: StoredEvent
+    ) -> Mapping[str, int]:
+        assert isinstance(event.payload, Mapping)
+        value = event.payload["value"]
+        assert isinstance(value, int)
+        return {"total": state["total"] + value}
+
+
+class DoublingTotalProjector(TotalProjector):
+    name = "total"
+    version = 2
+
+    @staticmethod
+    def thing_occurred(
+        state: Mapping[str, int], event: StoredEvent
+    ) -> Mapping[str, int]:
+        assert isinstance(event.payload, Mapping)
+        value = event.payload["value"]
+        assert isinstance(value, int)
+        return {"total": state["total"] + value * 2}
+
+
+@pytest_asyncio.fixture
+async def open_connection_pool():
+    async with connection_pool(connection_settings) as pool:
+        yield pool
+
+
+class TestProjectionRebuilderWithPostgresProjections:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "projections")
+        await drop_table(open_connection_pool, "projection_versions")
+        await create_table(open_connection_pool, "projections")
+        await create_table(open_connection_pool, "projection_versions")
+
+    def setup_method(self):
+        self.event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        self.category = data.random_event_category_name()
+        self.state_store = EventConsumerStateStore(
+            category=self.event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+
+    async def publish(self, stream: str, value: int) -> None:
+        await self.event_store.stream(
+            category=self.category, stream=stream
+        ).publish(
+            events=[
+                NewEventBuilder()
+                .with_name("thing-occurred")
+                .with_payload({"value": value})
+                .build()
+            ]
+        )
+
+    async def rebuild(
+        self,
+        adapter: ProjectionStore | ProjectionStorageAdapter,
+        projector: TotalProjector,
+    ):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return await ProjectionRebuilder(
+                source=self.event_store.category(category=self.category),
+                projector=projector,
+                projection_store=adapter,
+                state_store=self.state_store,
+                executor=executor,
+                shards=2,
+            ).rebuild()
+
+    async def test_rebuilds_projection_and_records_version(self):
+        adapter = PostgresProjectionStorageAdapter(connection_source=self.pool)
+        await self.publish("first", 1)
+        await self.publish("second", 2)
+        await self.publish("first", 3)
+
+        result = await self.rebuild(adapter, TotalProjector())
+        first = await ProjectionStore(adapter=adapter).locate(
+            source=StreamIdentifier(category=self.category, stream="first"),
+            name="total",
+        )
+        state = await self.state_store.load()
+
+        assert result.rebuilt
+        assert result.projections == 2
+        assert first is not None
+        assert first.state == {"total": 4}
+        assert await adapter.version(name="total") == 1
+        assert state is not None
+        assert state.last_sequence_number == result.last_sequence_number
+
+    async def test_skips_rebuild_when_version_is_current(self):
+        adapter = PostgresProjectionStorageAdapter(connection_source=self.pool)
+        await self.publish("first", 1)
+        await self.rebuild(adapter, TotalProjector())
+
+        result = await self.rebuild(adapter, TotalProjector())
+
+        assert not result.rebuilt
+        assert result.events == 0
+
+    async def test_rebuilds_again_when_projector_version_changes(self):
+        adapter = PostgresProjectionStorageAdapter(connection_source=self.pool)
+        await self.publish("first", 1)
+        await self.rebuild(adapter, TotalProjector())
+
+        result = await self.rebuild(adapter, DoublingTotalProjector())
+        first = await ProjectionStore(adapter=adapter).locate(
+            source=StreamIdentifier(category=self.category, stream="first"),
+            name="total",
+        )
+
+        assert result.rebuilt
+        assert first is not None
+        assert first.state == {"total": 2}
+        assert await adapter.version(name="total") == 2
+
+    async def test_rebuilds_through_wrapping_store_and_cache(self):
+        adapter = PostgresProjectionStorageAdapter(connection_source=self.pool)
+        cache = CachingProjectionStorageAdapter(delegate=adapter)
+        store = ProjectionStore(adapter=cache)
+        source = StreamIdentifier(category=self.category, stream="first")
+        await self.publish("first", 1)
+        await self.rebuild(store, TotalProjector())
+
+        cached = await store.locate(source=source, name="total")
+        skipped = await self.rebuild(store, TotalProjector())
+        rebuilt = await self.rebuild(store, DoublingTotalProjector())
+        first = await store.locate(source=source, name="total")
+
+        assert cached is not None
+        assert cached.state == {"total": 1}
+        assert not skipped.rebuilt
+        assert rebuilt.rebuilt
+        assert first is not None
+        assert first.state == {"total": 2}
+        assert await store.version(name="total") == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
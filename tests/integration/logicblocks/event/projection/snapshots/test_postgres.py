@@ -0,0 +1,210 @@
+import os
+from collections.abc import Mapping
+
+import pytest
+import pytest_asyncio
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
+
+from logicblocks.event.persistence.postgres import ConnectionSettings
+from logicblocks.event.projection import (
+    PostgresProjectionSnapshotStore,
+    ProjectionSnapshot,
+    Projector,
+)
+from logicblocks.event.store import EventStore
+from logicblocks.event.store.adapters import InMemoryEventStorageAdapter
+from logicblocks.event.testing import NewEventBuilder, data
+from logicblocks.event.testsupport import (
+    connection_pool,
+    create_table,
+    drop_table,
+)
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    JsonValue,
+    StoredEvent,
+    StreamIdentifier,
+)
+
+connection_settings = ConnectionSettings(
+    user="admin",
+    password="super-secret",
+    host=os.getenv("DB_HOST", "localhost"),
+    port=int(os.getenv("DB_PORT", "5432")),
+    dbname="some-database",
+)
+
+
+class CountingProjector(
+    Projector[StreamIdentifier, Mapping[str, int], JsonValue]
+):
+    name = "counting"
+    snapshot_interval = 2
+
+    def __init__(self):
+        self.applied = 0
+
+    def initial_state_factory(self) -> Mapping[str, int]:
+        return {"count": 0}
+
+    def initial_metadata_factory(self) -> JsonValue:
+        return {}
+
+    def id_factory(
+        self, state: Mapping[str, int], source: StreamIdentifier
+    ) -> str:
+        return source.stream
+
+    def something_occurred(
+        self, state: Mapping[str, int], event: StoredEvent
+    ) -> Mapping[str, int]:
+        self.applied += 1
+        return {"count": state["count"] + 1}
+
+
+def snapshot_of(
+    *,
+    source: StreamIdentifier,
+    count: int,
+    sequence_number: int,
+    version: int = 1,
+) -> ProjectionSnapshot[Mapping[str, int], JsonValue]:
+    return ProjectionSnapshot[Mapping[str, int], JsonValue](
+        name="counting",
+        source=source,
+        state={"count": count},
+        metadata={"taken": "recently"},
+        position=sequence_number,
+        sequence_number=sequence_number,
+        version=version,
+    )
+
+
+@pytest_asyncio.fixture
+async def open_connection_pool():
+    async with connection_pool(connection_settings) as pool:
+        yield pool
+
+
+class TestPostgresProjectionSnapshotStore:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "projection_snapshots")
+        await create_table(open_connection_pool, "projection_snapshots")
+
+    def construct_snapshot_store(
+        self,
+    ) -> PostgresProjectionSnapshotStore[Mapping[str, int], JsonValue]:
+        return PostgresProjectionSnapshotStore[Mapping[str, int], JsonValue](
+            connection_source=self.pool,
+            state_type=Mapping[str, int],
+        )
+
+    async def test_loads_nothing_when_no_snapshot_saved(self):
+        snapshots = self.construct_snapshot_store()
+
+        assert (
+            await snapshots.load(
+                name="counting",
+                source=StreamIdentifier(category="things", stream="thing"),
+            )
+            is None
+        )
+
+    async def test_loads_saved_snapshot_for_name_and_source(self):
+        snapshots = self.construct_snapshot_store()
+        source = StreamIdentifier(category="things", stream="thing")
+        snapshot = snapshot_of(source=source, count=3, sequence_number=7)
+        await snapshots.save(snapshot=snapshot)
+        await snapshots.save(
+            snapshot=snapshot_of(
+                source=StreamIdentifier(category="things", stream="other"),
+                count=1,
+                sequence_number=2,
+            )
+        )
+
+        assert await snapshots.load(name="counting", source=source) == (
+            snapshot
+        )
+        assert (
+            await snapshots.load(
+                name="other", source=CategoryIdentifier(category="things")
+            )
+            is None
+        )
+
+    async def test_replaces_snapshot_with_later_one(self):
+        snapshots = self.construct_snapshot_store()
+        source = StreamIdentifier(category="things", stream="thing")
+        later = snapshot_of(source=source, count=5, sequence_number=9)
+
+        await snapshots.save(
+            snapshot=snapshot_of(source=source, count=3, sequence_number=7)
+        )
+        await snapshots.save(snapshot=later)
+
+        assert await snapshots.load(name="counting", source=source) == later
+
+    async def test_keeps_later_snapshot_of_same_version(self):
+        snapshots = self.construct_snapshot_store()
+        source = StreamIdentifier(category="things", stream="thing")
+        later = snapshot_of(source=source, count=5, sequence_number=9)
+
+        await snapshots.save(snapshot=later)
+        await snapshots.save(
+            snapshot=snapshot_of(source=source, count=3, sequence_number=7)
+        )
+
+        assert await snapshots.load(name="counting", source=source) == later
+
+    async def test_replaces_snapshot_of_other_version(self):
+        snapshots = self.construct_snapshot_store()
+        source = StreamIdentifier(category="things", stream="thing")
+        revised = snapshot_of(
+            source=source, count=1, sequence_number=2, version=2
+        )
+
+        await snapshots.save(
+            snapshot=snapshot_of(source=source, count=5, sequence_number=9)
+        )
+        await snapshots.save(snapshot=revised)
+
+        assert await snapshots.load(name="counting", source=source) == (
+            revised
+        )
+
+    async def test_resumes_projection_from_durable_snapshot(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = event_store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(5)
+            ]
+        )
+        await CountingProjector().project(
+            source=stream, snapshots=self.construct_snapshot_store()
+        )
+
+        projector = CountingProjector()
+        projection = await projector.project(
+            source=stream, snapshots=self.construct_snapshot_store()
+        )
+
+        assert projection.state == {"count": 5}
+        assert projector.applied == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
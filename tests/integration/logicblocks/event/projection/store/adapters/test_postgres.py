@@ -1,19 +1,30 @@
+import asyncio
 import os
 from typing import Sequence
 
+import pytest
 import pytest_asyncio
 from psycopg import AsyncConnection, abc, sql
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 
 from logicblocks.event.persistence.postgres import ConnectionSettings
-from logicblocks.event.projection.store import ProjectionStorageAdapter
+from logicblocks.event.projection.store import (
+    PostgresProjectionNotificationSource,
+    ProjectionNotification,
+    ProjectionStorageAdapter,
+)
 from logicblocks.event.projection.store.adapters import (
     PostgresProjectionStorageAdapter,
 )
+from logicblocks.event.projection.store.adapters.postgres import (
+    insert_query,
+    lock_names_query,
+)
 from logicblocks.event.testcases.projection.store.adapters import (
     ProjectionStorageAdapterCases,
 )
+from logicblocks.event.testing import MappingProjectionBuilder
 from logicblocks.event.testsupport import (
     clear_table,
     connection_pool,
@@ -23,7 +34,12 @@ from logicblocks.event.testsupport import (
 from logicblocks.event.testsupport.db import (
     enable_extension,
 )
-from logicblocks.event.types import JsonValue, Projection, identifier
+from logicblocks.event.types import (
+    JsonValue,
+    Projection,
+    identifier,
+    serialise_projection,
+)
 
 connection_settings = ConnectionSettings(
     user="admin",
@@ -59,6 +75,21 @@ async def read_projections(
             ]
 
 
+async def read_row_version(
+    pool: AsyncConnectionPool[AsyncConnection],
+    projection: Projection[JsonValue, JsonValue],
+) -> str:
+    async with pool.connection() as connection:
+        async with connection.cursor() as cursor:
+            results = await cursor.execute(
+                "SELECT xmin::text FROM projections WHERE name = %s AND id = %s",
+                [projection.name, projection.id],
+            )
+            row = await results.fetchone()
+            assert row is not None
+            return row[0]
+
+
 @pytest_asyncio.fixture
 async def open_connection_pool():
     async with connection_pool(connection_settings) as pool:
@@ -90,3 +121,262 @@ class TestPostgresProjectionStorageAdapterCommonCases(
         self, *, adapter: ProjectionStorageAdapter
     ) -> Sequence[Projection[JsonValue, JsonValue]]:
         return await read_projections(self.pool, "projections")
+
+
+class TestPostgresProjectionStorageAdapterRebuild:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await enable_extension(open_connection_pool, "pg_trgm")
+        await drop_table(open_connection_pool, "projections")
+        await drop_table(open_connection_pool, "projection_versions")
+        await create_table(open_connection_pool, "projections")
+        await create_table(open_connection_pool, "projection_versions")
+
+    def construct_storage_adapter(self) -> PostgresProjectionStorageAdapter:
+        return PostgresProjectionStorageAdapter(connection_source=self.pool)
+
+    async def test_replaces_projections_with_rebuilt_version(self):
+        adapter = self.construct_storage_adapter()
+        stale = MappingProjectionBuilder().with_name("thing").build()
+        other = MappingProjectionBuilder().with_name("other").build()
+        await adapter.save_many(projections=[stale, other])
+
+        rebuilt = [
+            MappingProjectionBuilder().with_name("thing").build()
+            for _ in range(3)
+        ]
+        async with adapter.rebuild(name="thing", version=2) as rebuild:
+            await rebuild.save_many(projections=rebuilt[:2])
+            await rebuild.save_many(projections=rebuilt[2:])
+
+            projections = await read_projections(self.pool, "projections")
+            assert sorted(projections, key=lambda p: p.name) == [other, stale]
+
+        projections = await read_projections(self.pool, "projections")
+
+        assert sorted(projections, key=lambda p: (p.name, p.id)) == sorted(
+            [other, *rebuilt], key=lambda p: (p.name, p.id)
+        )
+
+    async def test_keeps_last_saved_projection_per_id(self):
+        adapter = self.construct_storage_adapter()
+        first = MappingProjectionBuilder().with_name("thing").build()
+        second = (
+            MappingProjectionBuilder()
+            .with_id(first.id)
+            .with_name("thing")
+            .with_state({"value": 2})
+            .build()
+        )
+
+        async with adapter.rebuild(name="thing", version=1) as rebuild:
+            await rebuild.save_many(projections=[first])
+            await rebuild.save_many(projections=[second])
+
+        assert await read_projections(self.pool, "projections") == [second]
+
+    async def test_records_rebuilt_version(self):
+        adapter = self.construct_storage_adapter()
+
+        assert await adapter.version(name="thing") is None
+
+        async with adapter.rebuild(name="thing", version=1):
+            pass
+        async with adapter.rebuild(name="thing", version=3):
+            pass
+
+        assert await adapter.version(name="thing") == 3
+
+    async def test_leaves_projections_untouched_when_rebuild_fails(self):
+        adapter = self.construct_storage_adapter()
+        existing = MappingProjectionBuilder().with_name("thing").build()
+        await adapter.save(projection=existing)
+
+        with pytest.raises(RuntimeError):
+            async with adapter.rebuild(name="thing", version=2) as rebuild:
+                await rebuild.save_many(
+                    projections=[
+                        MappingProjectionBuilder().with_name("thing").build()
+                    ]
+                )
+                raise RuntimeError("Rebuild failed.")
+
+        assert await read_projections(self.pool, "projections") == [existing]
+        assert await adapter.version(name="thing") is None
+
+    async def test_only_rewrites_changed_projections(self):
+        adapter = self.construct_storage_adapter()
+        unchanged = MappingProjectionBuilder().with_name("thing").build()
+        changed = MappingProjectionBuilder().with_name("thing").build()
+        await adapter.save_many(projections=[unchanged, changed])
+        unchanged_version = await read_row_version(self.pool, unchanged)
+        changed_version = await read_row_version(self.pool, changed)
+
+        updated = (
+            MappingProjectionBuilder()
+            .with_id(changed.id)
+            .with_name("thing")
+            .with_state({"value": "updated"})
+            .build()
+        )
+        async with adapter.rebuild(name="thing", version=2) as rebuild:
+            await rebuild.save_many(projections=[unchanged, updated])
+
+        assert await read_row_version(self.pool, unchanged) == (
+            unchanged_version
+        )
+        assert await read_row_version(self.pool, updated) != changed_version
+
+    async def test_saves_wait_for_swap_of_same_name(self):
+        adapter = self.construct_storage_adapter()
+        projection = MappingProjectionBuilder().with_name("thing").build()
+
+        async with self.pool.connection() as connection:
+            await connection.execute(
+                *lock_names_query(
+                    ["thing"], adapter.table_settings, shared=False
+                )
+            )
+
+            save = asyncio.create_task(adapter.save(projection=projection))
+            await asyncio.sleep(0.2)
+
+            assert not save.done()
+
+        await asyncio.wait_for(save, 5)
+
+        assert await read_projections(self.pool, "projections") == [projection]
+
+    async def test_swap_waits_for_saves_of_same_name(self):
+        adapter = self.construct_storage_adapter()
+        live = MappingProjectionBuilder().with_name("thing").build()
+        rebuild = await adapter.rebuild(name="thing", version=1).__aenter__()
+
+        async with self.pool.connection() as connection:
+            await connection.execute(
+                *insert_query(
+                    serialise_projection(live), adapter.table_settings
+                )
+            )
+
+            swap = asyncio.create_task(rebuild.__aexit__(None, None, None))
+            await asyncio.sleep(0.2)
+
+            assert not swap.done()
+
+        await asyncio.wait_for(swap, 5)
+
+        assert await read_projections(self.pool, "projections") == []
+
+    async def test_saves_inside_swap_before_waiting_saves_apply(self):
+        adapter = self.construct_storage_adapter()
+        rebuilt = MappingProjectionBuilder().with_name("thing").build()
+        caught_up = (
+            MappingProjectionBuilder()
+            .with_id(rebuilt.id)
+            .with_name("thing")
+            .with_state({"value": "caught-up"})
+            .build()
+        )
+        live = MappingProjectionBuilder().with_name("thing").build()
+
+        async with adapter.rebuild(name="thing", version=1) as rebuild:
+            await rebuild.save_many(projections=[rebuilt])
+            async with rebuild.swap():
+                save = asyncio.create_task(adapter.save(projection=live))
+                await asyncio.sleep(0.2)
+
+                assert not save.done()
+
+                await rebuild.save_many(projections=[caught_up])
+
+        await asyncio.wait_for(save, 5)
+
+        projections = await read_projections(self.pool, "projections")
+
+        assert sorted(projections, key=lambda p: p.id) == sorted(
+            [caught_up, live], key=lambda p: p.id
+        )
+
+    async def test_concurrent_rebuilds_of_same_name_do_not_interfere(self):
+        adapter = self.construct_storage_adapter()
+        first = MappingProjectionBuilder().with_name("thing").build()
+        second = MappingProjectionBuilder().with_name("thing").build()
+
+        async with adapter.rebuild(name="thing", version=1) as one:
+            async with adapter.rebuild(name="thing", version=2) as other:
+                await one.save_many(projections=[first])
+                await other.save_many(projections=[second])
+
+            assert await read_projections(self.pool, "projections") == [second]
+
+        assert await read_projections(self.pool, "projections") == [first]
+        assert await adapter.version(name="thing") == 1
+
+    async def test_rejects_projections_with_other_names(self):
+        adapter = self.construct_storage_adapter()
+
+        with pytest.raises(ValueError):
+            async with adapter.rebuild(name="thing", version=1) as rebuild:
+                await rebuild.save_many(
+                    projections=[
+                        MappingProjectionBuilder().with_name("other").build()
+                    ]
+                )
+
+
+class TestPostgresProjectionStorageAdapterNotifications:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "projections")
+        await drop_table(open_connection_pool, "projection_versions")
+        await create_table(open_connection_pool, "projections")
+        await create_table(open_connection_pool, "projection_versions")
+
+    async def test_notifies_listeners_of_saved_projections_on_commit(self):
+        channel = "projection_notifications"
+        adapter = PostgresProjectionStorageAdapter(
+            connection_source=self.pool, notification_channel=channel
+        )
+        source = PostgresProjectionNotificationSource(
+            connection_settings=connection_settings, channel=channel
+        )
+        projection = MappingProjectionBuilder().build()
+
+        async with source.listen() as notifications:
+            await adapter.save(projection=projection)
+
+            received = await asyncio.wait_for(anext(notifications), 5)
+
+        assert received == ProjectionNotification(
+            name=projection.name, id=projection.id
+        )
+
+    async def test_notifies_listeners_of_rebuilt_projection_name(self):
+        channel = "projection_notifications"
+        adapter = PostgresProjectionStorageAdapter(
+            connection_source=self.pool, notification_channel=channel
+        )
+        source = PostgresProjectionNotificationSource(
+            connection_settings=connection_settings, channel=channel
+        )
+
+        async with source.listen() as notifications:
+            async with adapter.rebuild(name="thing", version=1):
+                pass
+
+            received = await asyncio.wait_for(anext(notifications), 5)
+
+        assert received == ProjectionNotification(name="thing")
@@ -2,11 +2,14 @@ import asyncio
 import os
 import random
 import sys
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from datetime import timedelta
+from typing import cast
 
 import pytest
 import pytest_asyncio
 from psycopg import AsyncConnection, abc, sql
+from psycopg.errors import UniqueViolation
 from psycopg.rows import class_row
 from psycopg_pool import AsyncConnectionPool
 
@@ -20,14 +23,32 @@ from logicblocks.event.persistence.postgres import (
     TableSettings,
 )
 from logicblocks.event.persistence.postgres.query import ColumnReference
+from logicblocks.event.store import (
+    EventNotification,
+    PostgresEventNotificationSource,
+    UnmetWriteConditionError,
+    conditions,
+)
 from logicblocks.event.store.adapters import (
     AnyEventSerialisationGuarantee,
     EventSerialisationGuarantee,
     EventStorageAdapter,
     PostgresEventStorageAdapter,
+    PostgresGroupCommitSettings,
     PostgresQuerySettings,
+    PostgresScanMode,
+    PostgresScanOrdering,
+)
+from logicblocks.event.store.adapters.postgres import (
+    AdaptivePageSizingStrategy,
+)
+from logicblocks.event.store.adapters.postgres.adapter import (
+    stored_event_columns_clause,
+)
+from logicblocks.event.store.constraints import (
+    QueryConstraint,
+    SequenceNumberAfterConstraint,
 )
-from logicblocks.event.store.constraints import QueryConstraint
 from logicblocks.event.testcases.store.adapters import (
     ConcurrencyParameters,
     EventStorageAdapterCases,
@@ -55,8 +76,8 @@ connection_settings = ConnectionSettings(
 
 
 def read_events_query(table: str) -> abc.Query:
-    return sql.SQL("SELECT * FROM {0} ORDER BY sequence_number").format(
-        sql.Identifier(table)
+    return sql.SQL("SELECT {0} FROM {1} ORDER BY sequence_number").format(
+        stored_event_columns_clause(), sql.Identifier(table)
     )
 
 
@@ -166,6 +187,121 @@ class TestPostgresEventStorageAdapterCommonCases(EventStorageAdapterCases):
         )
 
 
+class TestPostgresEventStorageAdapterCopyInsertCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(copy_insert_threshold=1),
+        )
+
+
+class TestPostgresEventStorageAdapterPreparedStatementsCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(prepare_statements=True),
+        )
+
+
+class TestPostgresEventStorageAdapterStreamedScanCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(
+                scan_mode=PostgresScanMode.STREAMED,
+                scan_stream_batch_size=3,
+            ),
+        )
+
+
+class TestPostgresEventStorageAdapterGroupCommitCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            group_commit=PostgresGroupCommitSettings(
+                max_batch_size=10, max_wait=timedelta(milliseconds=1)
+            ),
+        )
+
+
+class TestPostgresEventStorageAdapterCommitOrderingCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(
+                scan_ordering=PostgresScanOrdering.COMMIT
+            ),
+        )
+
+
+class TestPostgresEventStorageAdapterStreamHeadCacheCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(stream_head_cache_size=100),
+        )
+
+
+class TestPostgresEventStorageAdapterStreamHeadCacheGroupCommitCommonCases(
+    TestPostgresEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: AnyEventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            serialisation_guarantee=serialisation_guarantee,
+            query_settings=PostgresQuerySettings(stream_head_cache_size=100),
+            group_commit=PostgresGroupCommitSettings(
+                max_batch_size=10, max_wait=timedelta(milliseconds=1)
+            ),
+        )
+
+
 class TestPostgresStorageAdapterCustomTableName:
     @pytest_asyncio.fixture(autouse=True)
     async def store_connection_pool(self, open_connection_pool):
@@ -617,6 +753,554 @@ class TestPostgresStorageAdapterScanPaging:
 
         assert scanned_events == stored_events
 
+    async def test_adapts_page_size_while_scanning_log(self):
+        page_sizing_strategy = AdaptivePageSizingStrategy(
+            initial_page_size=10,
+            minimum_page_size=10,
+            maximum_page_size=40,
+            target_bytes_per_page=1024 * 1024,
+            target_seconds_per_page=10.0,
+        )
+        adapter = PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            scan_page_sizing_strategy=page_sizing_strategy,
+        )
+
+        streams = [(random_event_category_name(), random_event_stream_name())]
+
+        stored_events = await save_random_events(
+            number_of_events=125, adapter=adapter, streams=streams
+        )
+
+        scanned_events = [
+            event
+            async for event in adapter.scan(target=identifier.LogIdentifier())
+        ]
+
+        assert scanned_events == stored_events
+        assert page_sizing_strategy.page_sizes == {
+            identifier.LogIdentifier(): 40
+        }
+
+
+class TestPostgresStorageAdapterStreamedScan:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "events")
+        await create_table(open_connection_pool, "events")
+
+    def construct_storage_adapter(self) -> PostgresEventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            query_settings=PostgresQuerySettings(
+                scan_mode=PostgresScanMode.STREAMED,
+                scan_stream_batch_size=10,
+            ),
+        )
+
+    async def test_streams_log_scan_across_fetch_batches_in_order(self):
+        adapter = self.construct_storage_adapter()
+
+        streams = [
+            (random_event_category_name(), random_event_stream_name()),
+            (random_event_category_name(), random_event_stream_name()),
+        ]
+
+        stored_events = await save_random_events(
+            number_of_events=35, adapter=adapter, streams=streams
+        )
+
+        scanned_events = [
+            event
+            async for event in adapter.scan(target=identifier.LogIdentifier())
+        ]
+
+        assert scanned_events == stored_events
+
+    async def test_reads_from_snapshot_taken_at_start_of_scan(self):
+        adapter = self.construct_storage_adapter()
+
+        streams = [(random_event_category_name(), random_event_stream_name())]
+
+        initial_events = await save_random_events(
+            number_of_events=15, adapter=adapter, streams=streams
+        )
+
+        iterator = adapter.scan(target=identifier.LogIdentifier())
+        first_scanned_events = await read_iterator_events(
+            iterator=iterator, number_of_events=5
+        )
+
+        await save_random_events(
+            number_of_events=15, adapter=adapter, streams=streams
+        )
+
+        remaining_scanned_events = [event async for event in iterator]
+
+        assert (
+            first_scanned_events + remaining_scanned_events == initial_events
+        )
+
+    async def test_releases_connection_when_consumer_stops_early(self):
+        adapter = self.construct_storage_adapter()
+
+        streams = [(random_event_category_name(), random_event_stream_name())]
+
+        await save_random_events(
+            number_of_events=25, adapter=adapter, streams=streams
+        )
+
+        available_before = self.pool.get_stats().get("pool_available", 0)
+
+        iterator = cast(
+            AsyncGenerator[StoredEvent],
+            adapter.scan(target=identifier.LogIdentifier()),
+        )
+        await read_iterator_events(iterator=iterator, number_of_events=3)
+        await iterator.aclose()
+
+        available_after = self.pool.get_stats().get("pool_available", 0)
+
+        assert available_after == available_before
+
+
+class TestPostgresStorageAdapterNotifications:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "events")
+        await create_table(open_connection_pool, "events")
+
+    async def test_notifies_listeners_of_saved_streams_on_commit(self):
+        channel = "event_notifications"
+        adapter = PostgresEventStorageAdapter(
+            connection_source=self.pool, notification_channel=channel
+        )
+        source = PostgresEventNotificationSource(
+            connection_settings=connection_settings, channel=channel
+        )
+
+        category = random_event_category_name()
+        stream = random_event_stream_name()
+
+        async with source.listen() as notifications:
+            stored_events = await adapter.save(
+                target=identifier.StreamIdentifier(
+                    category=category, stream=stream
+                ),
+                events=[NewEventBuilder().build(), NewEventBuilder().build()],
+            )
+
+            received = await asyncio.wait_for(anext(notifications), 5)
+
+        assert received == EventNotification(
+            category=category,
+            stream=stream,
+            sequence_number=stored_events[-1].sequence_number,
+        )
+
+    async def test_does_not_notify_when_save_fails(self):
+        channel = "event_notifications"
+        adapter = PostgresEventStorageAdapter(
+            connection_source=self.pool, notification_channel=channel
+        )
+        source = PostgresEventNotificationSource(
+            connection_settings=connection_settings, channel=channel
+        )
+
+        target = identifier.StreamIdentifier(
+            category=random_event_category_name(),
+            stream=random_event_stream_name(),
+        )
+
+        async with source.listen() as notifications:
+            with pytest.raises(UnmetWriteConditionError):
+                await adapter.save(
+                    target=target,
+                    events=[NewEventBuilder().build()],
+                    condition=conditions.position_is(3),
+                )
+
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(anext(notifications), 0.2)
+
+
+class TestPostgresStorageAdapterGroupCommit:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "events")
+        await create_table(open_connection_pool, "events")
+
+    def construct_storage_adapter(self) -> PostgresEventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            group_commit=PostgresGroupCommitSettings(
+                max_batch_size=50, max_wait=timedelta(milliseconds=20)
+            ),
+        )
+
+    async def test_coalesces_concurrent_saves_into_one_transaction(self):
+        adapter = self.construct_storage_adapter()
+        category = random_event_category_name()
+        targets = [
+            identifier.StreamIdentifier(
+                category=category, stream=random_event_stream_name()
+            )
+            for _ in range(10)
+        ]
+
+        results = await asyncio.gather(
+            *[
+                adapter.save(
+                    target=target,
+                    events=[
+                        NewEventBuilder().build(),
+                        NewEventBuilder().build(),
+                    ],
+                )
+                for target in targets
+            ]
+        )
+
+        async with self.pool.connection() as connection:
+            cursor = await connection.execute(
+                sql.SQL(
+                    "SELECT count(DISTINCT xmin::text) FROM events "
+                    "WHERE category = %s"
+                ),
+                [category],
+            )
+            row = await cursor.fetchone()
+
+        assert row is not None
+        assert row[0] == 1
+        for target, stored_events in zip(targets, results):
+            assert [event.stream for event in stored_events] == [
+                target.stream,
+                target.stream,
+            ]
+            assert [event.position for event in stored_events] == [0, 1]
+
+    async def test_evaluates_write_conditions_per_request(self):
+        adapter = self.construct_storage_adapter()
+        target = identifier.StreamIdentifier(
+            category=random_event_category_name(),
+            stream=random_event_stream_name(),
+        )
+
+        results = await asyncio.gather(
+            adapter.save(
+                target=target,
+                events=[NewEventBuilder().build()],
+                condition=conditions.stream_is_empty(),
+            ),
+            adapter.save(
+                target=target,
+                events=[NewEventBuilder().build()],
+                condition=conditions.stream_is_empty(),
+            ),
+            adapter.save(
+                target=target,
+                events=[NewEventBuilder().build()],
+                condition=conditions.position_is(0),
+            ),
+            return_exceptions=True,
+        )
+
+        first, second, third = results
+
+        assert not isinstance(first, BaseException)
+        assert [event.position for event in first] == [0]
+        assert isinstance(second, UnmetWriteConditionError)
+        assert not isinstance(third, BaseException)
+        assert [event.position for event in third] == [1]
+
+    async def test_flushes_pending_saves_on_close(self):
+        adapter = self.construct_storage_adapter()
+        target = identifier.StreamIdentifier(
+            category=random_event_category_name(),
+            stream=random_event_stream_name(),
+        )
+
+        save = asyncio.create_task(
+            adapter.save(target=target, events=[NewEventBuilder().build()])
+        )
+        await asyncio.sleep(0)
+        await adapter.close()
+
+        stored_events = await save
+
+        assert [event.position for event in stored_events] == [0]
+
+
+class TestPostgresStorageAdapterCommitOrderedScan:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "events")
+        await create_table(open_connection_pool, "events")
+
+    def construct_storage_adapter(self) -> PostgresEventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            query_settings=PostgresQuerySettings(
+                scan_ordering=PostgresScanOrdering.COMMIT
+            ),
+        )
+
+    async def scan_after(
+        self,
+        adapter: PostgresEventStorageAdapter,
+        sequence_number: int | None,
+    ) -> list[StoredEvent]:
+        constraints: set[QueryConstraint] = (
+            {SequenceNumberAfterConstraint(sequence_number=sequence_number)}
+            if sequence_number is not None
+            else set()
+        )
+        return [
+            event
+            async for event in adapter.scan(
+                target=identifier.LogIdentifier(), constraints=constraints
+            )
+        ]
+
+    async def test_withholds_events_committed_after_in_flight_transaction(
+        self,
+    ):
+        adapter = self.construct_storage_adapter()
+        target = identifier.StreamIdentifier(
+            category=random_event_category_name(),
+            stream=random_event_stream_name(),
+        )
+
+        async with self.pool.connection() as in_flight:
+            await in_flight.execute("SELECT pg_current_xact_id()")
+
+            stored_events = await adapter.save(
+                target=target, events=[NewEventBuilder().build()]
+            )
+
+            withheld_events = await self.scan_after(adapter, None)
+
+            await in_flight.commit()
+
+        released_events = await self.scan_after(adapter, None)
+
+        assert withheld_events == []
+        assert released_events == stored_events
+
+    async def test_does_not_skip_events_committed_out_of_sequence_order(
+        self,
+    ):
+        adapter = self.construct_storage_adapter()
+        category = random_event_category_name()
+        early_target = identifier.StreamIdentifier(
+            category=category, stream=random_event_stream_name()
+        )
+        late_target = identifier.StreamIdentifier(
+            category=category, stream=random_event_stream_name()
+        )
+
+        early_events = await adapter.save(
+            target=early_target, events=[NewEventBuilder().build()]
+        )
+        seen_events = await self.scan_after(adapter, None)
+        last_sequence_number = seen_events[-1].sequence_number
+
+        async with self.pool.connection() as slow_writer:
+            await slow_writer.execute(
+                sql.SQL(
+                    "INSERT INTO events "
+                    "(id, name, stream, category, position, payload, "
+                    "observed_at, occurred_at) "
+                    "VALUES (%s, %s, %s, %s, 0, '{}', now(), now())"
+                ),
+                [
+                    "slow-event",
+                    "slow-event",
+                    late_target.stream,
+                    late_target.category,
+                ],
+            )
+
+            fast_events = await adapter.save(
+                target=early_target, events=[NewEventBuilder().build()]
+            )
+
+            withheld_events = await self.scan_after(
+                adapter, last_sequence_number
+            )
+
+            await slow_writer.commit()
+
+        released_events = await self.scan_after(adapter, last_sequence_number)
+
+        assert seen_events == early_events
+        assert withheld_events == []
+        assert [event.id for event in released_events] == [
+            "slow-event",
+            *[event.id for event in fast_events],
+        ]
+        assert released_events[0].sequence_number < (
+            fast_events[0].sequence_number
+        )
+
+
+class TestPostgresStorageAdapterStreamHeadCache:
+    pool: AsyncConnectionPool[AsyncConnection]
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def store_connection_pool(self, open_connection_pool):
+        self.pool = open_connection_pool
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def reinitialise_storage(self, open_connection_pool):
+        await drop_table(open_connection_pool, "events")
+        await create_table(open_connection_pool, "events")
+
+    def construct_storage_adapter(self) -> PostgresEventStorageAdapter:
+        return PostgresEventStorageAdapter(
+            connection_source=self.pool,
+            query_settings=PostgresQuerySettings(stream_head_cache_size=10),
+        )
+
+    def random_target(self) -> identifier.StreamIdentifier:
+        return identifier.StreamIdentifier(
+            category=random_event_category_name(),
+            stream=random_event_stream_name(),
+        )
+
+    async def test_uses_cached_head_for_repeated_saves_to_stream(self):
+        adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        await adapter.save(target=target, events=[NewEventBuilder().build()])
+        second = await adapter.save(
+            target=target,
+            events=[NewEventBuilder().build()],
+            condition=conditions.position_is(0),
+        )
+        third = await adapter.save(
+            target=target, events=[NewEventBuilder().build()]
+        )
+
+        assert [event.position for event in [*second, *third]] == [1, 2]
+        assert adapter.stream_head_cache.metrics.hits == 2
+        assert adapter.stream_head_cache.metrics.misses == 1
+
+    async def test_retries_with_stored_head_when_cached_head_is_stale(self):
+        adapter = self.construct_storage_adapter()
+        other_adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        await adapter.save(target=target, events=[NewEventBuilder().build()])
+        await other_adapter.save(
+            target=target, events=[NewEventBuilder().build()]
+        )
+
+        stored_events = await adapter.save(
+            target=target, events=[NewEventBuilder().build()]
+        )
+
+        assert [event.position for event in stored_events] == [2]
+        assert adapter.stream_head_cache.metrics.invalidations == 1
+
+    async def test_checks_condition_against_stored_head_when_cache_is_stale(
+        self,
+    ):
+        adapter = self.construct_storage_adapter()
+        other_adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        await adapter.save(target=target, events=[NewEventBuilder().build()])
+        await other_adapter.save(
+            target=target, events=[NewEventBuilder().build()]
+        )
+
+        stored_events = await adapter.save(
+            target=target,
+            events=[NewEventBuilder().build()],
+            condition=conditions.position_is(1),
+        )
+
+        assert [event.position for event in stored_events] == [2]
+
+    async def test_retries_category_save_when_cached_head_is_stale(self):
+        adapter = self.construct_storage_adapter()
+        other_adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        await adapter.save(target=target, events=[NewEventBuilder().build()])
+        await other_adapter.save(
+            target=target, events=[NewEventBuilder().build()]
+        )
+
+        results = await adapter.save(
+            target=identifier.CategoryIdentifier(category=target.category),
+            streams={target.stream: {"events": [NewEventBuilder().build()]}},
+        )
+
+        assert [event.position for event in results[target.stream]] == [2]
+
+    async def test_does_not_cache_heads_of_failed_saves(self):
+        adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        with pytest.raises(UnmetWriteConditionError):
+            await adapter.save(
+                target=target,
+                events=[NewEventBuilder().build()],
+                condition=conditions.position_is(5),
+            )
+
+        assert len(adapter.stream_head_cache) == 0
+
+    async def test_rejects_duplicate_stream_positions(self):
+        adapter = self.construct_storage_adapter()
+        target = self.random_target()
+
+        await adapter.save(target=target, events=[NewEventBuilder().build()])
+
+        with pytest.raises(UniqueViolation):
+            async with self.pool.connection() as connection:
+                await connection.execute(
+                    sql.SQL(
+                        "INSERT INTO events "
+                        "(id, name, stream, category, position, payload, "
+                        "observed_at, occurred_at) "
+                        "VALUES (%s, %s, %s, %s, 0, '{}', now(), now())"
+                    ),
+                    [
+                        "duplicate-position",
+                        "duplicate-position",
+                        target.stream,
+                        target.category,
+                    ],
+                )
+
 
 class TestPostgresStorageAdapterQueryConstraints:
     pool: AsyncConnectionPool[AsyncConnection]
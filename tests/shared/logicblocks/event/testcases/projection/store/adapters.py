@@ -210,6 +210,112 @@ class SaveCases(Base, ABC):
         ]
 
 
+class SaveManyCases(Base, ABC):
+    async def test_stores_all_projections_for_later_retrieval(self):
+        adapter = self.construct_storage_adapter()
+
+        projection_1 = (
+            ThingProjectionBuilder()
+            .with_id(data.random_projection_id())
+            .build()
+        )
+        projection_2 = (
+            ThingProjectionBuilder()
+            .with_id(data.random_projection_id())
+            .build()
+        )
+
+        await adapter.save_many(projections=[projection_1, projection_2])
+
+        retrieved_projections = await self.retrieve_projections(
+            adapter=adapter
+        )
+
+        assert sorted(
+            retrieved_projections, key=lambda projection: projection.id
+        ) == sorted(
+            [
+                serialise_projection(projection_1),
+                serialise_projection(projection_2),
+            ],
+            key=lambda projection: projection.id,
+        )
+
+    async def test_updates_existing_projections_state_and_metadata(self):
+        projection_name = data.random_projection_name()
+        projection_id = data.random_projection_id()
+
+        adapter = self.construct_storage_adapter()
+
+        projection_v1 = (
+            ThingProjectionBuilder()
+            .with_id(projection_id)
+            .with_name(projection_name)
+            .with_state(Thing(value_1=5, value_2="first version"))
+            .with_metadata({"version": 1})
+            .build()
+        )
+        projection_v2 = (
+            ThingProjectionBuilder()
+            .with_id(projection_id)
+            .with_name(projection_name)
+            .with_source(projection_v1.source)
+            .with_state(Thing(value_1=10, value_2="second version"))
+            .with_metadata({"version": 2})
+            .build()
+        )
+
+        await adapter.save(projection=projection_v1)
+        await adapter.save_many(projections=[projection_v2])
+
+        retrieved_projections = await self.retrieve_projections(
+            adapter=adapter
+        )
+
+        assert retrieved_projections == [serialise_projection(projection_v2)]
+
+    async def test_keeps_last_of_repeated_projections(self):
+        projection_name = data.random_projection_name()
+        projection_id = data.random_projection_id()
+
+        adapter = self.construct_storage_adapter()
+
+        projection_v1 = (
+            ThingProjectionBuilder()
+            .with_id(projection_id)
+            .with_name(projection_name)
+            .with_state(Thing(value_1=5, value_2="first version"))
+            .build()
+        )
+        projection_v2 = (
+            ThingProjectionBuilder()
+            .with_id(projection_id)
+            .with_name(projection_name)
+            .with_source(projection_v1.source)
+            .with_state(Thing(value_1=10, value_2="second version"))
+            .build()
+        )
+
+        await adapter.save_many(projections=[projection_v1, projection_v2])
+
+        retrieved_projections = await self.retrieve_projections(
+            adapter=adapter
+        )
+
+        assert retrieved_projections == [serialise_projection(projection_v2)]
+
+    async def test_does_nothing_when_no_projections_provided(self):
+        adapter = self.construct_storage_adapter()
+
+        await adapter.save_many(projections=[])
+
+        retrieved_projections = await self.retrieve_projections(
+            adapter=adapter
+        )
+
+        assert retrieved_projections == []
+
+
 class FindOneCases(Base, ABC):
     async def test_applies_single_filter_on_top_level_field(self):
         projection_1_name = data.random_projection_name()
@@ -876,6 +982,6 @@ class FindManyCases(Base, ABC):
 
 
 class ProjectionStorageAdapterCases(
-    SaveCases, FindOneCases, FindManyCases, ABC
+    SaveCases, SaveManyCases, FindOneCases, FindManyCases, ABC
 ):
     pass
@@ -16,6 +16,7 @@ from logicblocks.event.store.adapters import (
     AnyEventSerialisationGuarantee,
     EventSerialisationGuarantee,
     EventStorageAdapter,
+    StripedEventSerialisationGuarantee,
 )
 from logicblocks.event.store.conditions import NoCondition
 from logicblocks.event.store.exceptions import UnmetWriteConditionError
@@ -2035,6 +2036,110 @@ class AsyncioConcurrencyCases(Base, ABC):
         #     for reader in category_readers + [log_reader]
         # )
 
+    async def test_stream_save_stream_writes_are_serialised_as_seen_by_readers_when_striped_serialisation_guarantee(
+        self,
+    ):
+        adapter = self.construct_storage_adapter(
+            serialisation_guarantee=StripedEventSerialisationGuarantee(
+                stripes=2
+            )
+        )
+
+        simultaneous_writer_count = 5
+        category_count = 2
+        stream_count = 2
+        publish_count = 10
+
+        log_reader = SequenceReader(adapter)
+        await log_reader.start()
+
+        categories = [
+            data.random_event_category_name() for _ in range(category_count)
+        ]
+        streams = [
+            (category, data.random_event_stream_name())
+            for _ in range(stream_count)
+            for category in categories
+        ]
+
+        category_readers = [
+            SequenceReader(adapter, category=category)
+            for category in categories
+        ]
+        stream_readers = [
+            SequenceReader(adapter, category=category, stream=stream)
+            for category, stream in streams
+        ]
+
+        await asyncio.gather(
+            *[category_reader.start() for category_reader in category_readers]
+        )
+        await asyncio.gather(
+            *[stream_reader.start() for stream_reader in stream_readers]
+        )
+
+        stream_writers = [
+            StreamSequenceWriter(
+                adapter,
+                category=category,
+                stream=stream,
+                publish_count=publish_count,
+            )
+            for category, stream in streams
+            for _ in range(simultaneous_writer_count)
+        ]
+        await asyncio.gather(
+            *[stream_writer.start() for stream_writer in stream_writers]
+        )
+        await asyncio.gather(
+            *[stream_writer.complete() for stream_writer in stream_writers]
+        )
+
+        await log_reader.stop()
+        await asyncio.gather(
+            *[category_reader.stop() for category_reader in category_readers]
+        )
+        await asyncio.gather(
+            *[stream_reader.stop() for stream_reader in stream_readers]
+        )
+
+        assert not any(
+            stream_writer.failed for stream_writer in stream_writers
+        )
+        assert not any(
+            category_reader.failed for category_reader in category_readers
+        )
+        assert not any(
+            stream_reader.failed for stream_reader in stream_readers
+        )
+        assert not log_reader.failed
+
+        all_written_sequence_numbers = [
+            sequence_number
+            for stream_writer in stream_writers
+            for sequence_number in stream_writer.sequence_numbers
+        ]
+
+        all_read_sequence_numbers = [
+            sequence_number
+            for stream_reader in stream_readers
+            for sequence_number in stream_reader.sequence_numbers
+        ]
+
+        def no_sequence_numbers_missed_across_streams() -> bool:
+            return all_read_sequence_numbers == unordered(
+                all_written_sequence_numbers
+            )
+
+        def stream_reader_reads_stream_serially(sequence_numbers) -> bool:
+            return sequence_numbers == sorted(sequence_numbers)
+
+        assert no_sequence_numbers_missed_across_streams()
+        assert all(
+            stream_reader_reads_stream_serially(stream_reader.sequence_numbers)
+            for stream_reader in stream_readers
+        )
+
     async def test_category_save_simultaneous_checked_writes_to_empty_streams_from_different_async_tasks_write_once(
         self,
     ):
@@ -2638,6 +2743,115 @@ class AsyncioConcurrencyCases(Base, ABC):
         assert stream_readers_read_streams_serially()
         assert no_sequence_numbers_missed_across_streams()
 
+    async def test_category_save_stream_writes_are_serialised_as_seen_by_readers_when_striped_serialisation_guarantee(
+        self,
+    ):
+        adapter = self.construct_storage_adapter(
+            serialisation_guarantee=StripedEventSerialisationGuarantee(
+                stripes=2
+            )
+        )
+
+        simultaneous_writer_count = 5
+        category_count = 2
+        stream_count = 2
+        publish_count = 10
+
+        log_reader = SequenceReader(adapter)
+        await log_reader.start()
+
+        categories = [
+            data.random_event_category_name() for _ in range(category_count)
+        ]
+        streams = [
+            (
+                category,
+                data.random_event_stream_name(),
+                data.random_event_stream_name(),
+            )
+            for _ in range(stream_count)
+            for category in categories
+        ]
+
+        category_readers = [
+            SequenceReader(adapter, category=category)
+            for category in categories
+        ]
+        stream_readers = [
+            SequenceReader(adapter, category=category, stream=stream)
+            for category, stream_1, stream_2 in streams
+            for stream in [stream_1, stream_2]
+        ]
+
+        await asyncio.gather(
+            *[category_reader.start() for category_reader in category_readers]
+        )
+        await asyncio.gather(
+            *[stream_reader.start() for stream_reader in stream_readers]
+        )
+
+        stream_writers = [
+            CategorySequenceWriter(
+                adapter,
+                category=category,
+                streams=[stream_1, stream_2],
+                publish_count=publish_count,
+            )
+            for category, stream_1, stream_2 in streams
+            for _ in range(simultaneous_writer_count)
+        ]
+        await asyncio.gather(
+            *[stream_writer.start() for stream_writer in stream_writers]
+        )
+        await asyncio.gather(
+            *[stream_writer.complete() for stream_writer in stream_writers]
+        )
+
+        await log_reader.stop()
+        await asyncio.gather(
+            *[category_reader.stop() for category_reader in category_readers]
+        )
+        await asyncio.gather(
+            *[stream_reader.stop() for stream_reader in stream_readers]
+        )
+
+        assert not any(
+            stream_writer.failed for stream_writer in stream_writers
+        )
+        assert not any(
+            category_reader.failed for category_reader in category_readers
+        )
+        assert not any(
+            stream_reader.failed for stream_reader in stream_readers
+        )
+        assert not log_reader.failed
+
+        all_written_sequence_numbers = [
+            sequence_number
+            for stream_writer in stream_writers
+            for sequence_number in stream_writer.sequence_numbers
+        ]
+        all_stream_read_sequence_numbers = [
+            sequence_number
+            for stream_reader in stream_readers
+            for sequence_number in stream_reader.sequence_numbers
+        ]
+
+        def stream_readers_read_streams_serially() -> bool:
+            return all(
+                stream_reader.sequence_numbers
+                == sorted(stream_reader.sequence_numbers)
+                for stream_reader in stream_readers
+            )
+
+        def no_sequence_numbers_missed_across_streams() -> bool:
+            return set(all_written_sequence_numbers) == set(
+                all_stream_read_sequence_numbers
+            )
+
+        assert stream_readers_read_streams_serially()
+        assert no_sequence_numbers_missed_across_streams()
+
 
 class ScanCases(Base, ABC):
     async def test_log_scan_scans_no_events_when_store_empty(self):
@@ -2,7 +2,10 @@ import dataclasses
 from collections.abc import Callable
 from typing import Any, Mapping, Self
 
-from logicblocks.event.processing import ProjectionEventProcessor
+from logicblocks.event.processing import (
+    BatchingProjectionEventProcessor,
+    ProjectionEventProcessor,
+)
 from logicblocks.event.projection import (
     InMemoryProjectionStorageAdapter,
     ProjectionStore,
@@ -176,3 +179,155 @@ class TestProjectionEventProcessor:
         assert loaded is not None
         assert loaded.state == State(value=15)
         assert loaded.metadata["event_count"] == 4
+
+
+class CountingProjectionStorageAdapter(InMemoryProjectionStorageAdapter):
+    def __init__(self):
+        super().__init__()
+        self.find_one_calls = 0
+        self.save_many_calls = 0
+
+    async def find_one(self, *args: Any, **kwargs: Any) -> Any:
+        self.find_one_calls += 1
+        return await super().find_one(*args, **kwargs)
+
+    async def save_many(self, *args: Any, **kwargs: Any) -> None:
+        self.save_many_calls += 1
+        await super().save_many(*args, **kwargs)
+
+
+def thing_occurred(category: str, stream: str, value: int) -> StoredEvent:
+    return (
+        StoredEventBuilder()
+        .with_stream(stream)
+        .with_category(category)
+        .with_name("thing-occurred")
+        .with_payload({"value": value})
+        .build()
+    )
+
+
+class TestBatchingProjectionEventProcessor:
+    async def test_saves_projections_for_each_stream_in_batch(self):
+        category_name = data.random_event_category_name()
+        stream_1 = data.random_event_stream_name()
+        stream_2 = data.random_event_stream_name()
+        projection_name = data.random_projection_name()
+
+        adapter = CountingProjectionStorageAdapter()
+        store = ProjectionStore(adapter=adapter)
+        processor = BatchingProjectionEventProcessor[State, Mapping[str, int]](
+            projector=StateProjector(projection_name=projection_name),
+            projection_store=store,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+
+        await processor.process_events(
+            [
+                thing_occurred(category_name, stream_1, 1),
+                thing_occurred(category_name, stream_1, 2),
+                thing_occurred(category_name, stream_2, 10),
+                thing_occurred(category_name, stream_1, 3),
+            ]
+        )
+
+        loaded_1 = await store.locate(
+            source=StreamIdentifier(category=category_name, stream=stream_1),
+            name=projection_name,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+        loaded_2 = await store.locate(
+            source=StreamIdentifier(category=category_name, stream=stream_2),
+            name=projection_name,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+
+        assert loaded_1 is not None
+        assert loaded_1.state == State(value=6)
+        assert loaded_1.metadata["event_count"] == 3
+        assert loaded_2 is not None
+        assert loaded_2.state == State(value=10)
+        assert adapter.save_many_calls == 1
+
+    async def test_uses_cached_state_across_batches(self):
+        category_name = data.random_event_category_name()
+        stream_name = data.random_event_stream_name()
+        projection_name = data.random_projection_name()
+        source = StreamIdentifier(category=category_name, stream=stream_name)
+
+        adapter = CountingProjectionStorageAdapter()
+        store = ProjectionStore(adapter=adapter)
+        await store.save(
+            projection=StateProjectionBuilder()
+            .with_name(projection_name)
+            .with_id(stream_name)
+            .with_source(source)
+            .with_state(State(value=5))
+            .with_metadata({"event_count": 1})
+            .build()
+        )
+        processor = BatchingProjectionEventProcessor[State, Mapping[str, int]](
+            projector=StateProjector(projection_name=projection_name),
+            projection_store=store,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+
+        await processor.process_events(
+            [thing_occurred(category_name, stream_name, 1)]
+        )
+        await processor.process_events(
+            [thing_occurred(category_name, stream_name, 2)]
+        )
+
+        loaded = await store.locate(
+            source=source,
+            name=projection_name,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+
+        assert loaded is not None
+        assert loaded.state == State(value=8)
+        assert loaded.metadata["event_count"] == 3
+        assert adapter.find_one_calls == 2
+
+    async def test_reloads_state_after_eviction(self):
+        category_name = data.random_event_category_name()
+        stream_1 = data.random_event_stream_name()
+        stream_2 = data.random_event_stream_name()
+        projection_name = data.random_projection_name()
+
+        adapter = CountingProjectionStorageAdapter()
+        store = ProjectionStore(adapter=adapter)
+        processor = BatchingProjectionEventProcessor[State, Mapping[str, int]](
+            projector=StateProjector(projection_name=projection_name),
+            projection_store=store,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+            cache_size=1,
+        )
+
+        await processor.process_events(
+            [
+                thing_occurred(category_name, stream_1, 1),
+                thing_occurred(category_name, stream_2, 2),
+            ]
+        )
+        await processor.process_events(
+            [thing_occurred(category_name, stream_1, 3)]
+        )
+
+        loaded = await store.locate(
+            source=StreamIdentifier(category=category_name, stream=stream_1),
+            name=projection_name,
+            state_type=State,
+            metadata_type=Mapping[str, int],
+        )
+
+        assert loaded is not None
+        assert loaded.state == State(value=4)
+        assert adapter.find_one_calls == 4
@@ -0,0 +1,359 @@
+import multiprocessing
+from collections.abc import AsyncIterator, Mapping, Set
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import pytest
+
+from logicblocks.event.processing import (
+    EventConsumerStateStore,
+    ProjectionRebuilder,
+)
+from logicblocks.event.projection import (
+    CachingProjectionStorageAdapter,
+    InMemoryProjectionStorageAdapter,
+    ProjectionStore,
+    Projector,
+)
+from logicblocks.event.store import EventCategory, EventSource, EventStore
+from logicblocks.event.store.adapters import InMemoryEventStorageAdapter
+from logicblocks.event.store.constraints import QueryConstraint
+from logicblocks.event.testing import NewEventBuilder, data
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    JsonValue,
+    Projection,
+    StoredEvent,
+    StreamIdentifier,
+)
+
+
+class TotalProjector(
+    Projector[StreamIdentifier, Mapping[str, int], Mapping[str, int]]
+):
+    name = "total"
+
+    def initial_state_factory(self) -> Mapping[str, int]:
+        return {"total": 0}
+
+    def initial_metadata_factory(self) -> Mapping[str, int]:
+        return {"event_count": 0}
+
+    def id_factory(
+        self, state: Mapping[str, int], source: StreamIdentifier
+    ) -> str:
+        return source.stream
+
+    def update_metadata(
+        self,
+        state: Mapping[str, int],
+        metadata: Mapping[str, int],
+        event: StoredEvent,
+    ) -> Mapping[str, int]:
+        return {"event_count": metadata["event_count"] + 1}
+
+    @staticmethod
+    def thing_occurred(
+        state: Mapping[str, int], event: StoredEvent
+    ) -> Mapping[str, int]:
+        assert isinstance(event.payload, Mapping)
+        value = event.payload["value"]
+        assert isinstance(value, int)
+        return {"total": state["total"] + value}
+
+
+class UnpicklableTotalProjector(TotalProjector):
+    def __init__(self):
+        self.describe = lambda: "unpicklable"
+
+
+class PublishingAfterFirstScanSource(EventSource[CategoryIdentifier]):
+    def __init__(self, *, category: EventCategory, stream: str):
+        self._category = category
+        self._stream = stream
+        self._published = False
+
+    @property
+    def identifier(self) -> CategoryIdentifier:
+        return self._category.identifier
+
+    async def latest(self) -> StoredEvent[str, JsonValue] | None:
+        return await self._category.latest()
+
+    async def iterate(
+        self, *, constraints: Set[QueryConstraint] = frozenset()
+    ) -> AsyncIterator[StoredEvent[str, JsonValue]]:
+        async for event in self._category.iterate(constraints=constraints):
+            yield event
+
+        if not self._published:
+            self._published = True
+            await self._category.stream(stream=self._stream).publish(
+                events=[
+                    NewEventBuilder()
+                    .with_name("thing-occurred")
+                    .with_payload({"value": 100})
+                    .build()
+                ]
+            )
+
+
+async def publish_events(event_store: EventStore, category: str):
+    streams = [data.random_event_stream_name() for _ in range(4)]
+    for round in range(3):
+        for index, stream in enumerate(streams):
+            await event_store.stream(category=category, stream=stream).publish(
+                events=[
+                    NewEventBuilder()
+                    .with_name("thing-occurred")
+                    .with_payload({"value": round * 10 + index})
+                    .build()
+                ]
+            )
+    return streams
+
+
+async def rebuild_with(
+    executor: Executor, *, batch_size: int = 5
+) -> tuple[
+    EventStore, str, list[str], ProjectionStore, EventConsumerStateStore
+]:
+    event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+    category = data.random_event_category_name()
+    streams = await publish_events(event_store, category)
+    projection_store = ProjectionStore(
+        adapter=InMemoryProjectionStorageAdapter()
+    )
+    state_store = EventConsumerStateStore(
+        category=event_store.category(
+            category=data.random_event_category_name()
+        )
+    )
+
+    await ProjectionRebuilder(
+        source=event_store.category(category=category),
+        projector=TotalProjector(),
+        projection_store=projection_store,
+        state_store=state_store,
+        executor=executor,
+        shards=3,
+        batch_size=batch_size,
+    ).rebuild()
+
+    return event_store, category, streams, projection_store, state_store
+
+
+class TestProjectionRebuilder:
+    async def test_rebuilds_projection_for_every_stream_in_category(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            (
+                event_store,
+                category,
+                streams,
+                projection_store,
+                _,
+            ) = await rebuild_with(executor)
+
+        for stream in streams:
+            expected = await TotalProjector().project(
+                source=event_store.stream(category=category, stream=stream)
+            )
+            actual = await projection_store.locate(
+                source=StreamIdentifier(category=category, stream=stream),
+                name="total",
+            )
+
+            assert actual is not None
+            assert actual == expected
+            assert actual.metadata == {"event_count": 3}
+
+    async def test_records_consumer_checkpoint_at_last_rebuilt_event(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            event_store, category, _, _, state_store = await rebuild_with(
+                executor
+            )
+
+        last_event = await event_store.category(category=category).latest()
+        state = await state_store.load()
+
+        assert last_event is not None
+        assert state is not None
+        assert state.last_sequence_number == last_event.sequence_number
+
+    async def test_rebuilds_using_process_pool(self):
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            (
+                event_store,
+                category,
+                streams,
+                projection_store,
+                _,
+            ) = await rebuild_with(executor, batch_size=100)
+
+        for stream in streams:
+            expected = await TotalProjector().project(
+                source=event_store.stream(category=category, stream=stream)
+            )
+            actual = await projection_store.locate(
+                source=StreamIdentifier(category=category, stream=stream),
+                name="total",
+            )
+
+            assert actual == expected
+
+    async def test_does_nothing_for_empty_category(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        projection_store = ProjectionStore(
+            adapter=InMemoryProjectionStorageAdapter()
+        )
+        state_store = EventConsumerStateStore(
+            category=event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = await ProjectionRebuilder(
+                source=event_store.category(
+                    category=data.random_event_category_name()
+                ),
+                projector=TotalProjector(),
+                projection_store=projection_store,
+                state_store=state_store,
+                executor=executor,
+            ).rebuild()
+
+        assert result.events == 0
+        assert result.projections == 0
+        assert result.last_sequence_number is None
+        assert await state_store.load() is None
+
+    async def test_invalidates_cached_projections_after_rebuilding(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        category = data.random_event_category_name()
+        streams = await publish_events(event_store, category)
+        adapter = CachingProjectionStorageAdapter(
+            delegate=InMemoryProjectionStorageAdapter()
+        )
+        projection_store = ProjectionStore(adapter=adapter)
+        source = StreamIdentifier(category=category, stream=streams[0])
+        expected = await TotalProjector().project(
+            source=event_store.stream(category=category, stream=streams[0])
+        )
+
+        await projection_store.save(
+            projection=Projection[Mapping[str, int], Mapping[str, int]](
+                id=expected.id,
+                name=expected.name,
+                source=expected.source,
+                state={"total": -1},
+                metadata=expected.metadata,
+            )
+        )
+        stale = await projection_store.locate(source=source, name="total")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            await ProjectionRebuilder(
+                source=event_store.category(category=category),
+                projector=TotalProjector(),
+                projection_store=projection_store,
+                state_store=EventConsumerStateStore(
+                    category=event_store.category(
+                        category=data.random_event_category_name()
+                    )
+                ),
+                executor=executor,
+                shards=3,
+            ).rebuild()
+
+        actual = await projection_store.locate(source=source, name="total")
+
+        assert stale is not None
+        assert stale.state == {"total": -1}
+        assert actual == expected
+
+    async def test_folds_in_process_when_projector_cannot_be_pickled(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        category = data.random_event_category_name()
+        streams = await publish_events(event_store, category)
+        projection_store = ProjectionStore(
+            adapter=InMemoryProjectionStorageAdapter()
+        )
+
+        result = await ProjectionRebuilder(
+            source=event_store.category(category=category),
+            projector=UnpicklableTotalProjector(),
+            projection_store=projection_store,
+            state_store=EventConsumerStateStore(
+                category=event_store.category(
+                    category=data.random_event_category_name()
+                )
+            ),
+            shards=2,
+        ).rebuild()
+
+        assert result.projections == len(streams)
+        for stream in streams:
+            expected = await TotalProjector().project(
+                source=event_store.stream(category=category, stream=stream)
+            )
+            actual = await projection_store.locate(
+                source=StreamIdentifier(category=category, stream=stream),
+                name="total",
+            )
+
+            assert actual == expected
+
+    async def test_folds_in_events_published_while_rebuilding(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        category = data.random_event_category_name()
+        streams = await publish_events(event_store, category)
+        projection_store = ProjectionStore(
+            adapter=InMemoryProjectionStorageAdapter()
+        )
+        state_store = EventConsumerStateStore(
+            category=event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = await ProjectionRebuilder(
+                source=PublishingAfterFirstScanSource(
+                    category=event_store.category(category=category),
+                    stream=streams[0],
+                ),
+                projector=TotalProjector(),
+                projection_store=projection_store,
+                state_store=state_store,
+                executor=executor,
+                shards=2,
+            ).rebuild()
+
+        expected = await TotalProjector().project(
+            source=event_store.stream(category=category, stream=streams[0])
+        )
+        actual = await projection_store.locate(
+            source=StreamIdentifier(category=category, stream=streams[0]),
+            name="total",
+        )
+        last_event = await event_store.category(category=category).latest()
+        state = await state_store.load()
+
+        assert actual is not None
+        assert actual == expected
+        assert actual.metadata == {"event_count": 4}
+        assert result.events == 13
+        assert result.projections == len(streams)
+        assert last_event is not None
+        assert state is not None
+        assert state.last_sequence_number == last_event.sequence_number
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,17 +1,27 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
 from logicblocks.event.processing import (
+    BatchEventProcessor,
     EventConsumerStateStore,
     EventCount,
     EventProcessor,
     EventSourceConsumer,
 )
 from logicblocks.event.store import (
+    EventHeadTracker,
+    EventNotification,
     EventStore,
     InMemoryEventStorageAdapter,
 )
 from logicblocks.event.testing import NewEventBuilder, data
 from logicblocks.event.testlogging import CapturingLogger
 from logicblocks.event.testlogging.logger import LogLevel
-from logicblocks.event.types import StoredEvent
+from logicblocks.event.types import StoredEvent, StreamIdentifier
+from logicblocks.event.utils.clock import StaticClock
 
 
 class CapturingEventProcessor(EventProcessor):
@@ -32,6 +42,38 @@ class ThrowingEventProcessor(EventProcessor):
         raise self._error
 
 
+class CapturingBatchEventProcessor(BatchEventProcessor):
+    def __init__(self):
+        self.batches: list[list[StoredEvent]] = []
+
+    async def process_events(self, events: Sequence[StoredEvent]):
+        self.batches.append(list(events))
+
+
+class ConcurrencyTrackingEventProcessor(EventProcessor):
+    def __init__(self):
+        self.processed_events: list[StoredEvent] = []
+        self.in_flight = 0
+        self.maximum_in_flight = 0
+
+    async def process_event(self, event: StoredEvent):
+        self.in_flight += 1
+        self.maximum_in_flight = max(self.maximum_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.processed_events.append(event)
+        self.in_flight -= 1
+
+
+def stream_names_in_distinct_lanes(category: str, lanes: int) -> list[str]:
+    names: dict[int, str] = {}
+    while len(names) < lanes:
+        name = data.random_event_stream_name()
+        lane = hash(StreamIdentifier(category=category, stream=name)) % lanes
+        names.setdefault(lane, name)
+
+    return [names[lane] for lane in range(lanes)]
+
+
 class TestEventSourceConsumer:
     async def test_consumes_all_events_on_first_consume(self):
         event_store = EventStore(adapter=InMemoryEventStorageAdapter())
@@ -75,6 +117,264 @@ class TestEventSourceConsumer:
             *publish_2_events,
         ]
 
+    async def test_skips_consume_when_notifications_do_not_affect_source(
+        self,
+    ):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_category = event_store.category(
+            category=data.random_event_category_name()
+        )
+        state_store = EventConsumerStateStore(category=state_category)
+
+        category_name = data.random_event_category_name()
+        other_category_name = data.random_event_category_name()
+        stream_name = data.random_event_stream_name()
+
+        processor = CapturingEventProcessor()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=processor,
+            state_store=state_store,
+        )
+
+        stored_events = await event_store.stream(
+            category=category_name, stream=stream_name
+        ).publish(events=[NewEventBuilder().build()])
+
+        await consumer.consume_notified(
+            [
+                EventNotification(
+                    category=other_category_name,
+                    stream=stream_name,
+                    sequence_number=stored_events[0].sequence_number,
+                )
+            ]
+        )
+
+        assert processor.processed_events == []
+
+        await consumer.consume_notified(
+            [
+                EventNotification(
+                    category=category_name,
+                    stream=stream_name,
+                    sequence_number=stored_events[0].sequence_number,
+                )
+            ]
+        )
+
+        assert processor.processed_events == stored_events
+
+    async def test_skips_scan_when_head_tracker_reports_no_new_events(
+        self,
+    ):
+        adapter = InMemoryEventStorageAdapter()
+        event_store = EventStore(adapter=adapter)
+        state_category = event_store.category(
+            category=data.random_event_category_name()
+        )
+        state_store = EventConsumerStateStore(category=state_category)
+        clock = StaticClock(datetime(2025, 1, 1, tzinfo=UTC))
+        head_tracker = EventHeadTracker(adapter=adapter, clock=clock)
+
+        category_name = data.random_event_category_name()
+        processor = CapturingEventProcessor()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=processor,
+            state_store=state_store,
+            head_tracker=head_tracker,
+        )
+
+        await consumer.consume_all()
+
+        stored_events = await event_store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build()])
+
+        await consumer.consume_all()
+
+        assert processor.processed_events == []
+
+        clock.set(datetime(2025, 1, 1, 0, 0, 1, tzinfo=UTC))
+
+        await consumer.consume_all()
+
+        assert processor.processed_events == stored_events
+
+    async def test_passes_events_in_chunks_to_batch_processor(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_category = event_store.category(
+            category=data.random_event_category_name()
+        )
+        state_store = EventConsumerStateStore(category=state_category)
+
+        category_name = data.random_event_category_name()
+        processor = CapturingBatchEventProcessor()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=processor,
+            state_store=state_store,
+            batch_size=2,
+        )
+
+        stored_events = await event_store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build() for _ in range(5)])
+
+        await consumer.consume_all()
+
+        assert processor.batches == [
+            list(stored_events[0:2]),
+            list(stored_events[2:4]),
+            list(stored_events[4:5]),
+        ]
+
+    async def test_checkpoints_once_per_chunk_for_batch_processor(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_category = event_store.category(
+            category=data.random_event_category_name()
+        )
+        state_store = EventConsumerStateStore(
+            category=state_category, persistence_interval=EventCount(3)
+        )
+
+        category_name = data.random_event_category_name()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=CapturingBatchEventProcessor(),
+            state_store=state_store,
+            batch_size=3,
+        )
+
+        stored_events = await event_store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build() for _ in range(6)])
+
+        await consumer.consume_all()
+
+        state_events = [event async for event in state_category]
+
+        assert [event.payload for event in state_events] == [
+            {
+                "last_sequence_number": stored_events[2].sequence_number,
+                "state": None,
+            },
+            {
+                "last_sequence_number": stored_events[5].sequence_number,
+                "state": None,
+            },
+        ]
+
+    async def test_processes_streams_concurrently_across_lanes(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_store = EventConsumerStateStore(
+            category=event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+
+        category_name = data.random_event_category_name()
+        stream_names = stream_names_in_distinct_lanes(category_name, 2)
+        processor = ConcurrencyTrackingEventProcessor()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=processor,
+            state_store=state_store,
+            lanes=2,
+        )
+
+        published = {
+            stream_name: await event_store.stream(
+                category=category_name, stream=stream_name
+            ).publish(events=[NewEventBuilder().build() for _ in range(3)])
+            for stream_name in stream_names
+        }
+
+        await consumer.consume_all()
+
+        assert processor.maximum_in_flight == 2
+        for stream_name, stream_events in published.items():
+            assert [
+                event
+                for event in processor.processed_events
+                if event.stream == stream_name
+            ] == list(stream_events)
+
+        state = await state_store.load()
+
+        assert state is not None
+        assert state.last_sequence_number == max(
+            event.sequence_number
+            for stream_events in published.values()
+            for event in stream_events
+        )
+
+    async def test_checkpoints_low_watermark_when_lane_fails(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_store = EventConsumerStateStore(
+            category=event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+
+        category_name = data.random_event_category_name()
+        failing_stream_name, succeeding_stream_name = (
+            stream_names_in_distinct_lanes(category_name, 2)
+        )
+        succeeding_processed = asyncio.Event()
+
+        class FailingEventProcessor(EventProcessor):
+            def __init__(self):
+                self.processed_events: list[StoredEvent] = []
+
+            async def process_event(self, event: StoredEvent):
+                if event.stream == failing_stream_name:
+                    await succeeding_processed.wait()
+                    raise RuntimeError("failed")
+
+                self.processed_events.append(event)
+                if len(self.processed_events) == 2:
+                    succeeding_processed.set()
+
+        await event_store.stream(
+            category=category_name, stream=failing_stream_name
+        ).publish(events=[NewEventBuilder().build()])
+        await event_store.stream(
+            category=category_name, stream=succeeding_stream_name
+        ).publish(events=[NewEventBuilder().build() for _ in range(2)])
+
+        processor = FailingEventProcessor()
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=processor,
+            state_store=state_store,
+            lanes=2,
+        )
+
+        with pytest.raises(RuntimeError):
+            await consumer.consume_all()
+
+        assert len(processor.processed_events) == 2
+        assert await state_store.load() is None
+
+    async def test_raises_when_lanes_less_than_one(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+
+        with pytest.raises(ValueError):
+            EventSourceConsumer(
+                source=event_store.category(
+                    category=data.random_event_category_name()
+                ),
+                processor=CapturingEventProcessor(),
+                state_store=EventConsumerStateStore(
+                    category=event_store.category(
+                        category=data.random_event_category_name()
+                    )
+                ),
+                lanes=0,
+            )
+
     async def test_consumes_only_new_events_on_subsequent_consumes(self):
         event_store = EventStore(adapter=InMemoryEventStorageAdapter())
         state_category = event_store.category(
@@ -124,6 +424,41 @@ class TestEventSourceConsumer:
             *publish_3_events,
         ]
 
+    async def test_reports_lag_between_source_head_and_checkpoint(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        state_store = EventConsumerStateStore(
+            category=event_store.category(
+                category=data.random_event_category_name()
+            )
+        )
+        category_name = data.random_event_category_name()
+        stream = event_store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        )
+
+        consumer = EventSourceConsumer(
+            source=event_store.category(category=category_name),
+            processor=CapturingEventProcessor(),
+            state_store=state_store,
+        )
+
+        assert await consumer.lag() == 0
+
+        await stream.publish(events=[NewEventBuilder().build()])
+        await consumer.consume_all()
+
+        assert await consumer.lag() == 0
+
+        published = await stream.publish(
+            events=[NewEventBuilder().build(), NewEventBuilder().build()]
+        )
+        state = await state_store.load()
+
+        assert state is not None
+        assert await consumer.lag() == (
+            published[-1].sequence_number - state.last_sequence_number
+        )
+
     async def test_doesnt_reprocess_already_processed_events_on_restart(self):
         event_store = EventStore(adapter=InMemoryEventStorageAdapter())
         state_category = event_store.category(
@@ -1,3 +1,7 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
 from pytest_unordered import unordered
 
 from logicblocks.event.processing import (
@@ -7,6 +11,7 @@ from logicblocks.event.processing import (
     EventSubscriptionConsumer,
 )
 from logicblocks.event.store import (
+    EventNotification,
     EventSource,
     EventStore,
     InMemoryEventStorageAdapter,
@@ -15,6 +20,7 @@ from logicblocks.event.testing import data
 from logicblocks.event.testlogging import CapturingLogger
 from logicblocks.event.testlogging.logger import LogLevel
 from logicblocks.event.types import CategoryIdentifier
+from logicblocks.event.utils.clock import StaticClock
 
 
 class CapturingEventConsumer(EventConsumer):
@@ -36,6 +42,31 @@ class CapturingEventConsumerFactory:
         return consumer
 
 
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.maximum_in_flight = 0
+        self.completed: list[str] = []
+
+
+class SlowEventConsumer(EventConsumer):
+    def __init__(
+        self, source: EventSource, tracker: ConcurrencyTracker, delay: float
+    ):
+        self.source = source
+        self._tracker = tracker
+        self._delay = delay
+
+    async def consume_all(self) -> None:
+        self._tracker.in_flight += 1
+        self._tracker.maximum_in_flight = max(
+            self._tracker.maximum_in_flight, self._tracker.in_flight
+        )
+        await asyncio.sleep(self._delay)
+        self._tracker.in_flight -= 1
+        self._tracker.completed.append(self.source.identifier.category)
+
+
 class CapturingEventBroker(EventBroker):
     def __init__(self):
         super().__init__()
@@ -189,6 +220,236 @@ class TestEventSubscriptionConsumer:
         assert stream_1_consumer.invoke_count == 1
         assert stream_2_consumer.invoke_count == 2
 
+    async def test_consumes_only_notified_sources_on_consume_notified(
+        self,
+    ):
+        delegate_factory = CapturingEventConsumerFactory()
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+
+        category_name = data.random_event_category_name()
+        sequence = CategoryIdentifier(category=category_name)
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[sequence],
+            delegate_factory=delegate_factory.factory,
+        )
+
+        stream_1_name = data.random_event_stream_name()
+        stream_2_name = data.random_event_stream_name()
+        stream_1_source = event_store.stream(
+            category=category_name, stream=stream_1_name
+        )
+        stream_2_source = event_store.stream(
+            category=category_name, stream=stream_2_name
+        )
+
+        await consumer.accept(stream_1_source)
+        await consumer.accept(stream_2_source)
+
+        await consumer.consume_notified(
+            [
+                EventNotification(
+                    category=category_name,
+                    stream=stream_2_name,
+                    sequence_number=5,
+                )
+            ]
+        )
+
+        consumers = {
+            consumer.source.identifier: consumer
+            for consumer in delegate_factory.consumers
+        }
+
+        assert consumers[stream_1_source.identifier].invoke_count == 0
+        assert consumers[stream_2_source.identifier].invoke_count == 1
+
+    async def test_limits_concurrent_consumption_to_max_concurrency(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        tracker = ConcurrencyTracker()
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=lambda source: SlowEventConsumer(
+                source, tracker, 0.01
+            ),
+            max_concurrency=2,
+        )
+
+        for _ in range(5):
+            await consumer.accept(
+                event_store.category(
+                    category=data.random_event_category_name()
+                )
+            )
+
+        await consumer.consume_all()
+
+        assert tracker.maximum_in_flight == 2
+        assert len(tracker.completed) == 5
+
+    async def test_slow_source_does_not_delay_other_sources(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        tracker = ConcurrencyTracker()
+        slow_category = data.random_event_category_name()
+        fast_categories = [data.random_event_category_name() for _ in range(3)]
+
+        def delegate_factory(source: EventSource) -> EventConsumer:
+            delay = 0.1 if source.identifier.category == slow_category else 0
+            return SlowEventConsumer(source, tracker, delay)
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=delegate_factory,
+            max_concurrency=2,
+        )
+
+        for category in [slow_category, *fast_categories]:
+            await consumer.accept(event_store.category(category=category))
+
+        await consumer.consume_all()
+
+        assert tracker.completed == [*fast_categories, slow_category]
+
+    async def test_rotates_start_order_between_consumes(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        tracker = ConcurrencyTracker()
+        categories = [data.random_event_category_name() for _ in range(3)]
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=lambda source: SlowEventConsumer(
+                source, tracker, 0
+            ),
+            max_concurrency=2,
+        )
+
+        for category in categories:
+            await consumer.accept(event_store.category(category=category))
+
+        await consumer.consume_all()
+        first_order = list(tracker.completed)
+        tracker.completed.clear()
+        await consumer.consume_all()
+        second_order = list(tracker.completed)
+
+        assert first_order == categories
+        assert second_order == [*categories[1:], categories[0]]
+
+    async def test_records_consumption_metrics_per_source(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        delegate_factory = CapturingEventConsumerFactory()
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=delegate_factory.factory,
+            max_concurrency=2,
+            clock=StaticClock(now),
+        )
+
+        source_1 = event_store.category(
+            category=data.random_event_category_name()
+        )
+        source_2 = event_store.category(
+            category=data.random_event_category_name()
+        )
+        await consumer.accept(source_1)
+        await consumer.accept(source_2)
+
+        await consumer.consume_all()
+        await consumer.consume_all()
+        await consumer.withdraw(source_2)
+
+        metrics = consumer.metrics
+
+        assert list(metrics.keys()) == [source_1.identifier]
+        assert metrics[source_1.identifier].consume_count == 2
+        assert metrics[source_1.identifier].failure_count == 0
+        assert metrics[source_1.identifier].last_completed_at == now
+
+    async def test_reports_lag_of_each_source_on_request(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        lag_requests: list[CategoryIdentifier] = []
+
+        class LaggingEventConsumer(EventConsumer):
+            def __init__(self, source: EventSource):
+                self.source = source
+
+            async def consume_all(self) -> None:
+                pass
+
+            async def lag(self) -> int | None:
+                lag_requests.append(self.source.identifier)
+                return 3
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=LaggingEventConsumer,
+        )
+        source = event_store.category(
+            category=data.random_event_category_name()
+        )
+        await consumer.accept(source)
+
+        await consumer.consume_all()
+
+        assert lag_requests == []
+        assert await consumer.lags() == {source.identifier: 3}
+
+    async def test_reports_no_lag_for_sources_whose_lag_fails(self):
+        event_store = EventStore(adapter=InMemoryEventStorageAdapter())
+        logger = CapturingLogger.create()
+
+        class FailingLagEventConsumer(EventConsumer):
+            async def consume_all(self) -> None:
+                pass
+
+            async def lag(self) -> int | None:
+                raise RuntimeError("Head unavailable.")
+
+        consumer = EventSubscriptionConsumer(
+            group=data.random_subscriber_group(),
+            id=data.random_subscriber_id(),
+            subscription_requests=[],
+            delegate_factory=lambda source: FailingLagEventConsumer(),
+            logger=logger,
+        )
+        source = event_store.category(
+            category=data.random_event_category_name()
+        )
+        await consumer.accept(source)
+
+        await consumer.consume_all()
+
+        assert await consumer.lags() == {source.identifier: None}
+        assert (
+            logger.find_event("event.consumer.subscription.lag-failed")
+            is not None
+        )
+
+    async def test_raises_when_max_concurrency_less_than_one(self):
+        with pytest.raises(ValueError):
+            EventSubscriptionConsumer(
+                group=data.random_subscriber_group(),
+                id=data.random_subscriber_id(),
+                subscription_requests=[],
+                delegate_factory=CapturingEventConsumerFactory().factory,
+                max_concurrency=0,
+            )
+
     async def test_logs_when_accepting_source(self):
         logger = CapturingLogger.create()
         delegate_factory = CapturingEventConsumerFactory()
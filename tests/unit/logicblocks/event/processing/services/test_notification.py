@@ -0,0 +1,120 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import timedelta
+
+from logicblocks.event.processing import NotificationAwareService
+from logicblocks.event.store import (
+    EventNotification,
+    InMemoryEventNotificationHub,
+)
+
+
+class TestNotificationAwareService:
+    async def test_polls_on_start_and_on_interval_without_notifications(
+        self,
+    ):
+        poll_count = 0
+
+        async def poll() -> None:
+            nonlocal poll_count
+            poll_count += 1
+
+        async def notify(notifications: Sequence[EventNotification]) -> None:
+            pass
+
+        service = NotificationAwareService(
+            notification_source=InMemoryEventNotificationHub(),
+            on_notifications=notify,
+            on_poll=poll,
+            poll_interval=timedelta(milliseconds=20),
+        )
+
+        task = asyncio.create_task(service.execute())
+
+        await asyncio.sleep(timedelta(milliseconds=50).total_seconds())
+
+        task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert poll_count == 3
+
+    async def test_delivers_notifications_as_they_arrive(self):
+        hub = InMemoryEventNotificationHub()
+        received: list[EventNotification] = []
+        delivered = asyncio.Event()
+
+        async def poll() -> None:
+            pass
+
+        async def notify(notifications: Sequence[EventNotification]) -> None:
+            received.extend(notifications)
+            delivered.set()
+
+        service = NotificationAwareService(
+            notification_source=hub,
+            on_notifications=notify,
+            on_poll=poll,
+            poll_interval=timedelta(seconds=10),
+        )
+
+        task = asyncio.create_task(service.execute())
+        await asyncio.sleep(0.01)
+
+        notification = EventNotification(
+            category="category", stream="stream", sequence_number=1
+        )
+        hub.publish([notification])
+
+        await asyncio.wait_for(delivered.wait(), 1)
+
+        task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert received == [notification]
+
+    async def test_keeps_polling_under_steady_notifications(self):
+        hub = InMemoryEventNotificationHub()
+        poll_count = 0
+
+        async def poll() -> None:
+            nonlocal poll_count
+            poll_count += 1
+
+        async def notify(notifications: Sequence[EventNotification]) -> None:
+            pass
+
+        service = NotificationAwareService(
+            notification_source=hub,
+            on_notifications=notify,
+            on_poll=poll,
+            poll_interval=timedelta(milliseconds=20),
+        )
+
+        async def publish() -> None:
+            sequence_number = 0
+            while True:
+                sequence_number += 1
+                hub.publish(
+                    [
+                        EventNotification(
+                            category="category",
+                            stream="stream",
+                            sequence_number=sequence_number,
+                        )
+                    ]
+                )
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(service.execute())
+        publisher = asyncio.create_task(publish())
+
+        await asyncio.sleep(timedelta(milliseconds=70).total_seconds())
+
+        task.cancel()
+        publisher.cancel()
+
+        await asyncio.gather(task, publisher, return_exceptions=True)
+
+        assert poll_count >= 3
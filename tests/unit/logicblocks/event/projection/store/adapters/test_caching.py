@@ -0,0 +1,273 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from logicblocks.event.projection import (
+    CachingProjectionStorageAdapter,
+    InMemoryProjectionNotificationHub,
+    InMemoryProjectionStorageAdapter,
+    ProjectionCacheStatistics,
+    ProjectionNotification,
+    ProjectionStore,
+)
+from logicblocks.event.projection.store import ProjectionStorageAdapter
+from logicblocks.event.query import Search
+from logicblocks.event.testcases.projection.store.adapters import (
+    ProjectionStorageAdapterCases,
+)
+from logicblocks.event.testing import MappingProjectionBuilder
+from logicblocks.event.types import JsonValue, Projection
+from logicblocks.event.utils.clock import StaticClock
+
+
+class CountingProjectionStorageAdapter(InMemoryProjectionStorageAdapter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.find_one_calls = 0
+
+    async def find_one(self, **kwargs):
+        self.find_one_calls += 1
+        return await super().find_one(**kwargs)
+
+
+class TestCachingProjectionStorageAdapterCommonCases(
+    ProjectionStorageAdapterCases
+):
+    def construct_storage_adapter(self) -> ProjectionStorageAdapter:
+        return CachingProjectionStorageAdapter(
+            delegate=InMemoryProjectionStorageAdapter()
+        )
+
+    async def clear_storage(self) -> None:
+        pass
+
+    async def retrieve_projections(
+        self,
+        *,
+        adapter: ProjectionStorageAdapter,
+    ) -> Sequence[Projection[JsonValue]]:
+        return await adapter.find_many(search=Search())
+
+
+class TestCachingProjectionStorageAdapter:
+    def setup_method(self):
+        self.clock = StaticClock(datetime(2024, 1, 1, tzinfo=UTC))
+        self.delegate = CountingProjectionStorageAdapter()
+
+    def construct_store(
+        self,
+        *,
+        capacity: int = 1024,
+        ttl: timedelta | None = timedelta(seconds=60),
+    ) -> tuple[ProjectionStore, CachingProjectionStorageAdapter]:
+        adapter = CachingProjectionStorageAdapter(
+            delegate=self.delegate,
+            capacity=capacity,
+            ttl=ttl,
+            clock=self.clock,
+        )
+        return ProjectionStore(adapter=adapter), adapter
+
+    async def test_serves_repeated_loads_from_cache(self):
+        store, adapter = self.construct_store()
+        projection = MappingProjectionBuilder().build()
+        await store.save(projection=projection)
+
+        first = await store.load(id=projection.id, name=projection.name)
+        second = await store.load(id=projection.id, name=projection.name)
+
+        assert first == projection
+        assert second == projection
+        assert self.delegate.find_one_calls == 1
+        assert adapter.statistics == ProjectionCacheStatistics(
+            hits=1, misses=1, evictions=0, invalidations=0, size=1
+        )
+
+    async def test_serves_repeated_locates_from_cache(self):
+        store, _ = self.construct_store()
+        projection = MappingProjectionBuilder().build()
+        await store.save(projection=projection)
+
+        await store.locate(source=projection.source, name=projection.name)
+        located = await store.locate(
+            source=projection.source, name=projection.name
+        )
+
+        assert located == projection
+        assert self.delegate.find_one_calls == 1
+
+    async def test_invalidates_cached_lookups_on_save(self):
+        store, adapter = self.construct_store()
+        projection = MappingProjectionBuilder().build()
+        await store.save(projection=projection)
+        await store.load(id=projection.id, name=projection.name)
+        await store.locate(source=projection.source, name=projection.name)
+
+        updated = MappingProjectionBuilder(
+            id=projection.id,
+            name=projection.name,
+            source=projection.source,
+            state={"value": "updated"},
+        ).build()
+        await store.save_many(projections=[updated])
+
+        assert await store.load(id=projection.id, name=projection.name) == (
+            updated
+        )
+        assert (
+            await store.locate(source=projection.source, name=projection.name)
+            == updated
+        )
+        assert adapter.statistics.invalidations == 2
+
+    async def test_does_not_cache_missing_projections(self):
+        store, _ = self.construct_store()
+        projection = MappingProjectionBuilder().build()
+
+        assert await store.load(id=projection.id, name=projection.name) is None
+
+        await store.save(projection=projection)
+
+        assert await store.load(id=projection.id, name=projection.name) == (
+            projection
+        )
+
+    async def test_expires_entries_after_ttl(self):
+        store, adapter = self.construct_store(ttl=timedelta(seconds=10))
+        projection = MappingProjectionBuilder().build()
+        await store.save(projection=projection)
+        await store.load(id=projection.id, name=projection.name)
+
+        self.clock.set(datetime(2024, 1, 1, 0, 0, 10, tzinfo=UTC))
+        await store.load(id=projection.id, name=projection.name)
+
+        assert self.delegate.find_one_calls == 2
+        assert adapter.statistics.evictions == 1
+
+    async def test_evicts_least_recently_used_entries_over_capacity(self):
+        store, adapter = self.construct_store(capacity=2)
+        projections = [MappingProjectionBuilder().build() for _ in range(3)]
+        await store.save_many(projections=projections)
+
+        await store.load(id=projections[0].id, name=projections[0].name)
+        await store.load(id=projections[1].id, name=projections[1].name)
+        await store.load(id=projections[0].id, name=projections[0].name)
+        await store.load(id=projections[2].id, name=projections[2].name)
+
+        await store.load(id=projections[0].id, name=projections[0].name)
+        await store.load(id=projections[1].id, name=projections[1].name)
+
+        assert self.delegate.find_one_calls == 4
+        assert adapter.statistics.evictions == 2
+        assert adapter.statistics.size == 2
+
+    async def test_does_not_cache_reads_racing_with_saves(self):
+        store, adapter = self.construct_store()
+        projection = MappingProjectionBuilder().build()
+        await store.save(projection=projection)
+
+        reading = asyncio.Event()
+        resume = asyncio.Event()
+        find_one = self.delegate.find_one
+
+        async def slow_find_one(**kwargs):
+            result = await find_one(**kwargs)
+            reading.set()
+            await resume.wait()
+            return result
+
+        self.delegate.find_one = slow_find_one
+
+        load = asyncio.create_task(
+            store.load(id=projection.id, name=projection.name)
+        )
+        await reading.wait()
+        adapter.invalidate(name=projection.name, id=projection.id)
+        resume.set()
+        await load
+
+        assert adapter.statistics.size == 0
+
+    async def test_invalidates_entries_from_notifications(self):
+        hub = InMemoryProjectionNotificationHub()
+        store, adapter = self.construct_store()
+        first = MappingProjectionBuilder().with_name("thing").build()
+        second = MappingProjectionBuilder().with_name("thing").build()
+        other = MappingProjectionBuilder().build()
+        await store.save_many(projections=[first, second, other])
+
+        listener = asyncio.create_task(adapter.listen(notification_source=hub))
+        await asyncio.sleep(0)
+
+        for projection in [first, second, other]:
+            await store.load(id=projection.id, name=projection.name)
+
+        hub.publish([ProjectionNotification(name="thing", id=first.id)])
+        await asyncio.sleep(0)
+
+        assert adapter.statistics.size == 2
+
+        hub.publish([ProjectionNotification(name="thing")])
+        await asyncio.sleep(0)
+
+        assert adapter.statistics.size == 1
+
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    async def test_in_memory_adapter_publishes_saved_projections(self):
+        hub = InMemoryProjectionNotificationHub()
+        adapter = InMemoryProjectionStorageAdapter(notifications=hub)
+        projection = MappingProjectionBuilder().build()
+
+        async with hub.listen() as notifications:
+            await adapter.save(projection=projection)
+
+            received = await asyncio.wait_for(anext(notifications), 1)
+
+        assert received == ProjectionNotification(
+            name=projection.name, id=projection.id
+        )
+
+    def test_rejects_capacity_below_one(self):
+        with pytest.raises(ValueError):
+            CachingProjectionStorageAdapter(
+                delegate=InMemoryProjectionStorageAdapter(), capacity=0
+            )
+
+
+class TestProjectionNotification:
+    @pytest.mark.parametrize(
+        "notification",
+        [
+            ProjectionNotification(name="thing", id="1"),
+            ProjectionNotification(name="thing"),
+        ],
+    )
+    def test_round_trips_through_serialisation(self, notification):
+        assert (
+            ProjectionNotification.deserialise(notification.serialise())
+            == notification
+        )
+
+    @pytest.mark.parametrize(
+        "notification,name,id,affected",
+        [
+            (ProjectionNotification(name="thing", id="1"), "thing", "1", True),
+            (
+                ProjectionNotification(name="thing", id="1"),
+                "thing",
+                "2",
+                False,
+            ),
+            (ProjectionNotification(name="thing"), "thing", "2", True),
+            (ProjectionNotification(name="thing"), "other", "1", False),
+        ],
+    )
+    def test_determines_affected_projections(
+        self, notification, name, id, affected
+    ):
+        assert notification.affects(name=name, id=id) is affected
@@ -0,0 +1,146 @@
+import json
+import pathlib
+from collections.abc import Sequence
+from uuid import uuid4
+
+import pytest
+
+from logicblocks.event.persistence.sqlite import ConnectionSettings
+from logicblocks.event.projection import SqliteProjectionStorageAdapter
+from logicblocks.event.projection.store import ProjectionStorageAdapter
+from logicblocks.event.projection.store.adapters.sqlite import prefilter
+from logicblocks.event.query import (
+    FilterClause,
+    Lookup,
+    Operator,
+    Path,
+    Search,
+)
+from logicblocks.event.testcases.projection.store.adapters import (
+    ProjectionStorageAdapterCases,
+)
+from logicblocks.event.testing import MappingProjectionBuilder
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    JsonValue,
+    Projection,
+    StreamIdentifier,
+)
+
+
+class TestSqliteProjectionStorageAdapter(ProjectionStorageAdapterCases):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        self._directory = tmp_path
+        return tmp_path
+
+    def construct_storage_adapter(self) -> ProjectionStorageAdapter:
+        return SqliteProjectionStorageAdapter(
+            connection_source=ConnectionSettings(
+                database=str(self._directory / f"{uuid4().hex}.db")
+            )
+        )
+
+    async def clear_storage(self) -> None:
+        pass
+
+    async def retrieve_projections(
+        self,
+        *,
+        adapter: ProjectionStorageAdapter,
+    ) -> Sequence[Projection[JsonValue]]:
+        return await adapter.find_many(search=Search())
+
+
+class TestSqliteProjectionPrefilter:
+    def test_pushes_equality_filters_on_name_and_id_into_sql(self):
+        conditions, params = prefilter(
+            Lookup(
+                filters=[
+                    FilterClause(Operator.EQUAL, Path("name"), "thing"),
+                    FilterClause(Operator.EQUAL, Path("id"), "123"),
+                ]
+            )
+        )
+
+        assert conditions == ("name = ?", "id = ?")
+        assert params == ["thing", "123"]
+
+    def test_pushes_equality_filters_on_source_into_sql(self):
+        source = StreamIdentifier(category="things", stream="thing")
+
+        conditions, params = prefilter(
+            Lookup(
+                filters=[
+                    FilterClause(Operator.EQUAL, Path("source"), source),
+                    FilterClause(Operator.EQUAL, Path("name"), "thing"),
+                ]
+            )
+        )
+
+        assert conditions == ("source = ?", "name = ?")
+        assert params == [json.dumps(source.serialise()), "thing"]
+
+    def test_leaves_other_filters_to_query_converter(self):
+        conditions, params = prefilter(
+            Search(
+                filters=[
+                    FilterClause(Operator.NOT_EQUAL, Path("name"), "thing"),
+                    FilterClause(Operator.EQUAL, Path("state", "id"), "1"),
+                    FilterClause(Operator.EQUAL, Path("value"), "1"),
+                    FilterClause(Operator.EQUAL, Path("source"), "things"),
+                    FilterClause(
+                        Operator.NOT_EQUAL,
+                        Path("source"),
+                        CategoryIdentifier(category="things"),
+                    ),
+                ]
+            )
+        )
+
+        assert conditions == ()
+        assert params == []
+
+
+class TestSqliteProjectionSourceLookup:
+    async def test_locates_projection_by_source_using_index(
+        self, tmp_path: pathlib.Path
+    ):
+        adapter = SqliteProjectionStorageAdapter(
+            connection_source=ConnectionSettings(
+                database=str(tmp_path / f"{uuid4().hex}.db")
+            )
+        )
+        source = StreamIdentifier(category="things", stream="thing")
+        projection = (
+            MappingProjectionBuilder()
+            .with_name("thing")
+            .with_source(source)
+            .build()
+        )
+        await adapter.save_many(
+            projections=[
+                projection,
+                MappingProjectionBuilder().with_name("thing").build(),
+            ]
+        )
+        lookup = Lookup(
+            filters=[
+                FilterClause(Operator.EQUAL, Path("source"), source),
+                FilterClause(Operator.EQUAL, Path("name"), "thing"),
+            ]
+        )
+        conditions, params = prefilter(lookup)
+
+        plan = await adapter.connection.run(
+            lambda connection: connection.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM projections "
+                f"WHERE {' AND '.join(conditions)}",
+                params,
+            ).fetchall()
+        )
+        found = await adapter.find_one(lookup=lookup)
+        await adapter.close()
+
+        assert any("projections_source_index" in row[-1] for row in plan)
+        assert found == projection
@@ -8,6 +8,7 @@ from typing import Any, Mapping, MutableMapping, Self
 import pytest
 
 from logicblocks.event.projection import (
+    InMemoryProjectionSnapshotStore,
     MissingHandlerBehaviour,
     MissingProjectionHandlerError,
     Projector,
@@ -308,8 +309,99 @@ class TestProjectorEventApplication:
 
         assert expected_state == actual_state
 
+    def test_applies_many_events_in_one_call(self):
+        projector = CountingProjector()
+        events = [
+            generic_event.with_name("something-occurred").build()
+            for _ in range(3)
+        ]
+
+        assert projector.apply_many(events=events) == 3
+        assert projector.apply_many(events=events, state=2) == 5
+
+    def test_raises_on_missing_handler_when_applying_many(self):
+        projector = CountingProjector()
+
+        with pytest.raises(MissingProjectionHandlerError):
+            projector.apply_many(
+                events=[
+                    generic_event.with_name("something-weird-occurred").build()
+                ]
+            )
+
+    def test_converts_each_event_name_once_per_projector_class(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        converted: list[str] = []
+
+        def to_snake_case(name: str) -> str:
+            converted.append(name)
+            return name.replace("-", "_")
+
+        monkeypatch.setattr(
+            "logicblocks.event.projection.projector.to_snake_case",
+            to_snake_case,
+        )
+
+        class FreshCountingProjector(CountingProjector):
+            pass
+
+        events = [
+            generic_event.with_name("something-occurred").build()
+            for _ in range(3)
+        ]
+        FreshCountingProjector().apply_many(events=events)
+        FreshCountingProjector().apply(event=events[0], state=0)
+
+        assert converted == ["something-occurred"]
+
+    def test_uses_handlers_assigned_on_the_instance(self):
+        projector = CountingProjector()
+        events = [
+            generic_event.with_name("something-occurred").build()
+            for _ in range(2)
+        ]
+
+        assert projector.apply_many(events=events) == 2
+
+        # note: assigned after a first dispatch has bound the class handler.
+        projector.something_occurred = lambda state, event: state + 10
+
+        assert projector.apply_many(events=events) == 20
+        assert projector.apply(event=events[0], state=0) == 10
+
+    def test_applies_many_events_through_overridden_apply(self):
+        projector = RecordingCountingProjector()
+        events = [
+            generic_event.with_name("something-occurred").build()
+            for _ in range(3)
+        ]
+
+        assert projector.apply_many(events=events) == 3
+        assert projector.fold(events=events, state=3) == (6, {})
+        assert projector.recorded == events + events
+
 
 class TestProjectorProjection:
+    async def test_projects_events_through_overridden_apply(self):
+        store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        events = await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(3)
+            ]
+        )
+        projector = RecordingCountingProjector()
+
+        projection = await projector.project(source=stream)
+
+        assert projection.state == 3
+        assert projector.recorded == events
+
     async def test_projects_state_using_event_source_as_generic_type(self):
         category_name = data.random_event_category_name()
         stream_name = data.random_event_stream_name()
@@ -762,5 +854,152 @@ class TestProjectorProjection:
         assert projection.name == projection_name
 
 
+class CountingProjector(Projector[StreamIdentifier, int]):
+    snapshot_interval = 2
+
+    def __init__(self):
+        self.applied = 0
+
+    def initial_state_factory(self) -> int:
+        return 0
+
+    def initial_metadata_factory(self) -> JsonValue:
+        return {}
+
+    def id_factory(self, state: int, source: StreamIdentifier) -> str:
+        return source.stream
+
+    def something_occurred(self, state: int, event: StoredEvent) -> int:
+        self.applied += 1
+        return state + 1
+
+
+class RevisedCountingProjector(CountingProjector):
+    name = "counting"
+    version = 2
+
+
+class RecordingCountingProjector(CountingProjector):
+    def __init__(self):
+        super().__init__()
+        self.recorded: list[StoredEvent[Any]] = []
+
+    def apply(
+        self, *, event: StoredEvent[Any], state: int | None = None
+    ) -> int:
+        self.recorded.append(event)
+        return super().apply(event=event, state=state)
+
+
+class TestProjectorSnapshots:
+    async def test_saves_snapshot_at_configured_interval(self):
+        store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        events = await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(5)
+            ]
+        )
+        snapshots = InMemoryProjectionSnapshotStore[int]()
+
+        projection = await CountingProjector().project(
+            source=stream, snapshots=snapshots
+        )
+        snapshot = await snapshots.load(
+            name="counting", source=stream.identifier
+        )
+
+        assert projection.state == 5
+        assert snapshot is not None
+        assert snapshot.state == 4
+        assert snapshot.position == events[3].position
+        assert snapshot.sequence_number == events[3].sequence_number
+        assert snapshot.version == 1
+
+    async def test_resumes_from_snapshot_applying_only_later_events(self):
+        store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(5)
+            ]
+        )
+        snapshots = InMemoryProjectionSnapshotStore[int]()
+        await CountingProjector().project(source=stream, snapshots=snapshots)
+
+        await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(2)
+            ]
+        )
+        projector = CountingProjector()
+        projection = await projector.project(
+            source=stream, snapshots=snapshots
+        )
+
+        assert projection.state == 7
+        assert projector.applied == 3
+
+    async def test_ignores_snapshots_from_other_projector_versions(self):
+        store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(5)
+            ]
+        )
+        snapshots = InMemoryProjectionSnapshotStore[int]()
+        await CountingProjector().project(source=stream, snapshots=snapshots)
+
+        projector = RevisedCountingProjector()
+        projection = await projector.project(
+            source=stream, snapshots=snapshots
+        )
+        snapshot = await snapshots.load(
+            name="counting", source=stream.identifier
+        )
+
+        assert projection.state == 5
+        assert projector.applied == 5
+        assert snapshot is not None
+        assert snapshot.version == 2
+
+    async def test_ignores_snapshots_when_state_provided(self):
+        store = EventStore(adapter=InMemoryEventStorageAdapter())
+        stream = store.stream(
+            category=data.random_event_category_name(),
+            stream=data.random_event_stream_name(),
+        )
+        await stream.publish(
+            events=[
+                NewEventBuilder().with_name("something-occurred").build()
+                for _ in range(4)
+            ]
+        )
+        snapshots = InMemoryProjectionSnapshotStore[int]()
+        await CountingProjector().project(source=stream, snapshots=snapshots)
+
+        projector = CountingProjector()
+        projection = await projector.project(
+            source=stream, state=10, snapshots=snapshots
+        )
+
+        assert projection.state == 14
+        assert projector.applied == 4
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
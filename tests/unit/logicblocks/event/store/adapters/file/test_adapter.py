@@ -0,0 +1,236 @@
+import sys
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from logicblocks.event.store.adapters import (
+    EventSerialisationGuarantee,
+    EventStorageAdapter,
+    FileEventStorageAdapter,
+)
+from logicblocks.event.store.conditions import position_is
+from logicblocks.event.testcases.store.adapters import (
+    ConcurrencyParameters,
+    EventStorageAdapterCases,
+)
+from logicblocks.event.testing import NewEventBuilder
+from logicblocks.event.types import (
+    LogIdentifier,
+    StoredEvent,
+    StreamIdentifier,
+    identifier,
+)
+
+stream = StreamIdentifier(category="category", stream="stream")
+other_stream = StreamIdentifier(category="category", stream="other")
+
+
+async def scan_all(adapter: EventStorageAdapter) -> list[StoredEvent]:
+    return [event async for event in adapter.scan(target=LogIdentifier())]
+
+
+class TestFileEventStorageAdapterCommonCases(EventStorageAdapterCases):
+    @pytest.fixture(autouse=True)
+    def directory(self, tmp_path: Path) -> Iterator[Path]:
+        self._directory = tmp_path
+        self._adapters: list[FileEventStorageAdapter] = []
+        yield tmp_path
+        for adapter in self._adapters:
+            adapter.close()
+
+    @property
+    def concurrency_parameters(self):
+        return ConcurrencyParameters(concurrent_writes=3, repeats=5)
+
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: EventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        adapter = FileEventStorageAdapter(
+            directory=self._directory / uuid4().hex,
+            serialisation_guarantee=serialisation_guarantee,
+        )
+        self._adapters.append(adapter)
+        return adapter
+
+    async def clear_storage(self) -> None:
+        pass
+
+    async def retrieve_events(
+        self,
+        *,
+        adapter: EventStorageAdapter,
+        category: str | None = None,
+        stream: str | None = None,
+    ) -> Sequence[StoredEvent]:
+        return [
+            event
+            async for event in adapter.scan(
+                target=identifier.target(category=category, stream=stream)
+            )
+        ]
+
+
+class TestFileEventStorageAdapterDurability:
+    async def test_reads_events_saved_before_reopening(self, tmp_path: Path):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+        saved = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(3)],
+        )
+        adapter.close()
+
+        reopened = FileEventStorageAdapter(directory=tmp_path)
+
+        assert await scan_all(reopened) == saved
+        assert await reopened.latest(target=stream) == saved[-1]
+
+        reopened.close()
+
+    async def test_continues_positions_and_sequence_numbers_after_reopening(
+        self, tmp_path: Path
+    ):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+        first = await adapter.save(
+            target=stream, events=[NewEventBuilder().build()]
+        )
+        adapter.close()
+
+        reopened = FileEventStorageAdapter(directory=tmp_path)
+        second = await reopened.save(
+            target=stream,
+            events=[NewEventBuilder().build()],
+            condition=position_is(0),
+        )
+
+        assert second[0].position == first[0].position + 1
+        assert second[0].sequence_number == first[0].sequence_number + 1
+
+        reopened.close()
+
+    async def test_rolls_over_to_new_segment_files(self, tmp_path: Path):
+        adapter = FileEventStorageAdapter(directory=tmp_path, segment_size=512)
+        saved = [
+            *await adapter.save(
+                target=stream,
+                events=[NewEventBuilder().build() for _ in range(5)],
+            ),
+            *await adapter.save(
+                target=other_stream,
+                events=[NewEventBuilder().build() for _ in range(5)],
+            ),
+        ]
+
+        assert len(list(tmp_path.glob("*.segment"))) > 1
+        assert await scan_all(adapter) == saved
+
+        adapter.close()
+        reopened = FileEventStorageAdapter(
+            directory=tmp_path, segment_size=512
+        )
+
+        assert await scan_all(reopened) == saved
+
+        reopened.close()
+
+    async def test_discards_partially_written_tail_on_reopening(
+        self, tmp_path: Path
+    ):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+        saved = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(2)],
+        )
+        adapter.close()
+
+        with open(tmp_path / "00000000.segment", "ab") as segment:
+            segment.write(b'{"id":"torn')
+        with open(tmp_path / "log.index", "ab") as log_index:
+            log_index.write(b"\x00\x01\x02")
+
+        reopened = FileEventStorageAdapter(directory=tmp_path)
+        later = await reopened.save(
+            target=stream, events=[NewEventBuilder().build()]
+        )
+
+        assert await scan_all(reopened) == [*saved, *later]
+        assert later[0].position == 2
+
+        reopened.close()
+
+    async def test_discards_torn_batch_whole_on_reopening(
+        self, tmp_path: Path
+    ):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+        first = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(2)],
+        )
+        await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(3)],
+        )
+        adapter.close()
+
+        stream_index = tmp_path / "stream.index"
+        stream_index.write_bytes(stream_index.read_bytes()[:-1])
+
+        reopened = FileEventStorageAdapter(directory=tmp_path)
+        later = await reopened.save(
+            target=stream, events=[NewEventBuilder().build()]
+        )
+
+        assert await scan_all(reopened) == [*first, *later]
+        assert later[0].position == 2
+
+        reopened.close()
+
+    async def test_discards_batch_without_commit_record_on_reopening(
+        self, tmp_path: Path
+    ):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+        first = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(2)],
+        )
+        await adapter.save(
+            target=other_stream,
+            events=[NewEventBuilder().build() for _ in range(3)],
+        )
+        adapter.close()
+
+        commits = tmp_path / "commits"
+        commits.write_bytes(commits.read_bytes()[:-1])
+
+        reopened = FileEventStorageAdapter(directory=tmp_path)
+
+        assert await scan_all(reopened) == first
+        assert await reopened.latest(target=other_stream) is None
+
+        reopened.close()
+
+    async def test_rejects_directory_already_in_use(self, tmp_path: Path):
+        adapter = FileEventStorageAdapter(directory=tmp_path)
+
+        with pytest.raises(ValueError):
+            FileEventStorageAdapter(directory=tmp_path)
+
+        adapter.close()
+
+    async def test_reads_saved_events_without_fsync(self, tmp_path: Path):
+        adapter = FileEventStorageAdapter(directory=tmp_path, fsync=False)
+        saved = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(2)],
+        )
+
+        assert await scan_all(adapter) == saved
+
+        adapter.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
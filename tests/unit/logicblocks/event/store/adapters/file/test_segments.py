@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from logicblocks.event.store.adapters.file.segments import (
+    SegmentEventRecords,
+)
+from logicblocks.event.testing import StoredEventBuilder
+
+
+def append_batch(records: SegmentEventRecords, count: int) -> list:
+    events = [
+        StoredEventBuilder().with_sequence_number(len(records) + index).build()
+        for index in range(count)
+    ]
+    for event in events:
+        records.append(event)
+    records.commit()
+    return events
+
+
+class TestSegmentEventRecords:
+    async def test_reads_events_while_tailing_the_current_segment(
+        self, tmp_path: Path
+    ):
+        records = SegmentEventRecords(tmp_path)
+        expected = []
+
+        for _ in range(5):
+            expected.extend(append_batch(records, 2))
+            await records.sync()
+
+            assert [records[index] for index in range(len(records))] == (
+                expected
+            )
+
+        records.close()
+
+    async def test_closes_mappings_replaced_by_longer_ones(
+        self, tmp_path: Path
+    ):
+        records = SegmentEventRecords(tmp_path)
+        append_batch(records, 1)
+        await records.sync()
+        records[0]
+        first_map = records._segment_map(0, 1)
+
+        append_batch(records, 1)
+        await records.sync()
+        records[1]
+
+        assert first_map.closed
+        assert not records._segment_map(0, 1).closed
+
+        records.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -7,6 +7,7 @@ from logicblocks.event.store.adapters import (
     EventSerialisationGuarantee,
     EventStorageAdapter,
     InMemoryEventStorageAdapter,
+    InMemoryStorageMode,
 )
 from logicblocks.event.testcases.store.adapters import (
     ConcurrencyParameters,
@@ -47,5 +48,19 @@ class TestInMemoryEventStorageAdapterCommonCases(EventStorageAdapterCases):
         ]
 
 
+class TestInMemoryEventStorageAdapterColumnarCommonCases(
+    TestInMemoryEventStorageAdapterCommonCases
+):
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: EventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        return InMemoryEventStorageAdapter(
+            serialisation_guarantee=serialisation_guarantee,
+            storage_mode=InMemoryStorageMode.COLUMNAR,
+        )
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
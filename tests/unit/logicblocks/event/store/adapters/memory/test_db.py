@@ -0,0 +1,245 @@
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from logicblocks.event.store.adapters.memory.converters import (
+    TypeRegistryConstraintConverter,
+)
+from logicblocks.event.store.adapters.memory.db import InMemoryEventsDB
+from logicblocks.event.store.adapters.memory.types import (
+    QueryConstraintCheck,
+)
+from logicblocks.event.store.constraints import (
+    QueryConstraint,
+    SequenceNumberAfterConstraint,
+)
+from logicblocks.event.testing import StoredEventBuilder
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    Converter,
+    JsonValue,
+    LogIdentifier,
+    StoredEvent,
+    StreamIdentifier,
+)
+
+stream = StreamIdentifier(category="category", stream="stream")
+other_stream = StreamIdentifier(category="category", stream="other")
+
+
+@dataclass(frozen=True)
+class PositionIsEvenConstraint(QueryConstraint):
+    pass
+
+
+class CountingPositionIsEvenCheck:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, event: StoredEvent[str, JsonValue]) -> bool:
+        self.calls += 1
+        return event.position % 2 == 0
+
+
+class CountingPositionIsEvenConverter(
+    Converter[PositionIsEvenConstraint, QueryConstraintCheck]
+):
+    def __init__(self):
+        self.check = CountingPositionIsEvenCheck()
+
+    def convert(self, item: PositionIsEvenConstraint) -> QueryConstraintCheck:
+        return self.check
+
+
+def make_db(
+    converter: TypeRegistryConstraintConverter | None = None,
+) -> InMemoryEventsDB:
+    return InMemoryEventsDB(
+        constraint_converter=(
+            converter
+            if converter is not None
+            else TypeRegistryConstraintConverter().with_default_constraint_converters()
+        )
+    )
+
+
+def commit(db: InMemoryEventsDB, target: StreamIdentifier, count: int = 1):
+    transaction = db.transaction()
+    start = db.last_stream_position(target) + 1
+    for position in range(start, start + count):
+        transaction.add(
+            StoredEventBuilder(
+                category=target.category,
+                stream=target.stream,
+                position=position,
+                sequence_number=-1,
+            ).build()
+        )
+    return transaction.commit()
+
+
+class TestInMemoryEventsDB:
+    def test_allocates_sequence_numbers_in_commit_order(self):
+        db = make_db()
+
+        first = commit(db, stream, 2)
+        second = commit(db, other_stream)
+
+        assert [event.sequence_number for event in [*first, *second]] == [
+            0,
+            1,
+            2,
+        ]
+
+    @pytest.mark.parametrize(
+        "target",
+        [
+            LogIdentifier(),
+            CategoryIdentifier(category="category"),
+            stream,
+        ],
+    )
+    async def test_snapshot_excludes_later_commits(self, target):
+        db = make_db()
+        committed = commit(db, stream, 2)
+
+        snapshot = db.snapshot()
+        commit(db, stream, 3)
+        commit(db, other_stream)
+
+        scanned = [event async for event in snapshot.scan_events(target)]
+
+        assert scanned == list(committed)
+        assert snapshot.last_event(target) == committed[-1]
+
+    async def test_snapshot_of_empty_stream_stays_empty(self):
+        db = make_db()
+
+        snapshot = db.snapshot()
+        commit(db, stream)
+
+        scanned = [event async for event in snapshot.scan_events(stream)]
+
+        assert scanned == []
+        assert snapshot.last_event(stream) is None
+        assert snapshot.last_event(LogIdentifier()) is None
+
+    def test_tracks_last_stream_position_across_commits(self):
+        db = make_db()
+
+        commit(db, stream, 3)
+        commit(db, other_stream)
+
+        assert db.last_stream_position(stream) == 2
+        assert db.last_stream_position(other_stream) == 0
+        assert (
+            db.last_stream_position(
+                StreamIdentifier(category="category", stream="missing")
+            )
+            == -1
+        )
+
+    def test_tracks_last_stream_event_across_commits(self):
+        db = make_db()
+
+        first = commit(db, stream, 2)
+        commit(db, other_stream)
+
+        assert db.last_stream_event(stream) == first[-1]
+
+    def test_does_not_expose_uncommitted_stream_head(self):
+        db = make_db()
+        committed = commit(db, stream)
+
+        transaction = db.transaction()
+        transaction.add(
+            StoredEventBuilder(
+                category=stream.category, stream=stream.stream, position=1
+            ).build()
+        )
+
+        assert transaction.last_stream_event(stream) == committed[-1]
+        assert transaction.last_stream_position(stream) == 0
+
+
+class TestInMemoryEventsDBScanPlanning:
+    @pytest.mark.parametrize(
+        "target",
+        [
+            LogIdentifier(),
+            CategoryIdentifier(category="category"),
+            stream,
+        ],
+    )
+    async def test_seeks_to_events_after_sequence_number(self, target):
+        db = make_db()
+        committed = commit(db, stream, 5)
+        commit(db, other_stream, 2)
+        later = commit(db, stream, 2)
+        sequence_number = committed[2].sequence_number
+
+        scanned = [
+            event
+            async for event in db.snapshot().scan_events(
+                target,
+                {
+                    SequenceNumberAfterConstraint(
+                        sequence_number=sequence_number
+                    )
+                },
+            )
+        ]
+
+        assert [
+            event for event in scanned if event.stream == stream.stream
+        ] == [*committed[3:], *later]
+        assert all(
+            event.sequence_number > sequence_number for event in scanned
+        )
+
+    async def test_uses_greatest_of_several_sequence_number_constraints(self):
+        db = make_db()
+        committed = commit(db, stream, 5)
+
+        scanned = [
+            event
+            async for event in db.snapshot().scan_events(
+                stream,
+                {
+                    SequenceNumberAfterConstraint(sequence_number=0),
+                    SequenceNumberAfterConstraint(sequence_number=3),
+                },
+            )
+        ]
+
+        assert scanned == [committed[4]]
+
+    async def test_only_checks_remaining_constraints_after_seek_point(self):
+        converter = CountingPositionIsEvenConverter()
+        db = make_db(
+            TypeRegistryConstraintConverter()
+            .with_default_constraint_converters()
+            .register(PositionIsEvenConstraint, converter)
+        )
+        committed = commit(db, stream, 10)
+
+        scanned = [
+            event
+            async for event in db.snapshot().scan_events(
+                stream,
+                {
+                    SequenceNumberAfterConstraint(
+                        sequence_number=committed[6].sequence_number
+                    ),
+                    PositionIsEvenConstraint(),
+                },
+            )
+        ]
+
+        assert scanned == [committed[8]]
+        assert converter.check.calls == 3
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,72 @@
+import sys
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from logicblocks.event.store.adapters.memory.records import (
+    ColumnarEventRecords,
+    ObjectEventRecords,
+)
+from logicblocks.event.testing import StoredEventBuilder
+from logicblocks.event.types import JsonValue
+
+
+class TestColumnarEventRecords:
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC),
+            datetime(2024, 5, 1, 12, 30, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2024, 5, 1, 12, 30, 15, 1),
+            datetime(1960, 1, 1, tzinfo=UTC),
+        ],
+    )
+    def test_round_trips_events(self, timestamp):
+        records = ColumnarEventRecords()
+        event = StoredEventBuilder[str, JsonValue](
+            sequence_number=7,
+            payload={"value": [1, 2, 3]},
+            observed_at=timestamp,
+            occurred_at=timestamp,
+        ).build()
+
+        position = records.append(event)
+        restored = records[position]
+
+        assert restored == event
+        assert restored.observed_at.tzinfo == timestamp.tzinfo
+
+    def test_interns_repeated_strings(self):
+        records = ColumnarEventRecords()
+        builder = StoredEventBuilder(
+            name="name", category="category", stream="stream"
+        )
+
+        for sequence_number in range(10):
+            records.append(
+                builder.with_sequence_number(sequence_number).build()
+            )
+
+        assert len(records) == 10
+        assert records[0].name is records[9].name
+        assert records[0].category is records[9].category
+        assert records[0].stream is records[9].stream
+
+    @pytest.mark.parametrize(
+        "records", [ObjectEventRecords(), ColumnarEventRecords()]
+    )
+    def test_finds_position_after_sequence_number(self, records):
+        for sequence_number in [2, 4, 6, 8]:
+            records.append(
+                StoredEventBuilder(sequence_number=sequence_number).build()
+            )
+
+        assert records.position_after(1, len(records)) == 0
+        assert records.position_after(4, len(records)) == 2
+        assert records.position_after(5, len(records)) == 2
+        assert records.position_after(8, len(records)) == 4
+        assert records.position_after(8, 2) == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -2,7 +2,7 @@ import sys
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Sequence, cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from psycopg import AsyncConnection, sql
@@ -16,9 +16,12 @@ from logicblocks.event.store import (
     PostgresEventStorageAdapter,
 )
 from logicblocks.event.store.adapters.postgres.adapter import (
+    QuerySettings,
+    ScanOrdering,
     StreamInsertDefinition,
     insert_batch,
     insert_batch_query,
+    result_size_bytes,
 )
 from logicblocks.event.testing import NewEventBuilder, StoredEventBuilder
 from logicblocks.event.types import (
@@ -54,6 +57,21 @@ class TestPostgresStorageAdapter:
 
         assert adapter.connection_pool is connection_pool
 
+    def test_scans_in_sequence_order_by_default(self):
+        adapter = PostgresEventStorageAdapter(
+            connection_source=connection_settings
+        )
+
+        assert adapter.scans_in_sequence_order
+
+    def test_does_not_scan_in_sequence_order_under_commit_ordering(self):
+        adapter = PostgresEventStorageAdapter(
+            connection_source=connection_settings,
+            query_settings=QuerySettings(scan_ordering=ScanOrdering.COMMIT),
+        )
+
+        assert not adapter.scans_in_sequence_order
+
     async def test_opens_connection_pool_when_connection_pool_not_provided(
         self, monkeypatch
     ):
@@ -134,6 +152,36 @@ class TestPostgresStorageAdapter:
         assert not closed
 
 
+class FakeResult:
+    def __init__(self, rows: Sequence[Sequence[bytes | None]]):
+        self.rows = rows
+        self.ntuples = len(rows)
+        self.nfields = len(rows[0]) if rows else 0
+        self.reads = 0
+
+    def get_value(self, row: int, column: int) -> bytes | None:
+        self.reads += 1
+        return self.rows[row][column]
+
+
+class TestResultSizeBytes:
+    def test_returns_zero_without_result(self):
+        assert result_size_bytes(Mock(pgresult=None)) == 0
+
+    def test_measures_every_row_of_small_results(self):
+        result = FakeResult([[b"abc", None], [b"de", b"f"]])
+
+        assert result_size_bytes(Mock(pgresult=result)) == 6
+
+    def test_extrapolates_size_of_large_results_from_sample(self):
+        result = FakeResult([[b"x" * 10, b"y" * 5] for _ in range(1000)])
+
+        assert result_size_bytes(Mock(pgresult=result), sample_rows=16) == (
+            15000
+        )
+        assert result.reads == 32
+
+
 def normalize_whitespace(text: str) -> str:
     return " ".join(text.split())
 
@@ -281,7 +329,8 @@ class TestBatchInsert:
          payload, observed_at, occurred_at)
         VALUES
           (%s, %s, %s, %s, %s, %s, %s, %s), (%s, %s, %s, %s, %s, %s, %s, %s)
-          RETURNING *;
+          RETURNING "id", "name", "stream", "category", "position",
+            "sequence_number", "payload", "observed_at", "occurred_at";
         """
         assert normalize_whitespace(query_str) == normalize_whitespace(
             expected_query_str
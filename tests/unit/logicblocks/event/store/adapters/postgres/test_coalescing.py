@@ -0,0 +1,127 @@
+import asyncio
+import sys
+from collections.abc import Sequence
+from datetime import timedelta
+
+import pytest
+
+from logicblocks.event.store.adapters.postgres.coalescing import (
+    PendingWrite,
+    WriteCoalescer,
+)
+
+
+class CapturingFlush:
+    def __init__(self, error: BaseException | None = None):
+        self.batches: list[list[int]] = []
+        self._error = error
+
+    async def __call__(self, writes: Sequence[PendingWrite[int, int]]):
+        self.batches.append([write.request for write in writes])
+        if self._error is not None:
+            raise self._error
+        for write in writes:
+            write.future.set_result(write.request * 10)
+
+
+class TestWriteCoalescer:
+    async def test_flushes_concurrent_writes_together(self):
+        flush = CapturingFlush()
+        coalescer = WriteCoalescer[int, int](
+            flush=flush,
+            max_batch_size=10,
+            max_wait=timedelta(milliseconds=10),
+        )
+
+        results = await asyncio.gather(
+            *[coalescer.submit(request) for request in range(3)]
+        )
+
+        assert results == [0, 10, 20]
+        assert flush.batches == [[0, 1, 2]]
+
+    async def test_flushes_immediately_when_batch_is_full(self):
+        flush = CapturingFlush()
+        coalescer = WriteCoalescer[int, int](
+            flush=flush,
+            max_batch_size=2,
+            max_wait=timedelta(seconds=10),
+        )
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *[coalescer.submit(request) for request in range(4)]
+            ),
+            timeout=1,
+        )
+
+        assert results == [0, 10, 20, 30]
+        assert flush.batches == [[0, 1], [2, 3]]
+
+    async def test_raises_flush_error_in_every_writer(self):
+        coalescer = WriteCoalescer[int, int](
+            flush=CapturingFlush(error=RuntimeError("failed")),
+            max_batch_size=10,
+            max_wait=timedelta(milliseconds=1),
+        )
+
+        results = await asyncio.gather(
+            coalescer.submit(1), coalescer.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_raises_when_flush_leaves_write_incomplete(self):
+        async def flush(writes: Sequence[PendingWrite[int, int]]):
+            return None
+
+        coalescer = WriteCoalescer[int, int](
+            flush=flush,
+            max_batch_size=10,
+            max_wait=timedelta(milliseconds=1),
+        )
+
+        with pytest.raises(RuntimeError):
+            await coalescer.submit(1)
+
+    async def test_excludes_cancelled_writes_from_flush(self):
+        flush = CapturingFlush()
+        coalescer = WriteCoalescer[int, int](
+            flush=flush,
+            max_batch_size=10,
+            max_wait=timedelta(milliseconds=10),
+        )
+
+        cancelled = asyncio.create_task(coalescer.submit(1))
+        kept = asyncio.create_task(coalescer.submit(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == 20
+        assert flush.batches == [[2]]
+
+    async def test_flushes_pending_writes_on_close(self):
+        flush = CapturingFlush()
+        coalescer = WriteCoalescer[int, int](
+            flush=flush,
+            max_batch_size=10,
+            max_wait=timedelta(seconds=10),
+        )
+
+        write = asyncio.create_task(coalescer.submit(1))
+        await asyncio.sleep(0)
+        await coalescer.close()
+
+        assert await write == 10
+
+    def test_raises_when_max_batch_size_less_than_one(self):
+        with pytest.raises(ValueError):
+            WriteCoalescer[int, int](
+                flush=CapturingFlush(),
+                max_batch_size=0,
+                max_wait=timedelta(milliseconds=1),
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,80 @@
+import sys
+
+import pytest
+
+from logicblocks.event.store.adapters.postgres.heads import StreamHeadCache
+from logicblocks.event.testing import StoredEventBuilder
+from logicblocks.event.types import StreamIdentifier
+
+first = StreamIdentifier(category="category", stream="first")
+second = StreamIdentifier(category="category", stream="second")
+third = StreamIdentifier(category="category", stream="third")
+
+
+def stored_events(target: StreamIdentifier, *positions: int):
+    return [
+        StoredEventBuilder(
+            category=target.category, stream=target.stream, position=position
+        ).build()
+        for position in positions
+    ]
+
+
+class TestStreamHeadCache:
+    def test_records_last_event_of_each_stream(self):
+        cache = StreamHeadCache(max_size=10)
+        first_events = stored_events(first, 0, 1)
+        second_events = stored_events(second, 0)
+
+        cache.record({first: first_events, second: second_events})
+
+        assert cache.get(first) == first_events[-1]
+        assert cache.get(second) == second_events[-1]
+        assert cache.metrics.hits == 2
+
+    def test_counts_miss_for_unknown_stream(self):
+        cache = StreamHeadCache(max_size=10)
+
+        assert cache.get(first) is None
+        assert cache.metrics.misses == 1
+
+    def test_ignores_empty_results(self):
+        cache = StreamHeadCache(max_size=10)
+
+        cache.record({first: []})
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_stream_when_full(self):
+        cache = StreamHeadCache(max_size=2)
+
+        cache.record({first: stored_events(first, 0)})
+        cache.record({second: stored_events(second, 0)})
+        cache.get(first)
+        cache.record({third: stored_events(third, 0)})
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
+
+    def test_invalidates_streams(self):
+        cache = StreamHeadCache(max_size=10)
+        cache.record({first: stored_events(first, 0)})
+
+        cache.invalidate([first, second])
+
+        assert cache.get(first) is None
+        assert cache.metrics.invalidations == 1
+
+    def test_is_disabled_when_size_is_zero(self):
+        cache = StreamHeadCache()
+
+        cache.record({first: stored_events(first, 0)})
+
+        assert not cache.enabled
+        assert cache.get(first) is None
+        assert cache.metrics.misses == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
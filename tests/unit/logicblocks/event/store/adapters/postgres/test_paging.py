@@ -0,0 +1,205 @@
+import sys
+
+import pytest
+
+from logicblocks.event.store.adapters.postgres import (
+    AdaptivePageSizingStrategy,
+    FixedPageSizingStrategy,
+    ScanPageObservation,
+)
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    LogIdentifier,
+    StreamIdentifier,
+)
+
+log = LogIdentifier()
+category = CategoryIdentifier(category="category")
+stream = StreamIdentifier(category="category", stream="stream")
+
+
+class TestFixedPageSizingStrategy:
+    @pytest.mark.parametrize("target", [log, category, stream])
+    def test_returns_configured_page_size_for_every_target(self, target):
+        strategy = FixedPageSizingStrategy(250)
+
+        assert strategy.page_size(target) == 250
+        assert not strategy.observes_pages
+
+
+class TestAdaptivePageSizingStrategy:
+    def test_returns_initial_page_size_before_any_observation(self):
+        strategy = AdaptivePageSizingStrategy(initial_page_size=50)
+
+        assert strategy.page_size(log) == 50
+        assert strategy.page_sizes == {}
+
+    def test_grows_page_size_when_under_budget(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_bytes_per_page=1_000_000,
+            target_seconds_per_page=1.0,
+        )
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100,
+                rows=100,
+                size_bytes=10_000,
+                duration_seconds=0.01,
+            ),
+        )
+
+        assert strategy.page_size(log) == 200
+
+    def test_shrinks_page_size_toward_byte_budget(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_bytes_per_page=75_000,
+            target_seconds_per_page=1.0,
+        )
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100,
+                rows=100,
+                size_bytes=100_000,
+                duration_seconds=0.01,
+            ),
+        )
+
+        assert strategy.page_size(log) == 75
+
+    def test_shrinks_page_size_toward_latency_budget(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_bytes_per_page=1_000_000,
+            target_seconds_per_page=0.06,
+        )
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100, rows=100, size_bytes=1_000, duration_seconds=0.1
+            ),
+        )
+
+        assert strategy.page_size(log) == 60
+
+    def test_keeps_page_size_within_bounds(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            minimum_page_size=80,
+            maximum_page_size=150,
+        )
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100, rows=100, size_bytes=1, duration_seconds=0
+            ),
+        )
+        grown = strategy.page_size(log)
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100,
+                rows=100,
+                size_bytes=10**12,
+                duration_seconds=100,
+            ),
+        )
+        shrunk = strategy.page_size(log)
+
+        assert grown == 150
+        assert shrunk == 80
+
+    def test_tracks_page_sizes_per_target(self):
+        other_category = CategoryIdentifier(category="other")
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_bytes_per_page=1_000_000,
+            target_seconds_per_page=1.0,
+        )
+
+        strategy.observe(
+            category,
+            ScanPageObservation(
+                page_size=100,
+                rows=100,
+                size_bytes=10_000,
+                duration_seconds=0.01,
+            ),
+        )
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100,
+                rows=100,
+                size_bytes=2_000_000,
+                duration_seconds=0.01,
+            ),
+        )
+
+        assert strategy.page_sizes == {category: 200, log: 50}
+        assert strategy.page_size(other_category) == 100
+        assert strategy.page_size(stream) == 100
+
+    def test_ignores_short_pages(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_seconds_per_page=0.1,
+        )
+
+        strategy.observe(
+            category,
+            ScanPageObservation(
+                page_size=100, rows=1, size_bytes=500, duration_seconds=0.004
+            ),
+        )
+
+        assert strategy.page_size(category) == 100
+        assert strategy.page_sizes == {}
+
+    def test_forgets_least_recently_observed_targets(self):
+        strategy = AdaptivePageSizingStrategy(
+            initial_page_size=100,
+            target_bytes_per_page=1_000_000,
+            target_seconds_per_page=1.0,
+            maximum_tracked_targets=2,
+        )
+        observation = ScanPageObservation(
+            page_size=100, rows=100, size_bytes=10_000, duration_seconds=0.01
+        )
+
+        strategy.observe(log, observation)
+        strategy.observe(category, observation)
+        strategy.observe(stream, observation)
+
+        assert strategy.page_sizes == {category: 200, stream: 200}
+        assert strategy.page_size(log) == 100
+
+    def test_ignores_empty_pages(self):
+        strategy = AdaptivePageSizingStrategy(initial_page_size=100)
+
+        strategy.observe(
+            log,
+            ScanPageObservation(
+                page_size=100, rows=0, size_bytes=0, duration_seconds=0.5
+            ),
+        )
+
+        assert strategy.page_sizes == {}
+
+    def test_raises_when_initial_page_size_out_of_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptivePageSizingStrategy(
+                initial_page_size=5, minimum_page_size=10
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
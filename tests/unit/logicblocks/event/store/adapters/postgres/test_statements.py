@@ -0,0 +1,205 @@
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+from psycopg import sql
+
+from logicblocks.event.persistence.postgres import TableSettings
+from logicblocks.event.store.adapters.postgres.adapter import (
+    LatestQueryParameters,
+    ScanOrdering,
+    ScanQueryParameters,
+    read_last_query,
+    read_last_query_params,
+    scan_query,
+    scan_query_shape,
+)
+from logicblocks.event.store.adapters.postgres.converters import (
+    TypeRegistryConstraintConverter,
+)
+from logicblocks.event.store.adapters.postgres.statements import (
+    StatementCache,
+    execute_statement,
+)
+from logicblocks.event.store.constraints import SequenceNumberAfterConstraint
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    LogIdentifier,
+    StreamIdentifier,
+)
+
+table_settings = TableSettings(table_name="events")
+constraint_converter = (
+    TypeRegistryConstraintConverter().with_default_constraint_converters()
+)
+
+
+class TestStatementCache:
+    def test_renders_statement_on_miss(self):
+        cache = StatementCache()
+
+        statement = cache.statement(
+            "key", lambda: sql.SQL("SELECT {0}").format(sql.Identifier("a"))
+        )
+
+        assert statement == b'SELECT "a"'
+        assert cache.metrics.hits == 0
+        assert cache.metrics.misses == 1
+
+    def test_reuses_statement_on_hit(self):
+        cache = StatementCache()
+        factory_calls = 0
+
+        def factory():
+            nonlocal factory_calls
+            factory_calls += 1
+            return sql.SQL("SELECT 1")
+
+        first = cache.statement("key", factory)
+        second = cache.statement("key", factory)
+
+        assert first is second
+        assert factory_calls == 1
+        assert cache.metrics.hits == 1
+        assert cache.metrics.misses == 1
+
+    def test_evicts_least_recently_used_statement_when_full(self):
+        cache = StatementCache(max_size=2)
+
+        cache.statement("a", lambda: "SELECT 'a'")
+        cache.statement("b", lambda: "SELECT 'b'")
+        cache.statement("a", lambda: "SELECT 'a'")
+        cache.statement("c", lambda: "SELECT 'c'")
+        cache.statement("a", lambda: "SELECT 'a'")
+        cache.statement("b", lambda: "SELECT 'b'")
+
+        assert len(cache) == 2
+        assert cache.metrics.hits == 2
+        assert cache.metrics.misses == 4
+
+    def test_does_not_store_statements_when_size_is_zero(self):
+        cache = StatementCache(max_size=0)
+
+        cache.statement("a", lambda: "SELECT 1")
+        cache.statement("a", lambda: "SELECT 1")
+
+        assert len(cache) == 0
+        assert cache.metrics.misses == 2
+
+    async def test_executes_cached_statement_with_prepare_setting(self):
+        cursor = AsyncMock()
+        cache = StatementCache(prepare=True)
+
+        await execute_statement(
+            cursor,
+            statement_cache=cache,
+            key="key",
+            query=lambda: sql.SQL("SELECT %s"),
+            params=[1],
+        )
+
+        cursor.execute.assert_awaited_once_with(
+            b"SELECT %s", [1], prepare=True
+        )
+
+
+class TestStatementShapes:
+    @pytest.mark.parametrize(
+        "target",
+        [
+            LogIdentifier(),
+            CategoryIdentifier(category="category"),
+            StreamIdentifier(category="category", stream="stream"),
+        ],
+    )
+    def test_read_last_params_match_built_query(self, target):
+        parameters = LatestQueryParameters(target=target)
+
+        _, params = read_last_query(parameters, table_settings)
+
+        assert read_last_query_params(parameters) == params
+
+    @pytest.mark.parametrize(
+        "target",
+        [
+            LogIdentifier(),
+            CategoryIdentifier(category="category"),
+            StreamIdentifier(category="category", stream="stream"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "constraints",
+        [
+            frozenset(),
+            frozenset({SequenceNumberAfterConstraint(sequence_number=0)}),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "ordering", [ScanOrdering.SEQUENCE_NUMBER, ScanOrdering.COMMIT]
+    )
+    def test_scan_shape_params_match_built_query(
+        self, target, constraints, ordering
+    ):
+        parameters = ScanQueryParameters(
+            target=target,
+            constraints=constraints,
+            page_size=10,
+            ordering=ordering,
+        )
+
+        _, params = scan_query(
+            parameters, constraint_converter, table_settings
+        )
+        shape = scan_query_shape(
+            parameters, constraint_converter, table_settings
+        )
+
+        assert shape is not None
+        assert shape[1] == params
+
+    def test_scan_shape_is_independent_of_parameter_values(self):
+        first = scan_query_shape(
+            ScanQueryParameters(
+                target=StreamIdentifier(category="c1", stream="s1"),
+                constraints=frozenset(
+                    {SequenceNumberAfterConstraint(sequence_number=1)}
+                ),
+                page_size=10,
+            ),
+            constraint_converter,
+            table_settings,
+        )
+        second = scan_query_shape(
+            ScanQueryParameters(
+                target=StreamIdentifier(category="c2", stream="s2"),
+                constraints=frozenset(
+                    {SequenceNumberAfterConstraint(sequence_number=2)}
+                ),
+                page_size=20,
+            ),
+            constraint_converter,
+            table_settings,
+        )
+
+        assert first is not None
+        assert second is not None
+        assert first[0] == second[0]
+
+    def test_scan_shape_differs_by_ordering(self):
+        shapes = [
+            scan_query_shape(
+                ScanQueryParameters(
+                    target=LogIdentifier(), page_size=10, ordering=ordering
+                ),
+                constraint_converter,
+                table_settings,
+            )
+            for ordering in ScanOrdering
+        ]
+
+        assert all(shape is not None for shape in shapes)
+        assert len({shape[0] for shape in shapes if shape is not None}) == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,135 @@
+import sys
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from logicblocks.event.persistence.sqlite import ConnectionSettings
+from logicblocks.event.store.adapters import (
+    EventSerialisationGuarantee,
+    EventStorageAdapter,
+    SqliteEventStorageAdapter,
+)
+from logicblocks.event.store.constraints import sequence_number_after
+from logicblocks.event.testcases.store.adapters import (
+    ConcurrencyParameters,
+    EventStorageAdapterCases,
+)
+from logicblocks.event.testing import NewEventBuilder
+from logicblocks.event.types import (
+    LogIdentifier,
+    StoredEvent,
+    StreamIdentifier,
+    identifier,
+)
+
+stream = StreamIdentifier(category="category", stream="stream")
+
+
+def connection_settings(directory: Path) -> ConnectionSettings:
+    return ConnectionSettings(database=str(directory / f"{uuid4().hex}.db"))
+
+
+class TestSqliteEventStorageAdapterCommonCases(EventStorageAdapterCases):
+    @pytest_asyncio.fixture(autouse=True)
+    async def directory(self, tmp_path: Path) -> AsyncIterator[Path]:
+        self._directory = tmp_path
+        self._adapters: list[SqliteEventStorageAdapter] = []
+        yield tmp_path
+        for adapter in self._adapters:
+            await adapter.close()
+
+    @property
+    def concurrency_parameters(self):
+        return ConcurrencyParameters(concurrent_writes=3, repeats=5)
+
+    def construct_storage_adapter(
+        self,
+        *,
+        serialisation_guarantee: EventSerialisationGuarantee = EventSerialisationGuarantee.LOG,
+    ) -> EventStorageAdapter:
+        adapter = SqliteEventStorageAdapter(
+            connection_source=connection_settings(self._directory)
+        )
+        self._adapters.append(adapter)
+        return adapter
+
+    async def clear_storage(self) -> None:
+        pass
+
+    async def retrieve_events(
+        self,
+        *,
+        adapter: EventStorageAdapter,
+        category: str | None = None,
+        stream: str | None = None,
+    ) -> Sequence[StoredEvent]:
+        return [
+            event
+            async for event in adapter.scan(
+                target=identifier.target(category=category, stream=stream)
+            )
+        ]
+
+
+class TestSqliteEventStorageAdapter:
+    async def test_reads_events_saved_by_previous_adapter(
+        self, tmp_path: Path
+    ):
+        settings = connection_settings(tmp_path)
+        adapter = SqliteEventStorageAdapter(connection_source=settings)
+        saved = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(3)],
+        )
+        await adapter.close()
+
+        reopened = SqliteEventStorageAdapter(connection_source=settings)
+
+        assert [
+            event async for event in reopened.scan(target=LogIdentifier())
+        ] == saved
+        assert await reopened.latest(target=stream) == saved[-1]
+
+        await reopened.close()
+
+    async def test_scans_across_pages(self, tmp_path: Path):
+        adapter = SqliteEventStorageAdapter(
+            connection_source=connection_settings(tmp_path), scan_page_size=2
+        )
+        saved = await adapter.save(
+            target=stream,
+            events=[NewEventBuilder().build() for _ in range(5)],
+        )
+
+        assert [event async for event in adapter.scan(target=stream)] == saved
+        assert [
+            event
+            async for event in adapter.scan(
+                target=stream,
+                constraints={sequence_number_after(saved[1].sequence_number)},
+            )
+        ] == saved[2:]
+
+        await adapter.close()
+
+    async def test_uses_write_ahead_logging(self, tmp_path: Path):
+        adapter = SqliteEventStorageAdapter(
+            connection_source=connection_settings(tmp_path)
+        )
+
+        journal_mode = await adapter.connection.run(
+            lambda connection: connection.execute(
+                "PRAGMA journal_mode"
+            ).fetchone()[0]
+        )
+
+        assert journal_mode == "wal"
+
+        await adapter.close()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,66 @@
+import sys
+
+import pytest
+
+from logicblocks.event.store.adapters import (
+    StripedEventSerialisationGuarantee,
+)
+from logicblocks.event.testing import data
+from logicblocks.event.types import StreamIdentifier
+
+
+def random_stream() -> StreamIdentifier:
+    return StreamIdentifier(
+        category=data.random_event_category_name(),
+        stream=data.random_event_stream_name(),
+    )
+
+
+class TestStripedEventSerialisationGuarantee:
+    def test_maps_same_stream_to_same_lock_name(self):
+        guarantee = StripedEventSerialisationGuarantee(stripes=8)
+        stream = random_stream()
+
+        assert guarantee.lock_name("events", stream) == guarantee.lock_name(
+            "events",
+            StreamIdentifier(category=stream.category, stream=stream.stream),
+        )
+
+    def test_maps_same_stream_to_same_stripe_across_instances(self):
+        stream = random_stream()
+
+        assert StripedEventSerialisationGuarantee(stripes=8).stripe(
+            stream
+        ) == StripedEventSerialisationGuarantee(stripes=8).stripe(stream)
+
+    def test_bounds_lock_names_to_number_of_stripes(self):
+        guarantee = StripedEventSerialisationGuarantee(stripes=4)
+
+        lock_names = {
+            guarantee.lock_name("events", random_stream()) for _ in range(200)
+        }
+
+        assert lock_names == {f"events.stripe.{stripe}" for stripe in range(4)}
+
+    def test_namespaces_lock_names(self):
+        guarantee = StripedEventSerialisationGuarantee(stripes=4)
+        stream = random_stream()
+
+        assert guarantee.lock_name("first", stream).startswith("first.")
+        assert guarantee.lock_name("second", stream).startswith("second.")
+
+    def test_equal_when_stripes_equal(self):
+        assert StripedEventSerialisationGuarantee(
+            stripes=4
+        ) == StripedEventSerialisationGuarantee(stripes=4)
+        assert StripedEventSerialisationGuarantee(
+            stripes=4
+        ) != StripedEventSerialisationGuarantee(stripes=8)
+
+    def test_raises_when_stripes_less_than_one(self):
+        with pytest.raises(ValueError):
+            StripedEventSerialisationGuarantee(stripes=0)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,140 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from logicblocks.event.store import (
+    EventHeadTracker,
+    EventNotification,
+    EventStore,
+    InMemoryEventStorageAdapter,
+)
+from logicblocks.event.store.adapters.base import Latestable
+from logicblocks.event.testing import NewEventBuilder, data
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    JsonValue,
+    LogIdentifier,
+    StoredEvent,
+    StreamIdentifier,
+)
+from logicblocks.event.utils.clock import StaticClock
+
+
+class CountingInMemoryEventStorageAdapter(InMemoryEventStorageAdapter):
+    def __init__(self):
+        super().__init__()
+        self.latest_calls: list[Latestable] = []
+
+    async def latest(
+        self, *, target: Latestable
+    ) -> StoredEvent[str, JsonValue] | None:
+        self.latest_calls.append(target)
+        return await super().latest(target=target)
+
+
+class CommitOrderedInMemoryEventStorageAdapter(InMemoryEventStorageAdapter):
+    @property
+    def scans_in_sequence_order(self) -> bool:
+        return False
+
+
+class TestEventHeadTracker:
+    async def test_reports_no_events_for_empty_category(self):
+        adapter = InMemoryEventStorageAdapter()
+        tracker = EventHeadTracker(adapter=adapter)
+
+        identifier = CategoryIdentifier(
+            category=data.random_event_category_name()
+        )
+
+        assert not await tracker.has_events_after(identifier, None)
+
+    async def test_reports_events_after_sequence_number_in_category(self):
+        adapter = InMemoryEventStorageAdapter()
+        store = EventStore(adapter=adapter)
+        tracker = EventHeadTracker(adapter=adapter)
+
+        category_name = data.random_event_category_name()
+        stored_events = await store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build()])
+        sequence_number = stored_events[0].sequence_number
+
+        identifier = CategoryIdentifier(category=category_name)
+
+        assert await tracker.has_events_after(identifier, None)
+        assert await tracker.has_events_after(identifier, sequence_number - 1)
+        assert not await tracker.has_events_after(identifier, sequence_number)
+
+    async def test_answers_stream_sources_at_category_granularity(self):
+        adapter = InMemoryEventStorageAdapter()
+        store = EventStore(adapter=adapter)
+        tracker = EventHeadTracker(adapter=adapter)
+
+        category_name = data.random_event_category_name()
+        await store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build()])
+
+        identifier = StreamIdentifier(
+            category=category_name, stream=data.random_event_stream_name()
+        )
+
+        assert await tracker.has_events_after(identifier, None)
+
+    async def test_refreshes_at_most_once_per_interval(self):
+        clock = StaticClock(datetime(2025, 1, 1, tzinfo=UTC))
+        adapter = CountingInMemoryEventStorageAdapter()
+        store = EventStore(adapter=adapter)
+        tracker = EventHeadTracker(
+            adapter=adapter,
+            refresh_interval=timedelta(seconds=1),
+            clock=clock,
+        )
+
+        category_name = data.random_event_category_name()
+        identifier = CategoryIdentifier(category=category_name)
+
+        assert not await tracker.has_events_after(identifier, None)
+
+        await store.stream(
+            category=category_name, stream=data.random_event_stream_name()
+        ).publish(events=[NewEventBuilder().build()])
+
+        assert not await tracker.has_events_after(identifier, None)
+        assert len(adapter.latest_calls) == 1
+
+        clock.set(datetime(2025, 1, 1, 0, 0, 1, tzinfo=UTC))
+
+        assert await tracker.has_events_after(identifier, None)
+        assert len(adapter.latest_calls) == 2
+
+    async def test_advances_heads_from_notifications_between_refreshes(self):
+        clock = StaticClock(datetime(2025, 1, 1, tzinfo=UTC))
+        adapter = InMemoryEventStorageAdapter()
+        tracker = EventHeadTracker(adapter=adapter, clock=clock)
+
+        category_name = data.random_event_category_name()
+        identifier = CategoryIdentifier(category=category_name)
+
+        assert not await tracker.has_events_after(identifier, None)
+
+        tracker.observe(
+            [
+                EventNotification(
+                    category=category_name,
+                    stream=data.random_event_stream_name(),
+                    sequence_number=7,
+                )
+            ]
+        )
+
+        assert await tracker.has_events_after(identifier, 6)
+        assert not await tracker.has_events_after(identifier, 7)
+        assert await tracker.has_events_after(LogIdentifier(), 6)
+
+    def test_refuses_adapters_not_scanning_in_sequence_order(self):
+        with pytest.raises(ValueError):
+            EventHeadTracker(
+                adapter=CommitOrderedInMemoryEventStorageAdapter()
+            )
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from logicblocks.event.store import (
+    EventNotification,
+    EventStore,
+    InMemoryEventNotificationHub,
+    InMemoryEventStorageAdapter,
+)
+from logicblocks.event.store.notifications import event_notifications
+from logicblocks.event.testing import NewEventBuilder, StoredEventBuilder
+from logicblocks.event.types import (
+    CategoryIdentifier,
+    LogIdentifier,
+    StreamIdentifier,
+)
+
+
+class TestEventNotification:
+    def test_round_trips_through_serialisation(self):
+        notification = EventNotification(
+            category="category", stream="stream", sequence_number=42
+        )
+
+        assert (
+            EventNotification.deserialise(notification.serialise())
+            == notification
+        )
+
+    @pytest.mark.parametrize(
+        "identifier,affected",
+        [
+            (LogIdentifier(), True),
+            (CategoryIdentifier(category="category"), True),
+            (CategoryIdentifier(category="other"), False),
+            (StreamIdentifier(category="category", stream="stream"), True),
+            (StreamIdentifier(category="category", stream="other"), False),
+            (StreamIdentifier(category="other", stream="stream"), False),
+        ],
+    )
+    def test_determines_affected_sources(self, identifier, affected):
+        notification = EventNotification(
+            category="category", stream="stream", sequence_number=1
+        )
+
+        assert notification.affects(identifier) is affected
+
+    def test_builds_one_notification_per_stream_at_highest_sequence(self):
+        events = [
+            StoredEventBuilder(
+                category="c1", stream="s1", sequence_number=1
+            ).build(),
+            StoredEventBuilder(
+                category="c1", stream="s1", sequence_number=3
+            ).build(),
+            StoredEventBuilder(
+                category="c1", stream="s2", sequence_number=2
+            ).build(),
+        ]
+
+        assert event_notifications(events) == [
+            EventNotification(category="c1", stream="s1", sequence_number=3),
+            EventNotification(category="c1", stream="s2", sequence_number=2),
+        ]
+
+
+class TestInMemoryEventNotificationHub:
+    async def test_delivers_published_notifications_to_listeners(self):
+        hub = InMemoryEventNotificationHub()
+        notification = EventNotification(
+            category="category", stream="stream", sequence_number=1
+        )
+
+        async with hub.listen() as notifications:
+            hub.publish([notification])
+
+            received = await asyncio.wait_for(anext(notifications), 1)
+
+        assert received == notification
+
+    async def test_publishes_on_save_through_in_memory_adapter(self):
+        hub = InMemoryEventNotificationHub()
+        store = EventStore(
+            adapter=InMemoryEventStorageAdapter(notifications=hub)
+        )
+
+        async with hub.listen() as notifications:
+            stored_events = await store.stream(
+                category="category", stream="stream"
+            ).publish(
+                events=[NewEventBuilder().build(), NewEventBuilder().build()]
+            )
+
+            received = await asyncio.wait_for(anext(notifications), 1)
+
+        assert received == EventNotification(
+            category="category",
+            stream="stream",
+            sequence_number=stored_events[-1].sequence_number,
+        )